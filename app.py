@@ -1,207 +1,487 @@
-import eventlet
-eventlet.monkey_patch()
-
 import os
-import json
-import sys
 import io
+import asyncio
+import contextlib
 import traceback
 import logging
+import multiprocessing
 import importlib
-from typing import Dict, Type
-
-from flask import Flask, request, jsonify, redirect
-from flask_cors import CORS
-from flask_sock import Sock
+import importlib.util
+import hashlib
+import secrets
+import signal
+import types
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Optional, Type
+
+import orjson
+import uvicorn
+from cachetools import TTLCache
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
+from starlette.concurrency import run_in_threadpool
 
 # --- Connector Imports (from server.py) ---
-# This block safely imports connector classes. If the 'extractors' module
-# isn't found or fails to import, the server will still run.
-try:
-    from extractors.connectors.salesforce_connector import SalesforceConnector
-    from extractors.connectors.google_ads_connector import GoogleAdsConnector
-    from extractors.connectors.ga4_connector import GA4Connector
-    from extractors.connectors.meta_ads_connector import MetaAdsConnector
-    from extractors.connectors.google_sheets_connector import GoogleSheetsConnector
-    from extractors.connectors.hubspot_connector import HubspotConnector
+# Connector modules pull in heavy SDKs (google-ads, googleapiclient, ...), so
+# they are imported on first use instead of at startup. If the 'extractors'
+# package isn't found, the server will still run.
+if TYPE_CHECKING:
     from extractors.base.api_connector import BaseAPIConnector
-    CONNECTORS_AVAILABLE = True
-except Exception as e:
-    # Define a dummy base class if the import fails so the server doesn't crash
-    class BaseAPIConnector: pass
-    CONNECTORS_AVAILABLE = False
-    IMPORT_ERROR = e # Store the error to log it later
-
-# --- Single Flask App Initialization ---
-app = Flask(__name__)
+
+CONNECTORS_AVAILABLE = importlib.util.find_spec('extractors') is not None
+
+# --- Environment Configuration ---
+# Read once at import time; changing these requires a restart.
+FRONTEND_URL = os.environ.get('FRONTEND_URL')
+# These should be securely stored as environment variables on your server
+SF_CLIENT_ID = os.environ.get('SALESFORCE_CLIENT_ID')
+SF_CLIENT_SECRET = os.environ.get('SALESFORCE_CLIENT_SECRET')
+# The redirect_uri for the token exchange MUST match the one used to get the code.
+# This is the URL of the Salesforce OAuth callback endpoint below.
+SF_CALLBACK_URL = os.environ.get('SALESFORCE_CALLBACK_URL', '')
+
+# --- Single ASGI App Initialization ---
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the edge function execution pool for the lifetime of the server."""
+    _start_exec_pool()
+    try:
+        yield
+    finally:
+        _stop_exec_pool()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 # A more secure CORS configuration for production
 # It allows credentials and restricts the origin to the one specified in the environment variable.
-frontend_url = os.environ.get('FRONTEND_URL', '*') # Default to wildcard for development
-CORS(app, origins=[frontend_url], supports_credentials=True, methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
-
-sock = Sock(app) # Initialize WebSocket support
+cors_origin = FRONTEND_URL if FRONTEND_URL is not None else '*' # Default to wildcard for development
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[cors_origin],
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["*"],
+)
 
 # --- Logging Configuration (from server.py) ---
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # --- Connector Logic (from server.py) ---
-# Connector registry is populated only if the classes were successfully imported
-CONNECTOR_REGISTRY: Dict[str, Type[BaseAPIConnector]] = {
-    'salesforce': SalesforceConnector,
-    'google_ads': GoogleAdsConnector,
-    'ga4': GA4Connector,
-    'meta_ads': MetaAdsConnector,
-    'google_sheets': GoogleSheetsConnector,
-    'hubspot': HubspotConnector
+# Maps connector type to "module:ClassName"; classes are resolved lazily.
+CONNECTOR_PATHS: Dict[str, str] = {
+    'salesforce': 'extractors.connectors.salesforce_connector:SalesforceConnector',
+    'google_ads': 'extractors.connectors.google_ads_connector:GoogleAdsConnector',
+    'ga4': 'extractors.connectors.ga4_connector:GA4Connector',
+    'meta_ads': 'extractors.connectors.meta_ads_connector:MetaAdsConnector',
+    'google_sheets': 'extractors.connectors.google_sheets_connector:GoogleSheetsConnector',
+    'hubspot': 'extractors.connectors.hubspot_connector:HubspotConnector'
 } if CONNECTORS_AVAILABLE else {}
 
+# The registry is fixed after import, so the bodies of the two endpoints that
+# only describe it are serialized once here.
+_CONNECTOR_LIST = list(CONNECTOR_PATHS.keys())
+_LIST_RESPONSE_BYTES = orjson.dumps({"connectors": _CONNECTOR_LIST})
+_HEALTH_RESPONSE_BYTES = orjson.dumps({
+    "status": "healthy",
+    "message": "Combined Connector and Edge Function server is running!",
+    "available_connectors": _CONNECTOR_LIST,
+    "connectors_loaded": CONNECTORS_AVAILABLE
+})
+
+# Canonical (lowercase) connector types, for a membership check that lets
+# callers already sending the canonical name skip str.lower().
+_CONNECTOR_KEYS = frozenset(CONNECTOR_PATHS)
 
-def get_connector(connector_type: str) -> Type[BaseAPIConnector]:
+# Connector classes that have already been imported, keyed like CONNECTOR_PATHS.
+_RESOLVED_CONNECTORS: Dict[str, Type["BaseAPIConnector"]] = {}
+
+
+def get_connector(connector_type: str) -> Type["BaseAPIConnector"]:
     """
-    Get connector class by type. Raises ValueError if connector type not found.
+    Get connector class by type, importing its module on first use.
+    Raises ValueError if connector type not found or fails to import.
     """
     if not CONNECTORS_AVAILABLE:
-        raise ValueError("Connector registry is not available due to import errors.")
-    connector_class = CONNECTOR_REGISTRY.get(connector_type.lower())
-    if not connector_class:
+        raise ValueError("Connector registry is not available because the extractors package is missing.")
+    if connector_type not in _CONNECTOR_KEYS:
+        connector_type = connector_type.lower()
+    connector_class = _RESOLVED_CONNECTORS.get(connector_type)
+    if connector_class is not None:
+        return connector_class
+
+    connector_path = CONNECTOR_PATHS.get(connector_type)
+    if not connector_path:
         raise ValueError(f"Unsupported connector type: {connector_type}")
+    module_path, class_name = connector_path.split(':')
+    try:
+        connector_class = getattr(importlib.import_module(module_path), class_name)
+    except Exception as e:
+        logger.error(f"Failed to import connector '{connector_type}': {e}", exc_info=True)
+        raise ValueError(f"Connector '{connector_type}' could not be loaded: {e}") from e
+    _RESOLVED_CONNECTORS[connector_type] = connector_class
     return connector_class
 
 # --- Edge Function Logic (from original app.py) ---
+# User code runs in worker processes so a slow or CPU-heavy cell never blocks
+# the event loop (and every other WebSocket client) of this server process.
+EXEC_POOL: Optional[ProcessPoolExecutor] = None
+# Wall-clock limit for a single code execution, in seconds (0 disables it).
+# Without it a runaway cell (e.g. `while True: pass`) occupies a pool worker
+# indefinitely.
+EXEC_TIMEOUT_SECONDS = float(os.environ.get('EXEC_TIMEOUT_SECONDS', 30))
+
+
+class ExecutionTimeout(BaseException):
+    """Raised inside a pool worker when user code exceeds EXEC_TIMEOUT_SECONDS.
+    Derives from BaseException so a bare `except Exception` in user code
+    does not swallow it."""
+
+
+def _raise_execution_timeout(signum, frame):
+    raise ExecutionTimeout(f"Execution exceeded the {EXEC_TIMEOUT_SECONDS:g} second time limit.")
+
+
+def _init_exec_worker():
+    """Pool worker initializer: install the SIGALRM handler used for timeouts."""
+    signal.signal(signal.SIGALRM, _raise_execution_timeout)
+
+
+def _start_exec_pool() -> ProcessPoolExecutor:
+    """(Re)create the process pool used for edge function execution.
+
+    Workers come from a forkserver rather than being forked from this
+    process, which by now runs threads (the threadpool, token refresh
+    timers) whose held locks a forked child would inherit.
+    """
+    global EXEC_POOL
+    EXEC_POOL = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context('forkserver'),
+        initializer=_init_exec_worker
+    )
+    return EXEC_POOL
+
+
+def _stop_exec_pool():
+    if EXEC_POOL is not None:
+        EXEC_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+# Compiled code objects keyed by (block_id, SHA-256 of the source), so re-running
+# an unchanged cell skips parsing and bytecode generation. Each pool worker
+# keeps its own LRU-bounded cache.
+_CODE_CACHE: "OrderedDict[tuple, types.CodeType]" = OrderedDict()
+_CODE_CACHE_MAX_ENTRIES = 512
+
+
+def _compile_cached(code: str, block_id: str) -> types.CodeType:
+    """Return the compiled code object for `code`, compiling it on a cache miss."""
+    key = (block_id, hashlib.sha256(code.encode()).digest())
+    compiled = _CODE_CACHE.get(key)
+    if compiled is not None:
+        _CODE_CACHE.move_to_end(key)
+        return compiled
+    compiled = compile(code, f"<block:{block_id}>", "exec")
+    _CODE_CACHE[key] = compiled
+    if len(_CODE_CACHE) > _CODE_CACHE_MAX_ENTRIES:
+        _CODE_CACHE.popitem(last=False)
+    return compiled
+
+
+# Output frame constants shared by every execute_response message.
+_EXECUTE_RESPONSE = 'execute_response'
+_STREAM = 'stream'
+_ERROR = 'error'
+
+
+def _execute_response(output_type: str, content: dict, block_id: str) -> dict:
+    """Build one execute_response output frame."""
+    return {'type': _EXECUTE_RESPONSE, 'output_type': output_type, 'content': content, 'blockId': block_id}
+
+
+# Capture buffers reused across executions. Each pool worker runs one task at
+# a time, so a per-process pair is enough.
+_EXEC_STDOUT = io.StringIO()
+_EXEC_STDERR = io.StringIO()
+
+
+def _reset_buffer(buf: io.StringIO) -> io.StringIO:
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
+
 def execute_python_code(code: str, block_id: str) -> list:
     """
     Executes a string of Python code and captures its output and errors.
+    Runs inside an EXEC_POOL worker process, so it must stay a picklable
+    top-level function.
     !!! SECURITY WARNING !!! This function uses exec().
     """
-    code_stdout = io.StringIO()
-    code_stderr = io.StringIO()
-    sys.stdout = code_stdout
-    sys.stderr = code_stderr
+    code_stdout = _reset_buffer(_EXEC_STDOUT)
+    code_stderr = _reset_buffer(_EXEC_STDERR)
     outputs = []
-    try:
-        exec(code, {})
-    except Exception:
-        outputs.append({
-            'type': 'execute_response', 'output_type': 'error',
-            'content': {
-                'ename': type(sys.exc_info()[1]).__name__, 'evalue': str(sys.exc_info()[1]),
-                'traceback': traceback.format_exc().splitlines()
-            },
-            'blockId': block_id
-        })
-    finally:
-        sys.stdout = sys.__stdout__
-        sys.stderr = sys.__stderr__
+    with contextlib.redirect_stdout(code_stdout), contextlib.redirect_stderr(code_stderr):
+        try:
+            compiled = _compile_cached(code, block_id)
+            # Tasks run on the worker's main thread, so SIGALRM interrupts the
+            # user code itself; the timer is cleared before any output handling.
+            signal.setitimer(signal.ITIMER_REAL, EXEC_TIMEOUT_SECONDS)
+            try:
+                exec(compiled, {})
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except (Exception, ExecutionTimeout) as e:
+            # Format entry by entry instead of building the whole traceback
+            # string and splitting it again.
+            tb_lines = [
+                line
+                for chunk in traceback.TracebackException.from_exception(e).format()
+                for line in chunk.splitlines()
+            ]
+            outputs.append(_execute_response(_ERROR, {
+                'ename': type(e).__name__, 'evalue': str(e),
+                'traceback': tb_lines
+            }, block_id))
 
     stdout_value = code_stdout.getvalue()
     if stdout_value:
-        outputs.append({
-            'type': 'execute_response', 'output_type': 'stream',
-            'content': {'text': stdout_value}, 'blockId': block_id
-        })
+        outputs.append(_execute_response(_STREAM, {'text': stdout_value}, block_id))
     stderr_value = code_stderr.getvalue()
     if stderr_value:
-        outputs.append({
-            'type': 'execute_response', 'output_type': 'error',
-            'content': {'ename': 'Stderr', 'evalue': stderr_value, 'traceback': []},
-            'blockId': block_id
-        })
+        outputs.append(_execute_response(_ERROR, {'ename': 'Stderr', 'evalue': stderr_value, 'traceback': []}, block_id))
+    # Don't keep a large output alive in the worker until the next execution.
+    _reset_buffer(code_stdout)
+    _reset_buffer(code_stderr)
     return outputs
 
 
+async def run_python_code(code: str, block_id: str) -> list:
+    """Run `execute_python_code` on EXEC_POOL without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    # Never fall back to the default thread executor: redirect_stdout and the
+    # SIGALRM timeout are only safe inside a pool worker process.
+    pool = EXEC_POOL or _start_exec_pool()
+    try:
+        return await loop.run_in_executor(pool, execute_python_code, code, block_id)
+    except BrokenProcessPool:
+        # A worker died (e.g. user code called os._exit); replace the pool so
+        # later executions keep working, and report the failure for this one.
+        # Every execution in flight on the broken pool fails at once; only the
+        # first to get here replaces it.
+        if EXEC_POOL is pool:
+            logger.error(f"Execution pool broke while running block {block_id}, restarting it.")
+            _start_exec_pool()
+            pool.shutdown(wait=False)
+        return [_execute_response(_ERROR, {
+            'ename': 'WorkerCrashed', 'evalue': 'The execution worker exited unexpectedly.', 'traceback': []
+        }, block_id)]
+
+
 # --- Combined Health Check and API Routes ---
 
-@app.route("/")
-def main_health_check():
+@app.get("/")
+async def main_health_check():
     """A comprehensive health check for the unified server."""
-    return jsonify({
-        "status": "healthy",
-        "message": "Combined Connector and Edge Function server is running!",
-        "available_connectors": list(CONNECTOR_REGISTRY.keys()),
-        "connectors_loaded": CONNECTORS_AVAILABLE
-    }), 200
+    return Response(content=_HEALTH_RESPONSE_BYTES, media_type="application/json")
 
 # --- WebSocket Route for Edge Functions (from original app.py) ---
-@sock.route('/ws/<path:report_id>')
-def edge_function_ws(ws, report_id):
+# Seconds without a client message before a connection is closed. Liveness of
+# the socket itself is checked by the server's ping/pong frames (see __main__).
+WS_IDLE_TIMEOUT = 60
+# Largest incoming WebSocket message accepted, in bytes. Larger messages are
+# rejected by the server before they reach orjson.loads.
+WS_MAX_MESSAGE_SIZE = 1_048_576
+# Maximum number of output frames buffered per connection before producers wait.
+WS_OUTBOUND_QUEUE_SIZE = 64
+# Per-connection permessage-deflate is disabled at the server (it holds a
+# compression context per socket). Instead, frames larger than this are
+# deflated once and sent as a binary frame: a _DEFLATE_FRAME_MARKER byte
+# followed by raw DEFLATE data (wbits=-15) of the JSON payload.
+# Smaller frames are sent as plain JSON text.
+WS_COMPRESS_THRESHOLD = 4096
+_DEFLATE_FRAME_MARKER = b'\x01'
+
+
+async def _ws_send_payload(ws: WebSocket, payload: bytes):
+    """Send a serialized JSON payload, deflating it when it is large."""
+    if len(payload) > WS_COMPRESS_THRESHOLD:
+        compressor = zlib.compressobj(level=1, wbits=-15)
+        await ws.send_bytes(_DEFLATE_FRAME_MARKER + compressor.compress(payload) + compressor.flush())
+    else:
+        await ws.send_text(payload.decode())
+
+
+async def _ws_sender(ws: WebSocket, out_q: asyncio.Queue):
+    """Drain a connection's outbound queue, merging every output already
+    waiting in the queue into a single batch frame."""
+    while True:
+        result = await out_q.get()
+        if out_q.empty():
+            # Common case: a single output is sent as-is, without a batch wrapper.
+            await _ws_send_payload(ws, orjson.dumps(result))
+            continue
+        batch = [result]
+        while not out_q.empty():
+            batch.append(out_q.get_nowait())
+        await _ws_send_payload(ws, orjson.dumps({'type': 'batch', 'results': batch}))
+
+
+async def _ws_enqueue(out_q: asyncio.Queue, sender: "asyncio.Task", result: dict):
+    """Queue an output for the sender, raising its error instead of waiting
+    forever on a full queue once the sender has stopped."""
+    if sender.done():
+        sender.result()
+        raise ConnectionError("WebSocket sender stopped")
+    if not out_q.full():
+        out_q.put_nowait(result)
+        return
+    put = asyncio.ensure_future(out_q.put(result))
+    await asyncio.wait({put, sender}, return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        sender.result()
+        raise ConnectionError("WebSocket sender stopped")
+
+
+@app.websocket("/ws/{report_id:path}")
+async def edge_function_ws(ws: WebSocket, report_id: str):
+    await ws.accept()
     logger.info(f"WebSocket connection established for report_id: {report_id}")
+    out_q: asyncio.Queue = asyncio.Queue(maxsize=WS_OUTBOUND_QUEUE_SIZE)
+    sender = asyncio.create_task(_ws_sender(ws, out_q))
     try:
         while True:
-            message_str = ws.receive(timeout=60)
-            data = json.loads(message_str)
+            message_str = await asyncio.wait_for(ws.receive_text(), timeout=WS_IDLE_TIMEOUT)
+            data = orjson.loads(message_str)
             logger.info(f"Received code execution request for {report_id}")
             if data.get('type') == 'execute_request':
-                execution_results = execute_python_code(data.get('code'), data.get('blockId'))
+                execution_results = await run_python_code(data.get('code'), data.get('blockId'))
                 for result in execution_results:
-                    ws.send(json.dumps(result))
+                    await _ws_enqueue(out_q, sender, result)
+    except asyncio.TimeoutError:
+        logger.info(f"Closing idle WebSocket for report_id: {report_id}")
+        with contextlib.suppress(Exception):
+            await ws.close()
     except Exception as e:
         logger.error(f"Connection closed for report_id: {report_id}. Reason: {e}")
     finally:
+        sender.cancel()
+        with contextlib.suppress(BaseException):
+            await sender
         logger.info(f"WebSocket for {report_id} is now fully closed.")
 
 
 # --- Connector REST API Routes (from server.py) ---
-@app.route('/api/connectors', methods=['GET'])
-def list_connectors():
-    return jsonify({"connectors": list(CONNECTOR_REGISTRY.keys())}), 200
+async def _read_json(request: Request) -> Optional[dict]:
+    """
+    Parse the request body as a JSON object with orjson, regardless of the
+    Content-Type header. Returns None if the body is not a JSON object.
+    """
+    try:
+        data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _invalid_json_response() -> ORJSONResponse:
+    return ORJSONResponse({"error": "Request body must be a JSON object"}, status_code=400)
+
+
+@app.get('/api/connectors')
+async def list_connectors():
+    return Response(content=_LIST_RESPONSE_BYTES, media_type="application/json")
+
+# Token data from completed OAuth callbacks, waiting to be picked up by the
+# frontend via /api/oauth/consume. This is per process: with more than one
+# worker (WEB_CONCURRENCY > 1) it needs to move to a shared store.
+OAUTH_TOKEN_TTL = 60
+OAUTH_TOKEN_STORE: TTLCache = TTLCache(maxsize=1024, ttl=OAUTH_TOKEN_TTL)
 
-@app.route('/api/oauth/callback/salesforce', methods=['GET'])
-def salesforce_oauth_callback():
+@app.get('/api/oauth/callback/salesforce')
+async def salesforce_oauth_callback(code: Optional[str] = None, state: Optional[str] = None):
     """
     Handles the OAuth callback from Salesforce. Exchanges the authorization
     code for an access token and refresh token, then stores them securely.
     """
-    auth_code = request.args.get('code')
-    connection_name = request.args.get('state')
+    auth_code = code
+    connection_name = state
 
     if not auth_code or not connection_name:
-        return jsonify({"error": "Missing authorization code or state"}), 400
+        return ORJSONResponse({"error": "Missing authorization code or state"}, status_code=400)
 
-    # These should be securely stored as environment variables on your server
-    client_id = os.environ.get('SALESFORCE_CLIENT_ID')
-    client_secret = os.environ.get('SALESFORCE_CLIENT_SECRET')
-    # The redirect_uri for the token exchange MUST match the one used to get the code.
-    # This is the URL of this very callback endpoint.
-    redirect_uri = os.environ.get('SALESFORCE_CALLBACK_URL', '')
-
-    if not all([client_id, client_secret, redirect_uri]):
+    if not all([SF_CLIENT_ID, SF_CLIENT_SECRET, SF_CALLBACK_URL]):
         logger.error("Server is missing Salesforce OAuth environment variables.")
-        return jsonify({"error": "Server configuration error."}), 500
+        return ORJSONResponse({"error": "Server configuration error."}, status_code=500)
 
     try:
         connector_class = get_connector('salesforce')
         # Instantiate the connector with the client credentials needed for the token exchange
-        connector_instance = connector_class(credentials={'client_id': client_id, 'client_secret': client_secret})
+        connector_instance = connector_class(credentials={'client_id': SF_CLIENT_ID, 'client_secret': SF_CLIENT_SECRET})
 
-        # Exchange the authorization code for access and refresh tokens
-        token_data = connector_instance.exchange_code_for_tokens(auth_code, redirect_uri)
+        # Exchange the authorization code for access and refresh tokens.
+        # Connector calls are blocking, so run them off the event loop.
+        try:
+            token_data = await run_in_threadpool(connector_instance.exchange_code_for_tokens, auth_code, SF_CALLBACK_URL)
+        finally:
+            connector_instance.close()
 
         # TODO: Securely save the token_data (access_token, refresh_token, instance_url)
         # to your database, associated with the user and connection_name.
 
+        # Keep the tokens server-side and hand the browser a short-lived,
+        # single-use id instead, so tokens never appear in URLs or history.
+        token_id = secrets.token_urlsafe(16)
+        OAUTH_TOKEN_STORE[token_id] = token_data
+
         # Redirect the user back to the frontend connections page
-        # The frontend can then show a success message.
-        frontend_url = os.environ.get('FRONTEND_URL')
-        return redirect(f"{frontend_url}/integrations?source=salesforce&status=success&conn_name={connection_name}&token_data={json.dumps(token_data)}")
+        # The frontend can then show a success message and exchange token_id
+        # for the token data at /api/oauth/consume.
+        return RedirectResponse(f"{FRONTEND_URL}/integrations?source=salesforce&status=success&conn_name={connection_name}&token_id={token_id}", status_code=302)
 
     except Exception as e:
         logger.error(f"Salesforce OAuth callback failed: {str(e)}", exc_info=True)
-        frontend_url = os.environ.get('FRONTEND_URL')
         # Redirect with an error status
-        return redirect(f"{frontend_url}/integrations?source=salesforce&status=error&error_message={str(e)}")
+        return RedirectResponse(f"{FRONTEND_URL}/integrations?source=salesforce&status=error&error_message={str(e)}", status_code=302)
 
-@app.route('/api/connectors/refresh-token', methods=['POST'])
-def refresh_token():
+@app.post('/api/oauth/consume')
+async def consume_oauth_token(request: Request):
+    """
+    Exchanges a token_id issued by an OAuth callback for its token data.
+    Each token_id can be consumed once and expires after OAUTH_TOKEN_TTL seconds.
+    """
+    data = await _read_json(request)
+    if data is None:
+        return _invalid_json_response()
+    token_id = data.get('token_id')
+
+    if not token_id:
+        return ORJSONResponse({"error": "Missing token_id"}, status_code=400)
+
+    token_data = OAUTH_TOKEN_STORE.pop(token_id, None)
+    if token_data is None:
+        return ORJSONResponse({"error": "Unknown or expired token_id"}, status_code=404)
+    return ORJSONResponse({"token_data": token_data}, status_code=200)
+
+@app.post('/api/connectors/refresh-token')
+async def refresh_token(request: Request):
     """
     Refreshes an access token using a refresh token for a given connector.
     """
-    data = request.get_json()
+    data = await _read_json(request)
+    if data is None:
+        return _invalid_json_response()
     connector_type = data.get('connector_type')
     credentials = data.get('credentials')
 
     if not all([connector_type, credentials, credentials.get('refresh_token')]):
-        return jsonify({"error": "Missing connector_type or refresh_token"}), 400
+        return ORJSONResponse({"error": "Missing connector_type or refresh_token"}, status_code=400)
 
     try:
         connector_class = get_connector(connector_type)
@@ -213,79 +493,127 @@ def refresh_token():
 
         # This method must exist on your connector classes.
         # It should take the refresh token and return new token data.
-        new_token_data = connector_instance.refresh_access_token()
+        try:
+            new_token_data = await run_in_threadpool(connector_instance.refresh_access_token)
+        finally:
+            connector_instance.close()
 
         # The response should include at least 'access_token' and 'expires_in'.
         # It may or may not include a new 'refresh_token'.
-        return jsonify(new_token_data), 200
+        return ORJSONResponse(new_token_data, status_code=200)
 
     except Exception as e:
         logger.error(f"Failed to refresh token for {connector_type}: {str(e)}", exc_info=True)
-        return jsonify({"error": f"Token refresh failed: {str(e)}"}), 500
+        return ORJSONResponse({"error": f"Token refresh failed: {str(e)}"}, status_code=500)
+
+# Schemas change rarely while list_objects() costs one or more remote API
+# calls, so results are cached per (connector type, connection config).
+SCHEMA_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_SCHEMA_INFLIGHT: Dict[tuple, "asyncio.Future"] = {}
+
+
+def _schema_cache_key(connector_type: str, db_config: dict) -> tuple:
+    """Cache key for a schema; the config is hashed so no secrets are kept in the key."""
+    config_digest = hashlib.blake2b(orjson.dumps(db_config, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    return connector_type.lower(), config_digest
+
+
+async def _load_schema(key: tuple, connector_type: str, db_config: dict):
+    """Fetch a schema from the connector and cache it if non-empty."""
+    connector_class = get_connector(connector_type)
+    connector_instance = connector_class(credentials=db_config)
+    # list_objects() should return all tables/objects.
+    # The original call to fetch_schema() was incorrect as it likely expects an object_name.
+    # This assumes your connector has a `list_objects` method.
+    try:
+        schema_data = await run_in_threadpool(connector_instance.list_objects)
+    finally:
+        # Releases pooled clients and sessions held by the connector
+        connector_instance.close()
+    # Connectors return {} on failure; don't pin a failed lookup for the TTL.
+    if schema_data:
+        SCHEMA_CACHE[key] = schema_data
+    return schema_data
+
 
 # (You can add the other connector endpoints like /connect, /fetch-data etc. here)
-@app.route('/api/connectors/get-schema', methods=['POST'])
-def get_schema():
+@app.post('/api/connectors/get-schema')
+async def get_schema(request: Request):
     """
     Get the schema (list of objects/tables) for a given data source.
     """
-    data = request.get_json()
+    data = await _read_json(request)
+    if data is None:
+        return _invalid_json_response()
     connector_type = data.get('dbtype')
     db_config = data.get('dbConfig')
 
     if not all([connector_type, db_config]):
-        return jsonify({"error": "Missing connector type or configuration"}), 400
+        return ORJSONResponse({"error": "Missing connector type or configuration"}, status_code=400)
 
     try:
-        connector_class = get_connector(connector_type)
-        connector_instance = connector_class(credentials=db_config)
-        # list_objects() should return all tables/objects.
-        # The original call to fetch_schema() was incorrect as it likely expects an object_name.
-        # This assumes your connector has a `list_objects` method.
-        schema_data = connector_instance.list_objects()
-        return jsonify({"schema": schema_data}), 200
+        key = _schema_cache_key(connector_type, db_config)
+        schema_data = SCHEMA_CACHE.get(key)
+        if schema_data is None:
+            # Concurrent misses for the same key share a single upstream call.
+            task = _SCHEMA_INFLIGHT.get(key)
+            if task is None:
+                task = asyncio.ensure_future(_load_schema(key, connector_type, db_config))
+                _SCHEMA_INFLIGHT[key] = task
+                task.add_done_callback(lambda _: _SCHEMA_INFLIGHT.pop(key, None))
+            schema_data = await asyncio.shield(task)
+        return ORJSONResponse({"schema": schema_data}, status_code=200)
     except Exception as e:
         logger.error(f"Failed to get schema for {connector_type}: {str(e)}", exc_info=True)
-        return jsonify({"error": f"Failed to get schema: {str(e)}"}), 500
+        return ORJSONResponse({"error": f"Failed to get schema: {str(e)}"}, status_code=500)
 
-@app.route('/api/connectors/execute-query', methods=['POST'])
-def execute_query():
+@app.post('/api/connectors/execute-query')
+async def execute_query(request: Request):
     """
     Execute a query on a given data source.
     For Salesforce, this will be a SOQL query.
     """
-    data = request.get_json()
+    data = await _read_json(request)
+    if data is None:
+        return _invalid_json_response()
     connector_type = data.get('dbtype')
     db_config = data.get('dbConfig')
     query = data.get('sqlstr')
 
     if not all([connector_type, db_config, query]):
-        return jsonify({"error": "Missing connector type, configuration, or query"}), 400
+        return ORJSONResponse({"error": "Missing connector type, configuration, or query"}, status_code=400)
 
     try:
         connector_class = get_connector(connector_type)
         # The credentials from your DB are passed to the connector instance
         connector_instance = connector_class(credentials=db_config)
         # Assuming the connector has a `fetch_data` method that takes a query
-        results = connector_instance.fetch_data(query)
-        return jsonify({"rows": results}), 200
+        try:
+            results = await run_in_threadpool(connector_instance.fetch_data, query)
+        finally:
+            connector_instance.close()
+        return ORJSONResponse({"rows": results}, status_code=200)
     except Exception as e:
         logger.error(f"Failed to execute query for {connector_type}: {str(e)}", exc_info=True)
-        return jsonify({"error": f"Query execution failed: {str(e)}"}), 500
+        return ORJSONResponse({"error": f"Query execution failed: {str(e)}"}, status_code=500)
 
 
 # --- Server Startup Logic ---
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
+    # Each worker is a separate process with its own event loop.
+    workers = int(os.environ.get('WEB_CONCURRENCY', 1))
     
-    # Log if the connectors failed to load and show the error
+    # Log if the connectors package is missing
     if not CONNECTORS_AVAILABLE:
-        logger.warning("Could not import connector modules. The REST API for connectors will not work.")
-        logger.error(f"Import Error detail: {IMPORT_ERROR}")
+        logger.warning("Could not find the extractors package. The REST API for connectors will not work.")
 
     logger.info(f"Starting unified server on port {port}")
     if CONNECTORS_AVAILABLE:
-        logger.info(f"Available connectors: {list(CONNECTOR_REGISTRY.keys())}")
+        logger.info(f"Available connectors: {_CONNECTOR_LIST}")
     
-    from eventlet import wsgi
-    wsgi.server(eventlet.listen(('0.0.0.0', port)), app, log=logger)
\ No newline at end of file
+    uvicorn.run(
+        "app:app", host="0.0.0.0", port=port, loop="uvloop", http="httptools", workers=workers,
+        ws_max_size=WS_MAX_MESSAGE_SIZE, ws_per_message_deflate=False,
+        ws_ping_interval=25, ws_ping_timeout=10
+    )
@@ -5,10 +5,46 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Generator, Callable
 
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by the HTTP sessions of all connectors, so short-lived
+# connector instances (e.g. one per REST request) reuse TCP/TLS connections
+# instead of paying a new handshake each time.
+SHARED_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+
+
+class PooledSession(requests.Session):
+    """A requests session backed by a shared HTTPAdapter.
+
+    Headers, cookies and auth stay per session; only the underlying
+    connections are shared. Closing the session leaves the shared pool open.
+
+    Args:
+        adapter: The shared adapter to mount, SHARED_HTTP_ADAPTER by default.
+            Connectors that need their own pool size or retry policy pass a
+            module-level adapter so it is still shared across instances.
+    """
+
+    def __init__(self, adapter: HTTPAdapter = SHARED_HTTP_ADAPTER):
+        super().__init__()
+        self._shared_adapter = adapter
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def close(self):
+        for adapter in self.adapters.values():
+            if adapter is not self._shared_adapter:
+                adapter.close()
+
 
 class APIConnectorException(Exception):
     """Base exception class for API connector errors"""
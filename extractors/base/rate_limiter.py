@@ -0,0 +1,94 @@
+"""
+Rate limiting primitives shared by API connectors.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Allows bursts of up to ``capacity`` requests while holding the long-run
+    rate to ``refill_rate`` requests per second. A caller that finds the
+    bucket empty reserves the next token in advance (the balance goes
+    negative), so concurrent callers are spaced out in arrival order and the
+    lock is never held while sleeping.
+
+    Attributes:
+        capacity (float): Maximum number of tokens the bucket can hold
+        refill_rate (float): Tokens added per second
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize a full bucket.
+
+        Args:
+            capacity: Maximum burst size
+            refill_rate: Sustained rate in tokens per second
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if refill_rate <= 0:
+            raise ValueError("refill_rate must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before using it.
+
+        Returns:
+            float: Seconds to wait, 0.0 if a token was available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+    def set_rate(self, refill_rate: float):
+        """Change the sustained rate.
+
+        Tokens accrued so far are credited at the old rate first.
+
+        Args:
+            refill_rate: New rate in tokens per second
+        """
+        if refill_rate <= 0:
+            raise ValueError("refill_rate must be positive")
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            self.refill_rate = float(refill_rate)
+
+    def consume(self) -> float:
+        """Take one token, blocking until it is available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aconsume(self) -> float:
+        """Async counterpart of consume that yields to the event loop.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
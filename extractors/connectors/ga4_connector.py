@@ -3,23 +3,89 @@ Google Analytics 4 (GA4) API connector implementation.
 This module provides a connector for Google Analytics Data API.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
+import threading
 import time
-import json
-from typing import Dict, List, Any, Optional, Tuple, Union
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple, Generator
 from datetime import datetime, timedelta
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+import pandas as pd
+import grpc
+from cachetools import TTLCache
+from google.api_core import exceptions as google_exceptions
+from google.api_core import retry as api_retry
+from google.api_core import retry_async
+from google.analytics.data_v1beta import BetaAnalyticsDataClient, BetaAnalyticsDataAsyncClient
+from google.analytics.data_v1beta.services.beta_analytics_data.transports import (
+    BetaAnalyticsDataGrpcTransport, BetaAnalyticsDataGrpcAsyncIOTransport
+)
 from google.analytics.data_v1beta.types import (
-    RunReportRequest, RunRealtimeReportRequest, GetMetadataRequest,
-    DateRange, Dimension, Metric, FilterExpression, Filter,
-    OrderBy
+    RunReportRequest, RunReportResponse, RunRealtimeReportRequest, GetMetadataRequest,
+    BatchRunReportsRequest, Dimension, Metric, FilterExpression, Filter, OrderBy
 )
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 
 from extractors.base.api_connector import BaseAPIConnector
 
+_TOKEN_URI = 'https://oauth2.googleapis.com/token'
+_SCOPES = ('https://www.googleapis.com/auth/analytics.readonly',)
+
+# Maximum number of reports the GA4 API accepts in one batchRunReports call.
+MAX_BATCH_REPORTS = 5
+# GA4 allows 10 concurrent requests per property; afetch_many stays within it.
+MAX_CONCURRENT_REQUESTS = 10
+# Bounds GA4 requests in flight across all fetch_multi calls in this process.
+_CONCURRENCY_SEMAPHORE = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+# Part of response cache keys, so cached responses are not reused across API versions.
+_API_VERSION = 'v1beta'
+# Rows requested per page by fetch_data_iter.
+DEFAULT_PAGE_SIZE = 10000
+# gRPC channel settings for the analytics clients. The unlimited message sizes
+# match the library's default channel; gzip compresses requests and responses
+# made up of highly repetitive dimension strings.
+_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    # Keep idle channels alive so long-running processes don't pay a new
+    # TCP/TLS/HTTP2 handshake after quiet periods.
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.keepalive_permit_without_calls", 1),
+)
+_CHANNEL_COMPRESSION = grpc.Compression.Gzip
+# Per-attempt timeout and retry policy for GA4 RPCs, so a stalled call can't
+# block indefinitely. Only transient errors (429/500/503) are retried.
+_RPC_TIMEOUT = 60.0
+_RPC_RETRY = api_retry.Retry(predicate=api_retry.if_transient_error, initial=1.0, maximum=10.0, deadline=120.0)
+_ASYNC_RPC_RETRY = retry_async.AsyncRetry(predicate=api_retry.if_transient_error, initial=1.0, maximum=10.0, deadline=120.0)
+_MATCH_EXACT = Filter.StringFilter.MatchType.EXACT
+
+# Default dimensions and metrics, built once as raw protobuf messages and
+# copied into requests that don't specify their own.
+_DEFAULT_STD_DIMENSIONS = tuple(Dimension.pb(Dimension(name=name)) for name in (
+    'date', 'country', 'deviceCategory', 'channelGrouping', 'source', 'medium'
+))
+_DEFAULT_STD_METRICS = tuple(Metric.pb(Metric(name=name)) for name in (
+    'sessions', 'users', 'newUsers', 'pageviews', 'bounceRate',
+    'averageSessionDuration', 'conversions', 'totalRevenue'
+))
+_DEFAULT_REALTIME_DIMENSIONS = tuple(Dimension.pb(Dimension(name=name)) for name in ('country', 'deviceCategory'))
+_DEFAULT_REALTIME_METRICS = tuple(Metric.pb(Metric(name=name)) for name in ('activeUsers',))
+
+
+def _add_named(repeated_field, names: Optional[List[str]], defaults: tuple):
+    """Append Dimension/Metric entries by name, or the defaults if names is None."""
+    if names is None:
+        repeated_field.extend(defaults)
+    else:
+        for name in names:
+            repeated_field.add(name=name)
+
 
 class GA4Connector(BaseAPIConnector):
     """Google Analytics 4 API connector implementation.
@@ -31,17 +97,68 @@ class GA4Connector(BaseAPIConnector):
         logger (logging.Logger): Logger for this connector
     """
     
-    def __init__(self, credentials: Dict[str, Any], rate_limit_config: Optional[Dict[str, Any]] = None):
+    # One connector is often created per property, so instance attributes are
+    # slotted. BaseAPIConnector does not use slots, so its own attributes stay
+    # in the instance __dict__.
+    __slots__ = (
+        'client', 'aclient', '_aclient_loop', '_creds', '_pool_key', '_last_validated_at',
+        'property_id', 'client_id', 'client_secret', 'refresh_token', 'access_token',
+        'last_request_time', 'request_count', 'max_retries', 'cache_config', '_response_cache'
+    )
+    
+    # Property metadata shared by all instances:
+    # (client_id, refresh token digest, property_id) -> schema.
+    # Metadata changes rarely, and get_custom_dimensions/get_custom_metrics
+    # would otherwise each re-fetch it. The credentials are part of the key so
+    # one account's custom dimensions and metrics are never served to another.
+    # Bounded and expiring, so properties that are no longer queried drop out.
+    SCHEMA_CACHE_TTL = 600
+    SCHEMA_CACHE_SIZE = 256
+    _schema_cache: TTLCache = TTLCache(maxsize=SCHEMA_CACHE_SIZE, ttl=SCHEMA_CACHE_TTL)
+    _schema_cache_lock = threading.Lock()
+    
+    # Authenticated clients shared by instances using the same OAuth client and
+    # refresh token, so one gRPC channel serves every property of an account:
+    # (client_id, refresh_token) -> [client, credentials, refcount, last_used].
+    _client_pool: Dict[Tuple[str, str], list] = {}
+    _client_pool_lock = threading.Lock()
+    
+    # Clients no instance holds stay pooled for this many seconds, so
+    # back-to-back requests reuse them, and are then closed.
+    POOL_IDLE_TIMEOUT = 300
+    
+    # Access tokens are refreshed in the background once they are this close
+    # to expiring, so no request has to wait on the OAuth round-trip.
+    TOKEN_REFRESH_MARGIN = 60
+    
+    # Seconds a successful validate_connection() probe is trusted before the
+    # next call issues another get_metadata request.
+    VALIDATION_TTL = 300
+    _refreshing: set = set()
+    _refresh_lock = threading.Lock()
+    
+    def __init__(self,
+                 credentials: Dict[str, Any],
+                 rate_limit_config: Optional[Dict[str, Any]] = None,
+                 cache_config: Optional[Dict[str, Any]] = None):
         """Initialize the GA4 connector.
         
         Args:
             credentials: Dictionary containing authentication credentials
                 Required keys: client_id, client_secret, refresh_token, property_id
             rate_limit_config: Optional configuration for API rate limiting
+            cache_config: Optional on-disk cache for standard report responses
+                directory: Cache directory (required to enable the cache)
+                ttl: Seconds a cached response stays valid (default: 86400)
         """
         super().__init__(credentials, rate_limit_config)
         
         self.client = None
+        self.aclient = None
+        self._aclient_loop = None
+        self._creds = None
+        self._pool_key = None
+        self._last_validated_at = None
         self.property_id = credentials.get('property_id')
         self.client_id = credentials.get('client_id')
         self.client_secret = credentials.get('client_secret')
@@ -60,6 +177,22 @@ class GA4Connector(BaseAPIConnector):
         if self.property_id and not self.property_id.startswith('properties/'):
             self.property_id = f"properties/{self.property_id}"
         
+        self.cache_config = cache_config or {}
+        self._response_cache = self._open_response_cache()
+        
+    def _open_response_cache(self):
+        """Open the diskcache configured in cache_config, if any."""
+        directory = self.cache_config.get('directory')
+        if not directory:
+            return None
+        try:
+            import diskcache
+        except ImportError:
+            self.logger.warning("cache_config was given but diskcache is not installed; response caching disabled")
+            return None
+        self.cache_config.setdefault('ttl', 86400)
+        return diskcache.Cache(directory)
+    
     def authenticate(self) -> bool:
         """Authenticate with GA4 API using OAuth 2.0.
         
@@ -67,24 +200,40 @@ class GA4Connector(BaseAPIConnector):
             bool: True if authentication was successful, False otherwise
         """
         try:
-            # Create credentials object
-            creds = Credentials(
-                token=self.access_token,
-                refresh_token=self.refresh_token,
-                token_uri='https://oauth2.googleapis.com/token',
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                scopes=['https://www.googleapis.com/auth/analytics.readonly']
-            )
+            pool_key = (self.client_id, self.refresh_token)
+            with self._client_pool_lock:
+                self._evict_idle_clients()
+                entry = self._client_pool.get(pool_key)
+                if entry is not None:
+                    client, creds = entry[0], entry[1]
+                    if self._pool_key != pool_key:
+                        entry[2] += 1
+                    entry[3] = time.monotonic()
+                else:
+                    # Create credentials object
+                    creds = Credentials(
+                        token=self.access_token,
+                        refresh_token=self.refresh_token,
+                        token_uri=_TOKEN_URI,
+                        client_id=self.client_id,
+                        client_secret=self.client_secret,
+                        scopes=list(_SCOPES)
+                    )
+                    # gRPC multiplexes concurrent RPCs over one HTTP/2 channel
+                    client = self._create_client(creds)
+                    self._client_pool[pool_key] = [client, creds, 1, time.monotonic()]
+            self._pool_key = pool_key
             
             # Refresh token if needed
             if creds.expired:
                 creds.refresh(Request())
-                self.access_token = creds.token
                 self.logger.info("Access token refreshed")
+            self.access_token = creds.token
             
-            # Initialize GA4 client
-            self.client = BetaAnalyticsDataClient(credentials=creds)
+            # The async client is created on first use because it has to be
+            # bound to the running event loop.
+            self._creds = creds
+            self.client = client
             self.logger.info("Successfully authenticated with GA4 API")
             return True
             
@@ -92,20 +241,88 @@ class GA4Connector(BaseAPIConnector):
             self.logger.error(f"Authentication failed: {str(e)}")
             return False
     
+    @staticmethod
+    def _create_client(creds: Credentials) -> BetaAnalyticsDataClient:
+        """Create a GA4 client on a gzip-compressed gRPC channel."""
+        channel = BetaAnalyticsDataGrpcTransport.create_channel(
+            credentials=creds,
+            compression=_CHANNEL_COMPRESSION,
+            options=list(_CHANNEL_OPTIONS)
+        )
+        return BetaAnalyticsDataClient(transport=BetaAnalyticsDataGrpcTransport(channel=channel))
+    
+    def close(self):
+        """Release the pooled client and close the response cache and any open sessions."""
+        super().close()
+        if self._response_cache is not None:
+            self._response_cache.close()
+        if self._pool_key is not None:
+            with self._client_pool_lock:
+                entry = self._client_pool.get(self._pool_key)
+                if entry is not None:
+                    entry[2] -= 1
+                    if entry[2] <= 0:
+                        entry[3] = time.monotonic()
+                self._evict_idle_clients()
+            self._pool_key = None
+            self.client = None
+    
+    @classmethod
+    def _evict_idle_clients(cls):
+        """Close pooled clients that no instance has used for POOL_IDLE_TIMEOUT.
+        
+        Must be called with _client_pool_lock held.
+        """
+        now = time.monotonic()
+        for key, entry in list(cls._client_pool.items()):
+            if entry[2] <= 0 and now - entry[3] > cls.POOL_IDLE_TIMEOUT:
+                del cls._client_pool[key]
+                entry[0].transport.close()
+    
+    def _maybe_refresh(self):
+        """Start a background token refresh if the access token expires soon."""
+        creds = self._creds
+        if creds is None or creds.expiry is None:
+            return
+        if (creds.expiry - datetime.utcnow()).total_seconds() >= self.TOKEN_REFRESH_MARGIN:
+            return
+        
+        # Credentials are shared through the client pool; refresh each one once
+        with self._refresh_lock:
+            if id(creds) in self._refreshing:
+                return
+            self._refreshing.add(id(creds))
+        threading.Thread(target=self._refresh_credentials, args=(creds,), daemon=True).start()
+    
+    def _refresh_credentials(self, creds: Credentials):
+        try:
+            creds.refresh(Request())
+            self.logger.info("Access token refreshed in background")
+        except Exception as e:
+            self.logger.error(f"Background token refresh failed: {str(e)}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(id(creds))
+    
     def validate_connection(self) -> bool:
         """Validate the connection to GA4 API.
         
         Returns:
             bool: True if connection is valid, False otherwise
         """
+        self._maybe_refresh()
         if not self.client:
             return self.authenticate()
         
+        if self._last_validated_at is not None and time.monotonic() - self._last_validated_at < self.VALIDATION_TTL:
+            return True
+        
         try:
             # Try to get metadata to validate connection
             request = GetMetadataRequest(name=f"{self.property_id}/metadata")
-            metadata = self.client.get_metadata(request=request)
+            metadata = self.client.get_metadata(request=request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
             
+            self._last_validated_at = time.monotonic()
             self.logger.info(f"Connection valid for property: {self.property_id}")
             return True
             
@@ -113,6 +330,11 @@ class GA4Connector(BaseAPIConnector):
             self.logger.error(f"Connection validation error: {str(e)}")
             return False
     
+    def _check_auth_error(self, error: Exception):
+        """Force a fresh validation probe after an auth or permission error."""
+        if isinstance(error, (google_exceptions.Unauthenticated, google_exceptions.PermissionDenied)):
+            self._last_validated_at = None
+    
     def handle_rate_limits(self):
         """Handle GA4 API rate limits.
         
@@ -121,23 +343,42 @@ class GA4Connector(BaseAPIConnector):
         - 250 tokens per hour per property
         - Different requests consume different amounts of tokens
         """
-        current_time = datetime.now()
+        sleep_time = self._next_request_delay()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+    
+    async def ahandle_rate_limits(self):
+        """Async counterpart of handle_rate_limits that yields to the event loop."""
+        sleep_time = self._next_request_delay()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+    
+    def _next_request_delay(self) -> float:
+        """Record a request and return how long to wait before sending it.
+        
+        The request's send time is reserved before returning, so concurrent
+        callers (e.g. coroutines in afetch_many) are spaced out rather than
+        all sleeping the same interval.
+        """
+        current_time = time.monotonic()
+        sleep_time = 0.0
         
-        if self.last_request_time:
-            elapsed = (current_time - self.last_request_time).total_seconds()
+        if self.last_request_time is not None:
+            elapsed = current_time - self.last_request_time
             min_interval = self.rate_limit_config.get('min_request_interval', 0.1)
             
             if elapsed < min_interval:
                 sleep_time = min_interval - elapsed
                 self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f} seconds")
-                time.sleep(sleep_time)
         
-        self.last_request_time = current_time
+        self.last_request_time = current_time + sleep_time
         self.request_count += 1
         
         # Log progress for monitoring
-        if self.request_count % 50 == 0:
+        if self.logger.isEnabledFor(logging.INFO) and self.request_count % 50 == 0:
             self.logger.info(f"Processed {self.request_count} GA4 API requests")
+        
+        return sleep_time
     
     def fetch_data(self, 
                   report_type: str, 
@@ -185,76 +426,409 @@ class GA4Connector(BaseAPIConnector):
             
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
+            self._check_auth_error(e)
+            return []
+    
+    def fetch_data_iter(self,
+                        report_type: str,
+                        query_params: Optional[Dict[str, Any]] = None,
+                        page_size: int = DEFAULT_PAGE_SIZE) -> Generator[List[Dict[str, Any]], None, None]:
+        """Fetch a report page by page.
+        
+        Unlike fetch_data, which returns a single response of at most `limit`
+        rows, this pages through the whole report with limit/offset and yields
+        the records of each page, so only one page is held in memory at a time.
+        
+        Args:
+            report_type: Type of report ('standard', 'realtime', 'cohort', 'pivot')
+            query_params: Optional parameters for the query, as for fetch_data.
+                Here `limit` caps the total number of rows across all pages.
+            page_size: Number of rows requested per page
+            
+        Yields:
+            Lists of record dictionaries, one per page
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return
+        
+        query_params = query_params or {}
+        
+        try:
+            if report_type == 'realtime':
+                # Realtime reports do not support offsets
+                yield self._fetch_realtime_report(query_params)
+            elif report_type in ('standard', 'cohort', 'pivot'):
+                yield from self._iter_standard_report(query_params, page_size)
+            else:
+                self.logger.error(f"Unsupported report type: {report_type}")
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            self._check_auth_error(e)
+    
+    def _iter_standard_report(self,
+                              query_params: Dict[str, Any],
+                              page_size: int) -> Generator[List[Dict[str, Any]], None, None]:
+        """Yield standard report records one page at a time."""
+        offset = query_params.get('offset', 0)
+        remaining = query_params.get('limit')
+        
+        while remaining is None or remaining > 0:
+            limit = page_size if remaining is None else min(page_size, remaining)
+            response = self._run_report(self._build_standard_request(dict(query_params, limit=limit, offset=offset)))
+            
+            row_count = len(response.rows)
+            if row_count:
+                yield self._convert_report_to_records(response, 'standard')
+            
+            offset += row_count
+            if remaining is not None:
+                remaining -= row_count
+            if row_count < limit or offset >= response.row_count:
+                break
+    
+    def fetch_dataframe(self,
+                        report_type: str,
+                        query_params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Fetch a report as a pandas DataFrame.
+        
+        Same arguments as fetch_data. The frame is built column by column from
+        the response instead of going through one dict per row.
+        
+        Returns:
+            DataFrame with one column per dimension and metric plus the
+            _report_type, _property_id and _extracted_at metadata columns
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return pd.DataFrame()
+        
+        query_params = query_params or {}
+        
+        try:
+            if report_type == 'realtime':
+                request = self._build_realtime_request(query_params)
+                self.handle_rate_limits()
+                response = self.client.run_realtime_report(request=request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
+            elif report_type in ('standard', 'cohort', 'pivot'):
+                response = self._run_report(self._build_standard_request(query_params))
+            else:
+                self.logger.error(f"Unsupported report type: {report_type}")
+                return pd.DataFrame()
+            
+            df = pd.DataFrame(self._convert_report_to_columns(response)).assign(
+                _report_type=report_type,
+                _property_id=self.property_id,
+                _extracted_at=datetime.now().isoformat()
+            )
+            self.logger.info(f"Successfully fetched {len(df)} {report_type} records")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            self._check_auth_error(e)
+            return pd.DataFrame()
+    
+    def _get_async_client(self) -> BetaAnalyticsDataAsyncClient:
+        """Return the async client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self.aclient is None or self._aclient_loop is not loop:
+            channel = BetaAnalyticsDataGrpcAsyncIOTransport.create_channel(
+                credentials=self._creds,
+                compression=_CHANNEL_COMPRESSION,
+                options=list(_CHANNEL_OPTIONS)
+            )
+            self.aclient = BetaAnalyticsDataAsyncClient(
+                transport=BetaAnalyticsDataGrpcAsyncIOTransport(channel=channel)
+            )
+            self._aclient_loop = loop
+        return self.aclient
+    
+    async def _aclose_async_client(self):
+        """Close the async client's channel, e.g. before its event loop ends."""
+        if self.aclient is not None:
+            await self.aclient.transport.close()
+        self.aclient = None
+        self._aclient_loop = None
+    
+    async def afetch_data(self,
+                          report_type: str,
+                          query_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Async version of fetch_data using the GA4 async client.
+        
+        Args:
+            report_type: Type of report ('standard', 'realtime', 'cohort', 'pivot')
+            query_params: Optional parameters for the query, as for fetch_data
+            
+        Returns:
+            List of dictionaries containing the fetched data
+        """
+        if self.client is None and not await asyncio.to_thread(self.authenticate):
+            self.logger.error("Authentication failed, cannot fetch data")
+            return []
+        
+        query_params = query_params or {}
+        
+        try:
+            aclient = self._get_async_client()
+            
+            if report_type == 'realtime':
+                request = self._build_realtime_request(query_params)
+                await self.ahandle_rate_limits()
+                response = await aclient.run_realtime_report(request=request, retry=_ASYNC_RPC_RETRY, timeout=_RPC_TIMEOUT)
+            elif report_type in ('standard', 'cohort', 'pivot'):
+                # Cohort and pivot reports fall back to standard reports, as in fetch_data
+                response = await self._arun_report(aclient, self._build_standard_request(query_params))
+            else:
+                self.logger.error(f"Unsupported report type: {report_type}")
+                return []
+            
+            records = self._convert_report_to_records(response, report_type)
+            self.logger.info(f"Successfully fetched {len(records)} {report_type} records")
+            return records
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            self._check_auth_error(e)
+            return []
+    
+    async def afetch_many(self,
+                          requests_list: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Run several reports concurrently.
+        
+        At most MAX_CONCURRENT_REQUESTS reports are in flight at once.
+        
+        Args:
+            requests_list: List of (report_type, query_params) tuples
+            
+        Returns:
+            One list of records per request, in the same order. Failed
+            requests yield an empty list.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def _run(report_type: str, query_params: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.afetch_data(report_type, query_params)
+        
+        results = await asyncio.gather(
+            *(_run(report_type, query_params) for report_type, query_params in requests_list),
+            return_exceptions=True
+        )
+        
+        records = []
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error fetching data: {str(result)}")
+                records.append([])
+            else:
+                records.append(result)
+        return records
+    
+    def fetch_many(self,
+                   requests_list: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[List[Dict[str, Any]]]:
+        """Synchronous wrapper around afetch_many.
+        
+        Must not be called from a thread that is already running an event loop.
+        """
+        async def _run() -> List[List[Dict[str, Any]]]:
+            try:
+                return await self.afetch_many(requests_list)
+            finally:
+                # The channel is bound to this call's event loop, which
+                # asyncio.run closes on return.
+                await self._aclose_async_client()
+        
+        return asyncio.run(_run())
+    
+    @classmethod
+    def fetch_multi(cls,
+                    credentials_list: List[Dict[str, Any]],
+                    report_type: str,
+                    query_params: Optional[Dict[str, Any]] = None,
+                    max_workers: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch the same report for several properties in parallel.
+        
+        Each credentials dict gets its own connector; connectors for the same
+        account share a client through the client pool. Requests in flight
+        are capped process-wide at MAX_CONCURRENT_REQUESTS.
+        
+        Args:
+            credentials_list: One credentials dict per property, as for __init__
+            report_type: Type of report, as for fetch_data
+            query_params: Optional parameters for the query, as for fetch_data
+            max_workers: Number of worker threads
+            
+        Returns:
+            Dictionary mapping each property_id to its records
+        """
+        connectors = [cls(credentials) for credentials in credentials_list]
+        
+        def _fetch(connector: 'GA4Connector') -> List[Dict[str, Any]]:
+            with _CONCURRENCY_SEMAPHORE:
+                return connector.fetch_data(report_type, query_params)
+        
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_fetch, connector): connector for connector in connectors}
+                for future in as_completed(futures):
+                    connector = futures[future]
+                    try:
+                        results[connector.property_id] = future.result()
+                    except Exception as e:
+                        connector.logger.error(f"Error fetching data for {connector.property_id}: {str(e)}")
+                        results[connector.property_id] = []
+        finally:
+            for connector in connectors:
+                connector.close()
+        
+        return results
+    
+    def fetch_data_batch(self, query_params_list: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Fetch several standard reports using batchRunReports.
+        
+        Requests are sent in groups of up to MAX_BATCH_REPORTS, so N reports
+        cost ceil(N / 5) round-trips instead of N.
+        
+        Args:
+            query_params_list: One query_params dict per report, in the format
+                accepted by fetch_data
+            
+        Returns:
+            One list of records per entry of query_params_list, in the same order
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return []
+        
+        try:
+            results = []
+            for start in range(0, len(query_params_list), MAX_BATCH_REPORTS):
+                chunk = query_params_list[start:start + MAX_BATCH_REPORTS]
+                batch_request = BatchRunReportsRequest(
+                    property=self.property_id,
+                    requests=[self._build_standard_request(query_params or {}) for query_params in chunk]
+                )
+                
+                self.handle_rate_limits()
+                response = self.client.batch_run_reports(request=batch_request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
+                
+                for report in response.reports:
+                    results.append(self._convert_report_to_records(report, 'standard'))
+            
+            self.logger.info(f"Successfully fetched {len(results)} standard reports in batch")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching batched reports: {str(e)}")
+            self._check_auth_error(e)
             return []
     
     def _fetch_standard_report(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fetch standard GA4 report data."""
-        # Default dimensions and metrics for e-commerce
-        dimensions = query_params.get('dimensions', [
-            'date', 'country', 'deviceCategory', 'channelGrouping', 'source', 'medium'
-        ])
-        
-        metrics = query_params.get('metrics', [
-            'sessions', 'users', 'newUsers', 'pageviews', 'bounceRate',
-            'averageSessionDuration', 'conversions', 'totalRevenue'
-        ])
+        response = self._run_report(self._build_standard_request(query_params))
+        return self._convert_report_to_records(response, 'standard')
+    
+    def _run_report(self, request: RunReportRequest) -> RunReportResponse:
+        """Run a standard report, going through the response cache if enabled."""
+        key = self._response_cache_key(request)
+        response = self._get_cached_response(key)
+        if response is None:
+            self.handle_rate_limits()
+            response = self.client.run_report(request=request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
+            self._store_response(key, response)
+        return response
+    
+    async def _arun_report(self, aclient: BetaAnalyticsDataAsyncClient, request: RunReportRequest) -> RunReportResponse:
+        """Async counterpart of _run_report."""
+        key = self._response_cache_key(request)
+        response = self._get_cached_response(key)
+        if response is None:
+            await self.ahandle_rate_limits()
+            response = await aclient.run_report(request=request, retry=_ASYNC_RPC_RETRY, timeout=_RPC_TIMEOUT)
+            self._store_response(key, response)
+        return response
+    
+    def _response_cache_key(self, request: RunReportRequest) -> Optional[str]:
+        """Cache key for a standard report request (None if caching is off).
         
+        Realtime reports never go through the cache.
+        """
+        if self._response_cache is None:
+            return None
+        digest = hashlib.sha256(f"{_API_VERSION}:{self.property_id}:".encode())
+        digest.update(RunReportRequest.serialize(request))
+        return digest.hexdigest()
+    
+    def _get_cached_response(self, key: Optional[str]) -> Optional[RunReportResponse]:
+        if key is None:
+            return None
+        blob = self._response_cache.get(key)
+        if blob is None:
+            return None
+        self.logger.debug(f"Response cache hit for {self.property_id}")
+        return RunReportResponse.deserialize(blob)
+    
+    def _store_response(self, key: Optional[str], response: RunReportResponse):
+        if key is None:
+            return
+        self._response_cache.set(key, RunReportResponse.serialize(response), expire=self.cache_config['ttl'])
+    
+    def _build_standard_request(self, query_params: Dict[str, Any]) -> RunReportRequest:
+        """Build the RunReportRequest for a standard report."""
         # Date range (default: last 30 days)
         date_ranges = query_params.get('date_ranges', [{
             'start_date': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),
             'end_date': datetime.now().strftime('%Y-%m-%d')
         }])
         
-        # Build request
+        # Build request. Repeated fields are filled on the underlying protobuf
+        # message, avoiding a proto-plus wrapper object per entry.
         request = RunReportRequest(
             property=self.property_id,
-            dimensions=[Dimension(name=dim) for dim in dimensions],
-            metrics=[Metric(name=metric) for metric in metrics],
-            date_ranges=[DateRange(start_date=dr['start_date'], end_date=dr['end_date']) 
-                        for dr in date_ranges],
             limit=query_params.get('limit', 10000),
             offset=query_params.get('offset', 0)
         )
+        request_pb = RunReportRequest.pb(request)
+        # Default dimensions and metrics for e-commerce
+        _add_named(request_pb.dimensions, query_params.get('dimensions'), _DEFAULT_STD_DIMENSIONS)
+        _add_named(request_pb.metrics, query_params.get('metrics'), _DEFAULT_STD_METRICS)
+        for dr in date_ranges:
+            request_pb.date_ranges.add(start_date=dr['start_date'], end_date=dr['end_date'])
         
         # Add filters if specified
-        if 'dimension_filter' in query_params:
-            request.dimension_filter = self._build_filter_expression(query_params['dimension_filter'])
-        
-        if 'metric_filter' in query_params:
-            request.metric_filter = self._build_filter_expression(query_params['metric_filter'])
+        self._apply_filters(request, query_params)
         
         # Add ordering if specified
         if 'order_bys' in query_params:
             request.order_bys = [self._build_order_by(order) for order in query_params['order_bys']]
         
-        self.handle_rate_limits()
-        response = self.client.run_report(request=request)
-        
-        return self._convert_report_to_records(response, 'standard')
+        return request
     
     def _fetch_realtime_report(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fetch realtime GA4 report data."""
-        dimensions = query_params.get('dimensions', ['country', 'deviceCategory'])
-        metrics = query_params.get('metrics', ['activeUsers'])
+        request = self._build_realtime_request(query_params)
         
+        self.handle_rate_limits()
+        response = self.client.run_realtime_report(request=request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
+        
+        return self._convert_report_to_records(response, 'realtime')
+    
+    def _build_realtime_request(self, query_params: Dict[str, Any]) -> RunRealtimeReportRequest:
+        """Build the RunRealtimeReportRequest for a realtime report."""
         request = RunRealtimeReportRequest(
             property=self.property_id,
-            dimensions=[Dimension(name=dim) for dim in dimensions],
-            metrics=[Metric(name=metric) for metric in metrics],
             limit=query_params.get('limit', 10000)
         )
+        request_pb = RunRealtimeReportRequest.pb(request)
+        _add_named(request_pb.dimensions, query_params.get('dimensions'), _DEFAULT_REALTIME_DIMENSIONS)
+        _add_named(request_pb.metrics, query_params.get('metrics'), _DEFAULT_REALTIME_METRICS)
         
         # Add filters if specified
-        if 'dimension_filter' in query_params:
-            request.dimension_filter = self._build_filter_expression(query_params['dimension_filter'])
-        
-        if 'metric_filter' in query_params:
-            request.metric_filter = self._build_filter_expression(query_params['metric_filter'])
-        
-        self.handle_rate_limits()
-        response = self.client.run_realtime_report(request=request)
+        self._apply_filters(request, query_params)
         
-        return self._convert_report_to_records(response, 'realtime')
+        return request
     
     def _fetch_cohort_report(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fetch cohort analysis report."""
@@ -270,8 +844,25 @@ class GA4Connector(BaseAPIConnector):
         self.logger.warning("Pivot reports require complex configuration - using standard report")
         return self._fetch_standard_report(query_params)
     
-    def _build_filter_expression(self, filter_config: Dict[str, Any]) -> FilterExpression:
-        """Build a filter expression from configuration."""
+    def _apply_filters(self, request, query_params: Dict[str, Any]):
+        """Set dimension/metric filters on a request, skipping empty ones."""
+        dimension_filter = query_params.get('dimension_filter')
+        if dimension_filter:
+            expression = self._build_filter_expression(dimension_filter)
+            if expression is not None:
+                request.dimension_filter = expression
+        
+        metric_filter = query_params.get('metric_filter')
+        if metric_filter:
+            expression = self._build_filter_expression(metric_filter)
+            if expression is not None:
+                request.metric_filter = expression
+    
+    def _build_filter_expression(self, filter_config: Dict[str, Any]) -> Optional[FilterExpression]:
+        """Build a filter expression from configuration.
+        
+        Returns None if the configuration does not describe a supported filter.
+        """
         # Simplified filter building - can be extended for complex filters
         if 'field_name' in filter_config and 'string_value' in filter_config:
             return FilterExpression(
@@ -279,25 +870,21 @@ class GA4Connector(BaseAPIConnector):
                     field_name=filter_config['field_name'],
                     string_filter=Filter.StringFilter(
                         value=filter_config['string_value'],
-                        match_type=Filter.StringFilter.MatchType.EXACT
+                        match_type=_MATCH_EXACT
                     )
                 )
             )
-        return FilterExpression()
+        return None
     
     def _build_order_by(self, order_config: Dict[str, Any]) -> OrderBy:
         """Build an OrderBy from configuration."""
-        order_by = OrderBy()
+        desc = bool(order_config.get('desc', False))
         
         if 'dimension' in order_config:
-            order_by.dimension = OrderBy.DimensionOrderBy(dimension_name=order_config['dimension'])
-        elif 'metric' in order_config:
-            order_by.metric = OrderBy.MetricOrderBy(metric_name=order_config['metric'])
-        
-        if order_config.get('desc', False):
-            order_by.desc = True
-        
-        return order_by
+            return OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name=order_config['dimension']), desc=desc)
+        if 'metric' in order_config:
+            return OrderBy(metric=OrderBy.MetricOrderBy(metric_name=order_config['metric']), desc=desc)
+        return OrderBy(desc=desc)
     
     def _convert_report_to_records(self, response, report_type: str) -> List[Dict[str, Any]]:
         """Convert GA4 API response to list of records."""
@@ -307,29 +894,50 @@ class GA4Connector(BaseAPIConnector):
         dimension_headers = [header.name for header in response.dimension_headers]
         metric_headers = [header.name for header in response.metric_headers]
         
-        # Process each row
+        # Metadata is the same for every row of a response
+        property_id = self.property_id
+        extracted_at = datetime.now().isoformat()
+        
+        # Process each row; zip stops at the shorter side, like the old bounds check
         for row in response.rows:
             record = {}
             
             # Add dimension values
-            for i, dim_value in enumerate(row.dimension_values):
-                if i < len(dimension_headers):
-                    record[dimension_headers[i]] = dim_value.value
+            for name, dim_value in zip(dimension_headers, row.dimension_values):
+                record[name] = dim_value.value
             
             # Add metric values
-            for i, metric_value in enumerate(row.metric_values):
-                if i < len(metric_headers):
-                    record[metric_headers[i]] = metric_value.value
+            for name, metric_value in zip(metric_headers, row.metric_values):
+                record[name] = metric_value.value
             
             # Add metadata
             record['_report_type'] = report_type
-            record['_property_id'] = self.property_id
-            record['_extracted_at'] = datetime.now().isoformat()
+            record['_property_id'] = property_id
+            record['_extracted_at'] = extracted_at
             
             records.append(record)
         
         return records
     
+    def _convert_report_to_columns(self, response) -> Dict[str, List[Any]]:
+        """Convert GA4 API response to a dict of column name -> list of values."""
+        dimension_headers = [header.name for header in response.dimension_headers]
+        metric_headers = [header.name for header in response.metric_headers]
+        n_rows = len(response.rows)
+        
+        dimension_columns = [[None] * n_rows for _ in dimension_headers]
+        metric_columns = [[None] * n_rows for _ in metric_headers]
+        
+        for i, row in enumerate(response.rows):
+            for column, dim_value in zip(dimension_columns, row.dimension_values):
+                column[i] = dim_value.value
+            for column, metric_value in zip(metric_columns, row.metric_values):
+                column[i] = metric_value.value
+        
+        columns = dict(zip(dimension_headers, dimension_columns))
+        columns.update(zip(metric_headers, metric_columns))
+        return columns
+    
     def fetch_schema(self, object_type: str = 'metadata') -> Dict[str, Any]:
         """Fetch the schema/metadata of GA4 property.
         
@@ -343,10 +951,16 @@ class GA4Connector(BaseAPIConnector):
             self.logger.error("Connection validation failed, cannot fetch schema")
             return {}
         
+        cache_key = self._schema_cache_key()
+        with self._schema_cache_lock:
+            cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
             request = GetMetadataRequest(name=f"{self.property_id}/metadata")
             self.handle_rate_limits()
-            metadata = self.client.get_metadata(request=request)
+            metadata = self.client.get_metadata(request=request, retry=_RPC_RETRY, timeout=_RPC_TIMEOUT)
             
             schema = {
                 'property_id': self.property_id,
@@ -374,12 +988,20 @@ class GA4Connector(BaseAPIConnector):
                     'deprecated': metric.deprecated
                 }
             
-            return schema
+            with self._schema_cache_lock:
+                self._schema_cache[cache_key] = schema
+            return copy.deepcopy(schema)
             
         except Exception as e:
             self.logger.error(f"Error fetching schema: {str(e)}")
+            self._check_auth_error(e)
             return {}
     
+    def _schema_cache_key(self) -> Tuple[str, str, str]:
+        """Schema cache key; the refresh token is hashed so it is not kept in the key."""
+        token_digest = hashlib.sha256((self.refresh_token or '').encode()).hexdigest()
+        return self.client_id or '', token_digest, self.property_id
+    
     def get_account_summaries(self) -> List[Dict[str, Any]]:
         """Get GA4 account summaries (requires Admin API access).
         
@@ -3,18 +3,463 @@ Google Ads API connector implementation.
 This module provides a connector for Google Ads APIs.
 """
 
+import asyncio
+import functools
 import logging
+import operator
+import re
+import threading
 import time
-import json
-from typing import Dict, List, Any, Optional, Tuple, Union
-import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+import grpc
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.errors import GoogleAdsException
-from google.oauth2.credentials import Credentials
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToDict
 from google.auth.transport.requests import Request
 
 from extractors.base.api_connector import BaseAPIConnector
+from extractors.base.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Default SELECT fields per object type
+_DEFAULT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'campaigns': (
+        'campaign.id', 'campaign.name', 'campaign.status', 'campaign.advertising_channel_type',
+        'campaign.start_date', 'campaign.end_date', 'campaign.campaign_budget'
+    ),
+    'ad_groups': (
+        'ad_group.id', 'ad_group.name', 'ad_group.status', 'ad_group.type',
+        'campaign.id', 'campaign.name'
+    ),
+    'ads': (
+        'ad_group_ad.ad.id', 'ad_group_ad.ad.name', 'ad_group_ad.status',
+        'ad_group_ad.ad.type', 'ad_group.id', 'campaign.id'
+    ),
+    'keywords': (
+        'ad_group_criterion.criterion_id', 'ad_group_criterion.keyword.text',
+        'ad_group_criterion.keyword.match_type', 'ad_group_criterion.status',
+        'ad_group.id', 'campaign.id'
+    ),
+    'campaign_performance': (
+        'campaign.id', 'campaign.name', 'segments.date',
+        'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
+        'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
+    ),
+    'ad_group_performance': (
+        'campaign.id', 'ad_group.id', 'ad_group.name', 'segments.date',
+        'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
+        'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
+    ),
+    'keyword_performance': (
+        'campaign.id', 'ad_group.id', 'ad_group_criterion.criterion_id',
+        'ad_group_criterion.keyword.text', 'segments.date',
+        'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
+        'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
+    ),
+}
+# FROM resource and base WHERE clause per object type. Performance reports
+# also filter on a segments.date range.
+_QUERY_SPECS: Dict[str, Tuple[str, str]] = {
+    'campaigns': ('campaign', "campaign.status != 'REMOVED'"),
+    'ad_groups': ('ad_group', "ad_group.status != 'REMOVED'"),
+    'ads': ('ad_group_ad', "ad_group_ad.status != 'REMOVED'"),
+    'keywords': ('keyword_view', "ad_group_criterion.status != 'REMOVED'"),
+    'campaign_performance': ('campaign', "campaign.status != 'REMOVED'"),
+    'ad_group_performance': ('ad_group', "ad_group.status != 'REMOVED'"),
+    'keyword_performance': ('keyword_view', "ad_group_criterion.status != 'REMOVED'"),
+}
+_DATE_RANGED = frozenset({'campaign_performance', 'ad_group_performance', 'keyword_performance'})
+
+# Static field schemas returned by fetch_schema
+_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'campaigns': {
+        'fields': {
+            'campaign.id': {'type': 'integer', 'description': 'Campaign ID'},
+            'campaign.name': {'type': 'string', 'description': 'Campaign name'},
+            'campaign.status': {'type': 'string', 'description': 'Campaign status'},
+            'campaign.advertising_channel_type': {'type': 'string', 'description': 'Channel type'},
+            'campaign.start_date': {'type': 'date', 'description': 'Start date'},
+            'campaign.end_date': {'type': 'date', 'description': 'End date'}
+        }
+    },
+    'campaign_performance': {
+        'fields': {
+            'campaign.id': {'type': 'integer', 'description': 'Campaign ID'},
+            'segments.date': {'type': 'date', 'description': 'Date'},
+            'metrics.impressions': {'type': 'integer', 'description': 'Impressions'},
+            'metrics.clicks': {'type': 'integer', 'description': 'Clicks'},
+            'metrics.cost_micros': {'type': 'integer', 'description': 'Cost in micros'},
+            'metrics.conversions': {'type': 'number', 'description': 'Conversions'},
+            'metrics.ctr': {'type': 'number', 'description': 'Click-through rate'},
+            'metrics.average_cpc': {'type': 'number', 'description': 'Average cost per click'}
+        }
+    }
+}
+
+# Date-ranged reports longer than this are split into shards that the async
+# path queries concurrently.
+SHARD_DAYS = 30
+
+_SELECT_RE = re.compile(r'SELECT\s+(.*?)\s+FROM\s', re.IGNORECASE | re.DOTALL)
+
+# Resources that may be queried in FROM. Fields in SELECT lists and WHERE
+# conditions are only checked by shape, so attributed resources (e.g.
+# bidding_strategy.name) can still be selected.
+_GAQL_RESOURCES = frozenset({
+    'campaign', 'campaign_budget', 'ad_group', 'ad_group_ad', 'ad_group_criterion',
+    'keyword_view', 'customer', 'metrics', 'segments'
+})
+_GAQL_KEYWORDS = frozenset({
+    'AND', 'IN', 'NOT', 'LIKE', 'IS', 'NULL', 'CONTAINS', 'ANY', 'ALL', 'NONE',
+    'BETWEEN', 'DURING', 'REGEXP_MATCH', 'TRUE', 'FALSE'
+})
+# Tokens after which a bare upper-case constant (enum value, date range) is a value
+_GAQL_COMPARISONS = frozenset({'=', '!=', '>', '>=', '<', '<=', 'DURING'})
+# Keywords that open a parenthesized value list
+_GAQL_LIST_OPERATORS = frozenset({'IN', 'ANY', 'ALL', 'NONE'})
+_GAQL_FIELD_RE = re.compile(r'[a-z][a-z0-9_]*(?:\.[a-z][a-z0-9_]*)+')
+_GAQL_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<op>!=|>=|<=|=|>|<|\(|\)|,)
+      | (?P<word>[A-Za-z_][A-Za-z0-9_.]*)
+    )""", re.VERBOSE)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Maximum concurrent get_customer calls when listing accessible customers
+_CUSTOMER_LOOKUP_WORKERS = 8
+
+# How a selected field's value is read off a row
+_SCALAR, _ENUM, _REPEATED, _MESSAGE = range(4)
+
+
+@functools.lru_cache(maxsize=256)
+def _check_field(field: str) -> str:
+    """Return a GAQL field name if it is shaped like resource.field, else raise ValueError."""
+    field = field.strip()
+    if not _GAQL_FIELD_RE.fullmatch(field):
+        raise ValueError(f"Field not allowed in GAQL query: {field!r}")
+    return field
+
+
+@functools.lru_cache(maxsize=256)
+def _check_condition(condition: str) -> str:
+    """Return a GAQL condition if every token is a field, literal, operator or keyword.
+    
+    Bare words must be GAQL keywords, or upper-case constants such as enum
+    values and LAST_30_DAYS in value position: right after a comparison or
+    DURING, or inside an IN (...) list. Clause keywords such as OR, ORDER BY
+    and LIMIT are therefore rejected wherever they appear.
+    
+    Raises:
+        ValueError: If the condition contains anything else
+    """
+    pos = 0
+    prev = None
+    in_list = False
+    condition = condition.strip()
+    while pos < len(condition):
+        match = _GAQL_TOKEN_RE.match(condition, pos)
+        if not match:
+            raise ValueError(f"Invalid GAQL condition near {condition[pos:pos + 20]!r}")
+        op = match.group('op')
+        word = match.group('word')
+        if op is not None:
+            if op == '(':
+                if prev not in _GAQL_LIST_OPERATORS:
+                    raise ValueError("Parentheses are only allowed around IN lists in GAQL conditions")
+                in_list = True
+            elif op in (')', ',') and not in_list:
+                raise ValueError(f"Unexpected {op!r} in GAQL condition")
+            elif op == ')':
+                in_list = False
+            token = op
+        elif word is not None:
+            if '.' in word:
+                _check_field(word)
+                token = 'FIELD'
+            elif word.upper() in _GAQL_KEYWORDS:
+                token = word.upper()
+            elif word.isupper() and (prev in _GAQL_COMPARISONS or in_list and prev in ('(', ',')):
+                token = 'CONSTANT'
+            else:
+                raise ValueError(f"Invalid GAQL condition token: {word!r}")
+        else:
+            token = 'LITERAL'
+        prev = token
+        pos = match.end()
+    if in_list:
+        raise ValueError("Unclosed IN list in GAQL condition")
+    return condition
+
+
+class GAQLBuilder:
+    """Builds GAQL queries from validated parts.
+    
+    Field names and conditions are checked against the allowed resources
+    before they are put into the query, and the checks are cached, so
+    repeated queries only pay for string joining.
+    
+    Example:
+        query = (GAQLBuilder().select(['campaign.id', 'metrics.clicks']).from_('campaign')
+                 .between('segments.date', '2024-01-01', '2024-01-31').build())
+    """
+    
+    def __init__(self):
+        self._fields: Tuple[str, ...] = ()
+        self._resource: Optional[str] = None
+        self._conditions: List[str] = []
+    
+    def select(self, fields) -> 'GAQLBuilder':
+        self._fields = tuple(_check_field(field) for field in fields)
+        return self
+    
+    def from_(self, resource: str) -> 'GAQLBuilder':
+        if resource not in _GAQL_RESOURCES:
+            raise ValueError(f"Resource not allowed in GAQL query: {resource!r}")
+        self._resource = resource
+        return self
+    
+    def where(self, condition: str) -> 'GAQLBuilder':
+        self._conditions.append(_check_condition(condition))
+        return self
+    
+    def between(self, field: str, start: str, end: str) -> 'GAQLBuilder':
+        for value in (start, end):
+            if not isinstance(value, str) or not _DATE_RE.fullmatch(value):
+                raise ValueError(f"Expected a YYYY-MM-DD date, got {value!r}")
+        self._conditions.append(f"{_check_field(field)} BETWEEN '{start}' AND '{end}'")
+        return self
+    
+    def build(self) -> str:
+        if not self._fields or self._resource is None:
+            raise ValueError("A GAQL query needs SELECT fields and a FROM resource")
+        query = f"SELECT {', '.join(self._fields)} FROM {self._resource}"
+        if self._conditions:
+            query += " WHERE " + " AND ".join(self._conditions)
+        return query
+
+
+def _split_date_range(start_date: str, end_date: str, shard_days: int = SHARD_DAYS) -> List[Tuple[str, str]]:
+    """Split an inclusive YYYY-MM-DD range into consecutive shards of at most shard_days.
+    
+    Ranges that cannot be parsed are returned unsplit.
+    """
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except (TypeError, ValueError):
+        return [(start_date, end_date)]
+    
+    shards = []
+    step = timedelta(days=shard_days)
+    while start + step <= end:
+        shard_end = start + step - timedelta(days=1)
+        shards.append((start.isoformat(), shard_end.isoformat()))
+        start = shard_end + timedelta(days=1)
+    shards.append((start.isoformat(), end.isoformat()))
+    return shards
+
+
+def _default_date_range(days: int = 30) -> Tuple[str, str]:
+    """Return (start_date, end_date) as YYYY-MM-DD strings for the last `days` days."""
+    end = datetime.now()
+    start = end - timedelta(days=days)
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_select_fields(query: str) -> Tuple[Tuple[str, ...], ...]:
+    """Return the dotted SELECT fields of a GAQL query as attribute paths."""
+    match = _SELECT_RE.search(query)
+    if not match:
+        return ()
+    return tuple(tuple(field.strip().split('.')) for field in match.group(1).split(',') if field.strip())
+
+
+@functools.lru_cache(maxsize=256)
+def _field_accessors(row_descriptor, field_paths: Tuple[Tuple[str, ...], ...]) -> Tuple[tuple, ...]:
+    """Resolve each field path against the row's proto descriptor once.
+    
+    Returns (getter, kind, enum_names, parents, leaf) tuples. getter is an
+    attrgetter for the dotted path, which walks the attribute chain in C;
+    enum_names maps enum numbers to names for enum fields; parents and leaf
+    locate the value in the nested record.
+    """
+    accessors = []
+    for path in field_paths:
+        descriptor = row_descriptor
+        for part in path[:-1]:
+            descriptor = descriptor.fields_by_name[part].message_type
+        field = descriptor.fields_by_name[path[-1]]
+        
+        enum_names = None
+        if field.label == FieldDescriptor.LABEL_REPEATED:
+            kind = _REPEATED
+        elif field.type == FieldDescriptor.TYPE_MESSAGE:
+            kind = _MESSAGE
+        elif field.enum_type is not None:
+            kind = _ENUM
+            enum_names = {value.number: value.name for value in field.enum_type.values}
+        else:
+            kind = _SCALAR
+        accessors.append((operator.attrgetter('.'.join(path)), kind, enum_names, path[:-1], path[-1]))
+    return tuple(accessors)
+
+
+def _convert_row(row, accessors: Tuple[tuple, ...]) -> Dict[str, Any]:
+    """Convert one row using accessors from _field_accessors."""
+    record = {}
+    for getter, kind, enum_names, parents, leaf in accessors:
+        value = getter(row)
+        
+        if kind == _ENUM:
+            value = enum_names.get(value, value)
+        elif kind == _REPEATED:
+            value = [MessageToDict(item, preserving_proto_field_name=True) if hasattr(item, 'DESCRIPTOR') else item
+                     for item in value]
+        elif kind == _MESSAGE:
+            value = MessageToDict(value, preserving_proto_field_name=True)
+        
+        target = record
+        for part in parents:
+            target = target.setdefault(part, {})
+        target[leaf] = value
+    
+    return record
+
+
+def _convert_batch(rows, field_paths: Tuple[Tuple[str, ...], ...],
+                   customer_id: Optional[str], extracted_at: str) -> List[Dict[str, Any]]:
+    """Convert a search_stream batch of rows to records.
+    
+    The accessors are resolved once per batch instead of once per row, and
+    the bookkeeping columns are added in the same pass.
+    """
+    if not rows:
+        return []
+    
+    records = []
+    append = records.append
+    if field_paths:
+        accessors = _field_accessors(rows[0].DESCRIPTOR, field_paths)
+        for row in rows:
+            record = _convert_row(row, accessors)
+            record['_customer_id'] = customer_id
+            record['_extracted_at'] = extracted_at
+            append(record)
+    else:
+        for row in rows:
+            record = MessageToDict(row, preserving_proto_field_name=True)
+            record['_customer_id'] = customer_id
+            record['_extracted_at'] = extracted_at
+            append(record)
+    return records
+
+
+# pyarrow type for each protobuf scalar type, used by fetch_data_arrow
+_ARROW_TYPES = {
+    FieldDescriptor.TYPE_DOUBLE: 'float64',
+    FieldDescriptor.TYPE_FLOAT: 'float64',
+    FieldDescriptor.TYPE_INT64: 'int64',
+    FieldDescriptor.TYPE_INT32: 'int64',
+    FieldDescriptor.TYPE_SINT64: 'int64',
+    FieldDescriptor.TYPE_SINT32: 'int64',
+    FieldDescriptor.TYPE_SFIXED64: 'int64',
+    FieldDescriptor.TYPE_SFIXED32: 'int64',
+    FieldDescriptor.TYPE_UINT32: 'int64',
+    FieldDescriptor.TYPE_FIXED32: 'int64',
+    FieldDescriptor.TYPE_UINT64: 'uint64',
+    FieldDescriptor.TYPE_FIXED64: 'uint64',
+    FieldDescriptor.TYPE_BOOL: 'bool_',
+    FieldDescriptor.TYPE_STRING: 'string',
+    FieldDescriptor.TYPE_BYTES: 'binary',
+    FieldDescriptor.TYPE_ENUM: 'string',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _arrow_type_names(row_descriptor, field_paths: Tuple[Tuple[str, ...], ...]) -> Tuple[Optional[str], ...]:
+    """Return the pyarrow type name of each selected field.
+    
+    GAQL dates are strings and map to date32. Message and repeated fields map
+    to None, leaving the type to pyarrow's inference.
+    """
+    type_names = []
+    for path in field_paths:
+        descriptor = row_descriptor
+        for part in path[:-1]:
+            descriptor = descriptor.fields_by_name[part].message_type
+        field = descriptor.fields_by_name[path[-1]]
+        
+        if field.label == FieldDescriptor.LABEL_REPEATED or field.type == FieldDescriptor.TYPE_MESSAGE:
+            type_names.append(None)
+        elif field.type == FieldDescriptor.TYPE_STRING and (path[-1] == 'date' or path[-1].endswith('_date')):
+            type_names.append('date32')
+        else:
+            type_names.append(_ARROW_TYPES.get(field.type))
+    return tuple(type_names)
+
+
+def _batch_to_arrow(pa, rows, field_paths: Tuple[Tuple[str, ...], ...]):
+    """Convert a search_stream batch of rows to a pyarrow RecordBatch, one column per field."""
+    descriptor = rows[0].DESCRIPTOR
+    accessors = _field_accessors(descriptor, field_paths)
+    type_names = _arrow_type_names(descriptor, field_paths)
+    
+    columns = []
+    for (getter, kind, enum_names, _, _), type_name in zip(accessors, type_names):
+        values = list(map(getter, rows))
+        if kind == _ENUM:
+            values = [enum_names.get(value, value) for value in values]
+        elif kind == _REPEATED:
+            values = [[MessageToDict(item, preserving_proto_field_name=True) if hasattr(item, 'DESCRIPTOR') else item
+                       for item in value] for value in values]
+        elif kind == _MESSAGE:
+            values = [MessageToDict(value, preserving_proto_field_name=True) for value in values]
+        
+        if type_name == 'date32':
+            # Unset dates come back as empty strings
+            columns.append(pa.array([value or None for value in values], pa.string()).cast(pa.date32()))
+        elif type_name is not None:
+            columns.append(pa.array(values, getattr(pa, type_name)()))
+        else:
+            columns.append(pa.array(values))
+    
+    return pa.RecordBatch.from_arrays(columns, names=['.'.join(path) for path in field_paths])
+
+
+def _add_derived_metrics(pa, table):
+    """Append currency-unit cost columns computed over whole Arrow columns.
+    
+    Adds metrics.cost (cost_micros / 1e6) when metrics.cost_micros is
+    selected, and metrics.cost_per_conversion (null where there are no
+    conversions) when metrics.conversions is selected too.
+    """
+    import pyarrow.compute as pc
+    
+    names = table.column_names
+    if 'metrics.cost_micros' not in names:
+        return table
+    
+    cost = pc.divide(table['metrics.cost_micros'].cast(pa.float64()), 1_000_000.0)
+    table = table.append_column('metrics.cost', cost)
+    
+    if 'metrics.conversions' in names:
+        conversions = table['metrics.conversions']
+        cost_per_conversion = pc.if_else(
+            pc.greater(conversions, 0),
+            pc.divide(cost, conversions),
+            pa.scalar(None, pa.float64())
+        )
+        table = table.append_column('metrics.cost_per_conversion', cost_per_conversion)
+    
+    return table
 
 
 class GoogleAdsConnector(BaseAPIConnector):
@@ -27,6 +472,29 @@ class GoogleAdsConnector(BaseAPIConnector):
         logger (logging.Logger): Logger for this connector
     """
     
+    # Clients shared by connectors with the same credentials, so each new
+    # connector reuses already-connected gRPC channels instead of paying the
+    # TLS and HTTP/2 setup again. Entries are [client, ga_service,
+    # customer_service, refcount, refresh_timer, last_used].
+    _client_pool: Dict[Tuple[Optional[str], ...], list] = {}
+    _client_pool_lock = threading.Lock()
+    
+    # Clients no connector holds stay pooled for this many seconds, so
+    # back-to-back requests reuse them, and are then closed.
+    POOL_IDLE_TIMEOUT = 300
+    
+    # Access tokens are refreshed by a background timer this many seconds
+    # before they expire, so no request has to wait on the OAuth round-trip.
+    TOKEN_REFRESH_MARGIN = 60
+    
+    # The background refresh stops once a pooled client has made no request
+    # for this many seconds; google-auth still refreshes on demand after that.
+    REFRESH_IDLE_TIMEOUT = 3600
+    
+    # A successful validation is trusted for this many seconds before the
+    # next one issues another get_customer call.
+    VALIDATION_TTL = 300
+    
     def __init__(self, credentials: Dict[str, Any], rate_limit_config: Optional[Dict[str, Any]] = None):
         """Initialize the Google Ads connector.
         
@@ -38,19 +506,30 @@ class GoogleAdsConnector(BaseAPIConnector):
         super().__init__(credentials, rate_limit_config)
         
         self.client = None
+        self._ga_service = None
+        self._customer_service = None
+        self._pool_key = None
+        self._pool_entry = None
+        self._last_validated_at = None
+        self._async_ga_service = None
+        self._async_loop = None
         self.customer_id = credentials.get('customer_id')
         self.developer_token = credentials.get('developer_token')
         self.client_id = credentials.get('client_id')
         self.client_secret = credentials.get('client_secret')
         self.refresh_token = credentials.get('refresh_token')
         self.access_token = credentials.get('access_token')
-        self.last_request_time = None
         self.request_count = 0
         self.max_retries = 3
         
-        # Google Ads API rate limits: 15,000 operations per day per developer token
+        # Google Ads API rate limits: 15,000 operations per day per developer token.
+        # Short bursts are allowed; the daily budget is spread evenly over the day.
         self.rate_limit_config.setdefault('operations_per_day', 15000)
-        self.rate_limit_config.setdefault('min_request_interval', 0.1)  # 100ms between requests
+        self.rate_limit_config.setdefault('burst', 20)
+        self._bucket = TokenBucket(
+            self.rate_limit_config['burst'],
+            self.rate_limit_config['operations_per_day'] / 86400
+        )
         
         # Remove dashes from customer ID if present
         if self.customer_id:
@@ -63,17 +542,56 @@ class GoogleAdsConnector(BaseAPIConnector):
             bool: True if authentication was successful, False otherwise
         """
         try:
-            # Create Google Ads client configuration
-            config = {
-                'developer_token': self.developer_token,
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-                'refresh_token': self.refresh_token,
-                'use_proto_plus': True
-            }
+            pool_key = (self.developer_token, self.client_id, self.client_secret, self.refresh_token)
+            with self._client_pool_lock:
+                evicted = self._evict_idle_clients()
+                entry = self._client_pool.get(pool_key)
+                if entry is not None:
+                    self._adopt_entry(pool_key, entry)
+            self._close_entries(evicted)
+            
+            if entry is None:
+                # Create Google Ads client configuration
+                config = {
+                    'developer_token': self.developer_token,
+                    'client_id': self.client_id,
+                    'client_secret': self.client_secret,
+                    'refresh_token': self.refresh_token,
+                    # Raw protobuf messages are much cheaper to read than proto-plus
+                    # wrappers when materializing many rows.
+                    'use_proto_plus': False
+                }
+                
+                # Initialize Google Ads client and the service clients it is used
+                # through. This exchanges the refresh token, so it runs outside
+                # the pool lock.
+                client = GoogleAdsClient.load_from_dict(config)
+                new_entry = [
+                    client,
+                    client.get_service("GoogleAdsService"),
+                    client.get_service("CustomerService"),
+                    1,
+                    None,
+                    time.monotonic()
+                ]
+                with self._client_pool_lock:
+                    entry = self._client_pool.get(pool_key)
+                    if entry is None:
+                        entry = self._client_pool[pool_key] = new_entry
+                        self._schedule_refresh(pool_key, entry)
+                    else:
+                        self._adopt_entry(pool_key, entry)
+                if entry is not new_entry:
+                    # Another connector pooled a client for these credentials first
+                    self._close_entries([new_entry])
             
-            # Initialize Google Ads client
-            self.client = GoogleAdsClient.load_from_dict(config)
+            if self._pool_key is not None and self._pool_key != pool_key:
+                self._release_client()
+            self._pool_key = pool_key
+            self._pool_entry = entry
+            self._last_validated_at = None
+            self.client, self._ga_service, self._customer_service = entry[0], entry[1], entry[2]
+            self._close_async_service()
             self.logger.info("Successfully authenticated with Google Ads API")
             return True
             
@@ -81,6 +599,139 @@ class GoogleAdsConnector(BaseAPIConnector):
             self.logger.error(f"Authentication failed: {str(e)}")
             return False
     
+    def close(self):
+        """Release the pooled client and close any open sessions."""
+        super().close()
+        self._release_client()
+    
+    def _release_client(self):
+        """Drop this connector's reference to its pooled client.
+        
+        Unused clients stay pooled until they have been idle for POOL_IDLE_TIMEOUT.
+        """
+        if self._pool_key is None:
+            return
+        self._close_async_service()
+        with self._client_pool_lock:
+            entry = self._client_pool.get(self._pool_key)
+            if entry is not None:
+                entry[3] -= 1
+                if entry[3] <= 0:
+                    entry[5] = time.monotonic()
+                    if entry[4] is not None:
+                        entry[4].cancel()
+                        entry[4] = None
+            evicted = self._evict_idle_clients()
+        self._close_entries(evicted)
+        self._pool_key = None
+        self._pool_entry = None
+        self._last_validated_at = None
+        self.client = None
+        self._ga_service = None
+        self._customer_service = None
+    
+    def _adopt_entry(self, pool_key: Tuple[Optional[str], ...], entry: list):
+        """Take a reference to an already pooled client.
+        
+        Must be called with _client_pool_lock held.
+        """
+        if self._pool_key != pool_key:
+            entry[3] += 1
+        entry[5] = time.monotonic()
+        if entry[4] is None:
+            self._schedule_refresh(pool_key, entry)
+    
+    @classmethod
+    def _evict_idle_clients(cls) -> List[list]:
+        """Remove pooled clients that no connector has used for POOL_IDLE_TIMEOUT.
+        
+        Must be called with _client_pool_lock held. The removed entries are
+        returned for _close_entries, so channels are closed after the lock
+        is released.
+        """
+        now = time.monotonic()
+        evicted = []
+        for key, entry in list(cls._client_pool.items()):
+            if entry[3] <= 0 and now - entry[5] > cls.POOL_IDLE_TIMEOUT:
+                del cls._client_pool[key]
+                evicted.append(entry)
+        return evicted
+    
+    @staticmethod
+    def _close_entries(entries: List[list]):
+        """Close the gRPC channels of pool entries that are no longer pooled."""
+        for entry in entries:
+            entry[1].transport.close()
+            entry[2].transport.close()
+    
+    def _close_async_service(self):
+        """Close the async GoogleAdsService channel.
+        
+        The channel is bound to the event loop it was created on, so it is
+        closed on that loop; if the loop has already been closed there is
+        nothing left to run the close on and the channel is just dropped.
+        """
+        service, loop = self._async_ga_service, self._async_loop
+        self._async_ga_service = None
+        self._async_loop = None
+        if service is None:
+            return
+        closing = service.transport.close()
+        if not asyncio.iscoroutine(closing):
+            return
+        if loop.is_closed():
+            closing.close()
+        elif not loop.is_running():
+            loop.run_until_complete(closing)
+        else:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                loop.create_task(closing)
+            else:
+                asyncio.run_coroutine_threadsafe(closing, loop)
+    
+    @classmethod
+    def _schedule_refresh(cls, pool_key: Tuple[Optional[str], ...], entry: list):
+        """Start a timer that refreshes the pooled client's token shortly before it expires.
+        
+        Must be called with _client_pool_lock held. The timer holds only the
+        class and the pool entry, so it never keeps a connector instance alive.
+        """
+        creds = entry[0].credentials
+        if creds is None or creds.expiry is None:
+            return
+        delay = max((creds.expiry - datetime.utcnow()).total_seconds() - cls.TOKEN_REFRESH_MARGIN, 0)
+        timer = threading.Timer(delay, cls._refresh_credentials, args=(pool_key, entry))
+        timer.daemon = True
+        entry[4] = timer
+        timer.start()
+    
+    @classmethod
+    def _refresh_credentials(cls, pool_key: Tuple[Optional[str], ...], entry: list):
+        # Only keep refreshing for clients that are still in use
+        with cls._client_pool_lock:
+            if (cls._client_pool.get(pool_key) is not entry or entry[3] <= 0
+                    or time.monotonic() - entry[5] > cls.REFRESH_IDLE_TIMEOUT):
+                entry[4] = None
+                return
+        
+        try:
+            entry[0].credentials.refresh(Request())
+            logger.info("Access token refreshed in background")
+        except Exception as e:
+            # The client still refreshes on demand if the token expires
+            logger.error(f"Background token refresh failed: {str(e)}")
+            return
+        
+        with cls._client_pool_lock:
+            if cls._client_pool.get(pool_key) is entry:
+                cls._schedule_refresh(pool_key, entry)
+            else:
+                entry[4] = None
+    
     def validate_connection(self) -> bool:
         """Validate the connection to Google Ads API.
         
@@ -90,13 +741,16 @@ class GoogleAdsConnector(BaseAPIConnector):
         if not self.client:
             return self.authenticate()
         
+        if self._last_validated_at is not None and time.monotonic() - self._last_validated_at < self.VALIDATION_TTL:
+            return True
+        
         try:
             # Try to get customer info to validate connection
-            customer_service = self.client.get_service("CustomerService")
-            customer = customer_service.get_customer(
+            customer = self._customer_service.get_customer(
                 resource_name=f"customers/{self.customer_id}"
             )
             
+            self._last_validated_at = time.monotonic()
             self.logger.info(f"Connection valid for customer: {customer.descriptive_name}")
             return True
             
@@ -107,23 +761,34 @@ class GoogleAdsConnector(BaseAPIConnector):
             self.logger.error(f"Connection validation error: {str(e)}")
             return False
     
+    def _check_auth_error(self, error: Exception):
+        """Force a fresh validation probe after an auth or permission error."""
+        if isinstance(error, GoogleAdsException) and error.error.code() in (
+                grpc.StatusCode.UNAUTHENTICATED, grpc.StatusCode.PERMISSION_DENIED):
+            self._last_validated_at = None
+    
     def handle_rate_limits(self):
         """Handle Google Ads API rate limits.
         
-        Google Ads API has daily operation limits and request rate limits.
+        Google Ads API has daily operation limits and request rate limits,
+        enforced here with a token bucket.
         """
-        current_time = datetime.now()
-        
-        if self.last_request_time:
-            elapsed = (current_time - self.last_request_time).total_seconds()
-            min_interval = self.rate_limit_config.get('min_request_interval', 0.1)
-            
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.3f} seconds")
-                time.sleep(sleep_time)
+        sleep_time = self._bucket.consume()
+        self._record_request(sleep_time)
+    
+    async def ahandle_rate_limits(self):
+        """Async counterpart of handle_rate_limits that yields to the event loop."""
+        sleep_time = await self._bucket.aconsume()
+        self._record_request(sleep_time)
+    
+    def _record_request(self, sleep_time: float):
+        """Count a request that has passed the rate limiter."""
+        if self._pool_entry is not None:
+            # Marks the pooled client as in use for the background refresh
+            self._pool_entry[5] = time.monotonic()
+        if sleep_time > 0:
+            self.logger.debug(f"Rate limiting: slept for {sleep_time:.3f} seconds")
         
-        self.last_request_time = current_time
         self.request_count += 1
         
         # Log progress for large operations
@@ -153,254 +818,302 @@ class GoogleAdsConnector(BaseAPIConnector):
         query_params = query_params or {}
         
         try:
-            records = []
-            
-            if object_type == 'campaigns':
-                records = self._fetch_campaigns(query_params)
-            elif object_type == 'ad_groups':
-                records = self._fetch_ad_groups(query_params)
-            elif object_type == 'ads':
-                records = self._fetch_ads(query_params)
-            elif object_type == 'keywords':
-                records = self._fetch_keywords(query_params)
-            elif object_type == 'campaign_performance':
-                records = self._fetch_campaign_performance(query_params)
-            elif object_type == 'ad_group_performance':
-                records = self._fetch_ad_group_performance(query_params)
-            elif object_type == 'keyword_performance':
-                records = self._fetch_keyword_performance(query_params)
-            else:
+            if object_type not in _QUERY_SPECS:
                 self.logger.error(f"Unsupported object type: {object_type}")
                 return []
             
+            records = list(self._fetch(object_type, query_params))
+            
             self.logger.info(f"Successfully fetched {len(records)} {object_type} records")
             return records
             
         except GoogleAdsException as e:
             self.logger.error(f"Google Ads API error: {e}")
+            self._check_auth_error(e)
             return []
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
             return []
     
-    def _fetch_campaigns(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch campaign data."""
-        fields = query_params.get('fields', [
-            'campaign.id', 'campaign.name', 'campaign.status', 'campaign.advertising_channel_type',
-            'campaign.start_date', 'campaign.end_date', 'campaign.campaign_budget'
-        ])
-        
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM campaign
-            WHERE campaign.status != 'REMOVED'
+    def fetch_data_stream(self,
+                          object_type: str,
+                          query_params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Fetch data from Google Ads API one record at a time.
+        
+        Rows are converted as they arrive from search_stream and never
+        collected into a list, so memory use does not grow with the size of
+        the report. Errors are logged and end the stream.
+        
+        Args:
+            object_type: Type of object to fetch, as accepted by fetch_data
+            query_params: Optional parameters for the query, as for fetch_data
+            
+        Yields:
+            Record dictionaries
         """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
+        if object_type not in _QUERY_SPECS:
+            self.logger.error(f"Unsupported object type: {object_type}")
+            return
         
-        return self._execute_query(query)
+        try:
+            yield from self._fetch(object_type, query_params or {})
+        except GoogleAdsException as e:
+            self.logger.error(f"Google Ads API error: {e}")
+            self._check_auth_error(e)
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
     
-    def _fetch_ad_groups(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch ad group data."""
-        fields = query_params.get('fields', [
-            'ad_group.id', 'ad_group.name', 'ad_group.status', 'ad_group.type',
-            'campaign.id', 'campaign.name'
-        ])
+    def fetch_data_arrow(self,
+                         object_type: str,
+                         query_params: Optional[Dict[str, Any]] = None):
+        """Fetch data from Google Ads API as a pyarrow Table.
+        
+        Each search_stream batch is converted column by column into a typed
+        Arrow record batch, so no per-row dictionaries are built. Columns are
+        named by the dotted GAQL field ('metrics.clicks') and typed from the
+        row's proto schema: integers as int64, doubles as float64, enums as
+        their names and dates as date32. Selecting metrics.cost_micros also
+        adds metrics.cost (and metrics.cost_per_conversion when conversions
+        are selected), computed with vectorized pyarrow.compute kernels.
+        _customer_id and _extracted_at columns are appended.
         
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM ad_group
-            WHERE ad_group.status != 'REMOVED'
+        Args:
+            object_type: Type of object to fetch, as accepted by fetch_data
+            query_params: Optional parameters for the query, as for fetch_data
+            
+        Returns:
+            pyarrow.Table with the fetched data; empty on error
+            
+        Raises:
+            ImportError: If pyarrow is not installed
         """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("fetch_data_arrow requires pyarrow") from e
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return pa.table({})
         
-        return self._execute_query(query)
-    
-    def _fetch_ads(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch ad data."""
-        fields = query_params.get('fields', [
-            'ad_group_ad.ad.id', 'ad_group_ad.ad.name', 'ad_group_ad.status',
-            'ad_group_ad.ad.type', 'ad_group.id', 'campaign.id'
-        ])
+        if object_type not in _QUERY_SPECS:
+            self.logger.error(f"Unsupported object type: {object_type}")
+            return pa.table({})
         
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM ad_group_ad
-            WHERE ad_group_ad.status != 'REMOVED'
-        """
+        try:
+            query = self._build_query(object_type, query_params or {})
+            field_paths = _parse_select_fields(query)
+            extracted_at = datetime.now(timezone.utc).isoformat()
+            if field_paths:
+                # Message and repeated columns are inferred per batch, so one
+                # batch may hold list<null> where the next holds list<string>;
+                # concatenate with permissive promotion rather than from_batches
+                tables = [pa.Table.from_batches([_batch_to_arrow(pa, rows, field_paths)])
+                          for rows in self._iter_batches(query) if rows]
+                table = pa.concat_tables(tables, promote_options='permissive') if tables else pa.table({})
+            else:
+                table = pa.Table.from_pylist(list(self._iter_query(query)))
+            
+            if field_paths and table.num_rows:
+                table = _add_derived_metrics(pa, table)
+                table = table.append_column('_customer_id', pa.array([self.customer_id] * table.num_rows, pa.string()))
+                table = table.append_column('_extracted_at', pa.array([extracted_at] * table.num_rows, pa.string()))
+            
+            self.logger.info(f"Successfully fetched {table.num_rows} {object_type} records")
+            return table
+            
+        except GoogleAdsException as e:
+            self.logger.error(f"Google Ads API error: {e}")
+            self._check_auth_error(e)
+            return pa.table({})
+        except pa.ArrowException as e:
+            self.logger.error(f"Could not build Arrow table for {object_type}: {e}")
+            return pa.table({})
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            return pa.table({})
+    
+    async def fetch_data_async(self,
+                               object_types: List[str],
+                               query_params_by_type: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch several object types concurrently with the async GoogleAdsService.
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
-        
-        return self._execute_query(query)
-    
-    def _fetch_keywords(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch keyword data."""
-        fields = query_params.get('fields', [
-            'ad_group_criterion.criterion_id', 'ad_group_criterion.keyword.text',
-            'ad_group_criterion.keyword.match_type', 'ad_group_criterion.status',
-            'ad_group.id', 'campaign.id'
-        ])
-        
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM keyword_view
-            WHERE ad_group_criterion.status != 'REMOVED'
+        Args:
+            object_types: Object types to fetch, as accepted by fetch_data
+            query_params_by_type: Optional query parameters per object type
+            
+        Returns:
+            Dictionary mapping each object type to its records; object types
+            that fail map to an empty list
         """
+        if not await asyncio.to_thread(self.validate_connection):
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return {object_type: [] for object_type in object_types}
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
+        query_params_by_type = query_params_by_type or {}
+        # Bounds the number of in-flight queries across all object types and shards
+        semaphore = asyncio.Semaphore(self.rate_limit_config.get('max_concurrent', 4))
+        results = await asyncio.gather(
+            *(self._fetch_async(object_type, query_params_by_type.get(object_type) or {}, semaphore)
+              for object_type in object_types),
+            return_exceptions=True
+        )
         
-        return self._execute_query(query)
+        records_by_type = {}
+        for object_type, result in zip(object_types, results):
+            if isinstance(result, GoogleAdsException):
+                self.logger.error(f"Google Ads API error: {result}")
+                self._check_auth_error(result)
+                result = []
+            elif isinstance(result, BaseException):
+                self.logger.error(f"Error fetching data: {str(result)}")
+                result = []
+            else:
+                self.logger.info(f"Successfully fetched {len(result)} {object_type} records")
+            records_by_type[object_type] = result
+        return records_by_type
     
-    def _fetch_campaign_performance(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch campaign performance data."""
-        fields = query_params.get('fields', [
-            'campaign.id', 'campaign.name', 'segments.date',
-            'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
-            'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
-        ])
+    async def _fetch_async(self,
+                           object_type: str,
+                           query_params: Dict[str, Any],
+                           semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Build and run the GAQL query for an object type.
         
-        date_range = query_params.get('date_range', {})
-        start_date = date_range.get('start_date', (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))
-        end_date = date_range.get('end_date', datetime.now().strftime('%Y-%m-%d'))
-        
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM campaign
-            WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-            AND campaign.status != 'REMOVED'
+        Date-ranged reports spanning more than SHARD_DAYS are split into
+        per-shard queries that run concurrently; their rows are concatenated
+        in date order.
         """
+        if object_type not in _QUERY_SPECS:
+            raise ValueError(f"Unsupported object type: {object_type}")
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
+        if object_type in _DATE_RANGED:
+            shards = _split_date_range(*self._date_range(query_params))
+        else:
+            shards = [None]
         
-        return self._execute_query(query)
+        if len(shards) == 1:
+            queries = [self._build_query(object_type, query_params)]
+        else:
+            self.logger.debug(f"Splitting {object_type} query into {len(shards)} date shards")
+            queries = [
+                self._build_query(object_type, dict(query_params, date_range={'start_date': start, 'end_date': end}))
+                for start, end in shards
+            ]
+        
+        async def run(query: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._execute_query_async(query)
+        
+        results = await asyncio.gather(*(run(query) for query in queries))
+        if len(results) == 1:
+            return results[0]
+        return [record for records in results for record in records]
+    
+    def _get_async_ga_service(self):
+        """Return the async GoogleAdsService client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_ga_service is None or self._async_loop is not loop:
+            self._close_async_service()
+            self._async_ga_service = self.client.get_service("GoogleAdsService", is_async=True)
+            self._async_loop = loop
+        return self._async_ga_service
     
-    def _fetch_ad_group_performance(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch ad group performance data."""
-        fields = query_params.get('fields', [
-            'campaign.id', 'ad_group.id', 'ad_group.name', 'segments.date',
-            'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
-            'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
-        ])
+    async def _execute_query_async(self, query: str) -> List[Dict[str, Any]]:
+        """Async version of _iter_query that collects the records into a list."""
+        await self.ahandle_rate_limits()
         
-        date_range = query_params.get('date_range', {})
-        start_date = date_range.get('start_date', (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))
-        end_date = date_range.get('end_date', datetime.now().strftime('%Y-%m-%d'))
-        
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM ad_group
-            WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-            AND ad_group.status != 'REMOVED'
-        """
+        ga_service = self._get_async_ga_service()
+        stream = await ga_service.search_stream(customer_id=self.customer_id, query=query)
         
-        conditions = query_params.get('conditions')
-        if conditions:
-            query += f" AND {conditions}"
+        field_paths = _parse_select_fields(query)
+        customer_id = self.customer_id
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        
+        records = []
+        async for batch in stream:
+            records.extend(_convert_batch(batch.results, field_paths, customer_id, extracted_at))
         
-        return self._execute_query(query)
+        return records
+    
+    def _fetch(self, object_type: str, query_params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Build and run the GAQL query for an object type."""
+        return self._iter_query(self._build_query(object_type, query_params))
     
-    def _fetch_keyword_performance(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Fetch keyword performance data."""
-        fields = query_params.get('fields', [
-            'campaign.id', 'ad_group.id', 'ad_group_criterion.criterion_id',
-            'ad_group_criterion.keyword.text', 'segments.date',
-            'metrics.impressions', 'metrics.clicks', 'metrics.cost_micros',
-            'metrics.conversions', 'metrics.ctr', 'metrics.average_cpc'
-        ])
+    def _build_query(self, object_type: str, query_params: Dict[str, Any]) -> str:
+        """Build the GAQL query for an object type.
         
-        date_range = query_params.get('date_range', {})
-        start_date = date_range.get('start_date', (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))
-        end_date = date_range.get('end_date', datetime.now().strftime('%Y-%m-%d'))
-        
-        query = f"""
-            SELECT {', '.join(fields)}
-            FROM keyword_view
-            WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
-            AND ad_group_criterion.status != 'REMOVED'
+        Raises:
+            ValueError: If fields, conditions or dates fail validation
         """
+        resource, base_condition = _QUERY_SPECS[object_type]
+        fields = query_params.get('fields')
+        builder = GAQLBuilder().select(fields if fields is not None else _DEFAULT_FIELDS[object_type]).from_(resource)
+        
+        if object_type in _DATE_RANGED:
+            start_date, end_date = self._date_range(query_params)
+            builder.between('segments.date', start_date, end_date)
+        builder.where(base_condition)
         
         conditions = query_params.get('conditions')
         if conditions:
-            query += f" AND {conditions}"
+            builder.where(conditions)
         
-        return self._execute_query(query)
+        return builder.build()
+    
+    def _date_range(self, query_params: Dict[str, Any]) -> Tuple[str, str]:
+        """Return the (start_date, end_date) of a report, defaulting to the last 30 days."""
+        date_range = query_params.get('date_range', {})
+        start_date = date_range.get('start_date')
+        end_date = date_range.get('end_date')
+        if start_date is None or end_date is None:
+            default_start, default_end = _default_date_range()
+            start_date = start_date or default_start
+            end_date = end_date or default_end
+        return start_date, end_date
     
-    def _execute_query(self, query: str) -> List[Dict[str, Any]]:
-        """Execute a Google Ads Query Language (GAQL) query."""
+    def _iter_batches(self, query: str):
+        """Execute a Google Ads Query Language (GAQL) query, yielding the rows of each stream batch."""
         self.handle_rate_limits()
         
-        ga_service = self.client.get_service("GoogleAdsService")
-        
         try:
-            response = ga_service.search(
+            # search_stream returns every row over a single streaming RPC
+            # instead of one round-trip per result page.
+            response = self._ga_service.search_stream(
                 customer_id=self.customer_id,
                 query=query
             )
             
-            records = []
-            for row in response:
-                record = self._convert_row_to_dict(row)
-                record['_customer_id'] = self.customer_id
-                record['_extracted_at'] = datetime.now().isoformat()
-                records.append(record)
-            
-            return records
+            for batch in response:
+                yield batch.results
             
         except GoogleAdsException as e:
             self.logger.error(f"Query execution failed: {e}")
             raise
     
-    def _convert_row_to_dict(self, row) -> Dict[str, Any]:
-        """Convert a Google Ads API row to a dictionary."""
-        record = {}
-        
-        # Handle different field types
-        for field_name in dir(row):
-            if field_name.startswith('_'):
-                continue
-                
-            field_value = getattr(row, field_name)
-            
-            # Skip empty proto messages
-            if hasattr(field_value, 'DESCRIPTOR') and not field_value.ListFields():
-                continue
-            
-            # Convert proto messages to dictionaries
-            if hasattr(field_value, 'DESCRIPTOR'):
-                record[field_name] = self._proto_to_dict(field_value)
-            else:
-                record[field_name] = field_value
+    def _iter_query(self, query: str) -> Iterator[Dict[str, Any]]:
+        """Execute a GAQL query, yielding one record per row."""
+        field_paths = _parse_select_fields(query)
+        customer_id = self.customer_id
+        extracted_at = datetime.now(timezone.utc).isoformat()
         
-        return record
+        for rows in self._iter_batches(query):
+            yield from _convert_batch(rows, field_paths, customer_id, extracted_at)
     
-    def _proto_to_dict(self, proto_obj) -> Dict[str, Any]:
-        """Convert a protobuf object to a dictionary."""
-        result = {}
+    def _convert_row_to_dict(self, row, field_paths: Tuple[Tuple[str, ...], ...] = ()) -> Dict[str, Any]:
+        """Convert a Google Ads API row to a dictionary.
         
-        for field, value in proto_obj.ListFields():
-            if field.type == field.TYPE_MESSAGE:
-                if field.label == field.LABEL_REPEATED:
-                    result[field.name] = [self._proto_to_dict(item) for item in value]
-                else:
-                    result[field.name] = self._proto_to_dict(value)
-            else:
-                if field.label == field.LABEL_REPEATED:
-                    result[field.name] = list(value)
-                else:
-                    result[field.name] = value
-        
-        return result
+        Selected fields are read with fixed attribute chains and nested by
+        resource, e.g. {'campaign': {'id': 123, 'status': 'ENABLED'}}. Enums
+        are returned by name. Without field_paths the whole row is converted
+        with MessageToDict.
+        """
+        if not field_paths:
+            return MessageToDict(row, preserving_proto_field_name=True)
+        return _convert_row(row, _field_accessors(row.DESCRIPTOR, field_paths))
     
     def fetch_schema(self, object_type: str) -> Dict[str, Any]:
         """Fetch the schema of a Google Ads object.
@@ -411,35 +1124,10 @@ class GoogleAdsConnector(BaseAPIConnector):
         Returns:
             Dictionary containing the schema information
         """
-        schemas = {
-            'campaigns': {
-                'fields': {
-                    'campaign.id': {'type': 'integer', 'description': 'Campaign ID'},
-                    'campaign.name': {'type': 'string', 'description': 'Campaign name'},
-                    'campaign.status': {'type': 'string', 'description': 'Campaign status'},
-                    'campaign.advertising_channel_type': {'type': 'string', 'description': 'Channel type'},
-                    'campaign.start_date': {'type': 'date', 'description': 'Start date'},
-                    'campaign.end_date': {'type': 'date', 'description': 'End date'}
-                }
-            },
-            'campaign_performance': {
-                'fields': {
-                    'campaign.id': {'type': 'integer', 'description': 'Campaign ID'},
-                    'segments.date': {'type': 'date', 'description': 'Date'},
-                    'metrics.impressions': {'type': 'integer', 'description': 'Impressions'},
-                    'metrics.clicks': {'type': 'integer', 'description': 'Clicks'},
-                    'metrics.cost_micros': {'type': 'integer', 'description': 'Cost in micros'},
-                    'metrics.conversions': {'type': 'number', 'description': 'Conversions'},
-                    'metrics.ctr': {'type': 'number', 'description': 'Click-through rate'},
-                    'metrics.average_cpc': {'type': 'number', 'description': 'Average cost per click'}
-                }
-            }
-        }
-        
         return {
             'object_type': object_type,
             'customer_id': self.customer_id,
-            'schema': schemas.get(object_type, {}),
+            'schema': _SCHEMAS.get(object_type, {}),
             'timestamp': datetime.now().isoformat()
         }
     
@@ -453,24 +1141,28 @@ class GoogleAdsConnector(BaseAPIConnector):
             return []
         
         try:
-            customer_service = self.client.get_service("CustomerService")
+            customer_service = self._customer_service
             accessible_customers = customer_service.list_accessible_customers()
             
-            customers = []
-            for customer_resource in accessible_customers.resource_names:
+            def get_details(customer_resource: str) -> Optional[Dict[str, Any]]:
                 customer_id = customer_resource.split('/')[-1]
-                
                 try:
                     customer = customer_service.get_customer(resource_name=customer_resource)
-                    customers.append({
+                    return {
                         'customer_id': customer_id,
                         'descriptive_name': customer.descriptive_name,
                         'currency_code': customer.currency_code,
                         'time_zone': customer.time_zone,
                         'manager': customer.manager
-                    })
+                    }
                 except Exception as e:
                     self.logger.warning(f"Could not get details for customer {customer_id}: {e}")
+                    return None
+            
+            # Look customers up concurrently; results keep the listing order
+            resource_names = list(accessible_customers.resource_names)
+            with ThreadPoolExecutor(max_workers=min(_CUSTOMER_LOOKUP_WORKERS, len(resource_names) or 1)) as executor:
+                customers = [customer for customer in executor.map(get_details, resource_names) if customer]
             
             return customers
             
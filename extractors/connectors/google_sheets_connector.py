@@ -3,7 +3,9 @@ Google Sheets API connector implementation.
 This module provides a connector for Google Sheets APIs.
 """
 
+import functools
 import logging
+import re
 import time
 import json
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -11,10 +13,94 @@ import requests
 from datetime import datetime, timedelta
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
 
-from extractors.base.api_connector import BaseAPIConnector
+from extractors.base.api_connector import BaseAPIConnector, PooledSession
+from extractors.base.rate_limiter import TokenBucket
+
+# Matches googleapiclient's default socket timeout
+_HTTP_TIMEOUT = 60
+
+# CSV export of a single sheet, used by fetch_data_bulk
+_EXPORT_URL = 'https://docs.google.com/spreadsheets/d/{}/export'
+
+# Spreadsheet metadata needed by fetch_data, fetch_schema and get_spreadsheet_info
+_METADATA_FIELDS = (
+    'properties(title,locale,timeZone),'
+    'sheets.properties(title,sheetId,index,sheetType,gridProperties(rowCount,columnCount))'
+)
+
+# A1 cell range without the sheet prefix: A1, A1:C10, A:C, 2:5, A2:C, with
+# optional $ before columns and rows as in absolute references ($A$1:$C$10)
+_A1_CELL = r'(?:\$?[A-Za-z]{1,3}(?:\$?[0-9]+)?|\$?[0-9]+)'
+_A1_RANGE = re.compile(f'{_A1_CELL}(?::{_A1_CELL})?')
+
+
+def _column_letter(n: int) -> str:
+    """Convert column number to letter (1 -> A, 26 -> Z, 27 -> AA, etc.)."""
+    result = ""
+    while n > 0:
+        n -= 1
+        result = chr(n % 26 + ord('A')) + result
+        n //= 26
+    return result
+
+
+# Column letters for every column a sheet can have (A..ZZZ), indexed from 0
+_COL_LETTERS = [_column_letter(n) for n in range(1, 18279)]
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_doc() -> str:
+    """Return the Sheets v4 discovery document bundled with googleapiclient.
+
+    build() reads it from disk on every call; connectors are created per
+    request, so it is read once per process instead.
+    """
+    return discovery_cache.get_static_doc('sheets', 'v4')
+
+
+class _SessionHttp:
+    """httplib2.Http stand-in that sends requests through a PooledSession.
+    
+    googleapiclient and google_auth_httplib2 only call request(), so routing
+    it through a PooledSession lets Sheets calls reuse the keep-alive
+    connections in SHARED_HTTP_ADAPTER, across connector instances, instead
+    of each connector's httplib2.Http opening its own TLS connections.
+    
+    Requests rejected with 429 and a Retry-After header are retried after
+    the delay the API asked for.
+    """
+    
+    def __init__(self, session: requests.Session, timeout: float = _HTTP_TIMEOUT, max_retries: int = 3):
+        self.session = session
+        self.timeout = timeout
+        self.max_retries = max_retries
+    
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=httplib2.DEFAULT_MAX_REDIRECTS, connection_type=None):
+        for _ in range(self.max_retries + 1):
+            response = self.session.request(
+                method, uri, data=body, headers=headers, timeout=self.timeout,
+                allow_redirects=redirections > 0
+            )
+            retry_after = response.headers.get('Retry-After')
+            if response.status_code != 429 or not retry_after or not retry_after.isdigit():
+                break
+            time.sleep(int(retry_after))
+        info = {key.lower(): value for key, value in response.headers.items()}
+        # requests has already decoded the body
+        info.pop('content-encoding', None)
+        info['status'] = response.status_code
+        info['reason'] = response.reason
+        return httplib2.Response(info), response.content
 
 
 class GoogleSheetsConnector(BaseAPIConnector):
@@ -39,6 +125,8 @@ class GoogleSheetsConnector(BaseAPIConnector):
         super().__init__(credentials, rate_limit_config)
         
         self.service = None
+        self._creds = None
+        self._metadata_cache: TTLCache = TTLCache(maxsize=128, ttl=300)
         self.access_token = credentials.get('access_token')
         self.refresh_token = credentials.get('refresh_token')
         self.client_id = credentials.get('client_id')
@@ -49,7 +137,11 @@ class GoogleSheetsConnector(BaseAPIConnector):
         
         # Google Sheets API has a quota of 100 requests per 100 seconds per user
         self.rate_limit_config.setdefault('requests_per_100_seconds', 100)
-        self.rate_limit_config.setdefault('min_request_interval', 1.0)  # 1 second between requests
+        self.rate_limit_config.setdefault('burst', 10)
+        self._bucket = TokenBucket(
+            self.rate_limit_config['burst'],
+            self.rate_limit_config['requests_per_100_seconds'] / 100
+        )
         
     def authenticate(self) -> bool:
         """Authenticate with Google Sheets API using OAuth 2.0.
@@ -58,15 +150,17 @@ class GoogleSheetsConnector(BaseAPIConnector):
             bool: True if authentication was successful, False otherwise
         """
         try:
-            # Create credentials object
-            creds = Credentials(
-                token=self.access_token,
-                refresh_token=self.refresh_token,
-                token_uri='https://oauth2.googleapis.com/token',
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
-            )
+            # Create credentials object once; refreshes update it in place
+            if self._creds is None:
+                self._creds = Credentials(
+                    token=self.access_token,
+                    refresh_token=self.refresh_token,
+                    token_uri='https://oauth2.googleapis.com/token',
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
+                )
+            creds = self._creds
             
             # Refresh token if needed
             if creds.expired:
@@ -74,8 +168,15 @@ class GoogleSheetsConnector(BaseAPIConnector):
                 self.access_token = creds.token
                 self.logger.info("Access token refreshed")
             
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=creds)
+            # The service holds the same credentials object, so it stays usable
+            if self.service is not None:
+                return True
+            
+            # Build the service on the shared connection pool
+            if self.session is None:
+                self.session = PooledSession()
+            http = AuthorizedHttp(creds, http=_SessionHttp(self.session))
+            self.service = build_from_document(_discovery_doc(), http=http)
             self.logger.info("Successfully authenticated with Google Sheets API")
             return True
             
@@ -110,26 +211,12 @@ class GoogleSheetsConnector(BaseAPIConnector):
         - 100 requests per 100 seconds per user
         - 500 requests per 100 seconds (total)
         """
-        # Simple rate limiting based on request count and time
-        current_time = datetime.now()
-        
-        if self.last_request_time:
-            elapsed = (current_time - self.last_request_time).total_seconds()
-            min_interval = self.rate_limit_config.get('min_request_interval', 1.0)
-            
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+        # Token bucket: short bursts are free, sustained use is held to the quota
+        sleep_time = self._bucket.consume()
+        if sleep_time > 0:
+            self.logger.debug("Rate limiting: slept for %.2f seconds", sleep_time)
         
-        self.last_request_time = current_time
         self.request_count += 1
-        
-        # Reset counter every 100 seconds
-        if self.request_count >= self.rate_limit_config.get('requests_per_100_seconds', 100):
-            self.logger.info("Rate limit reached, waiting 100 seconds")
-            time.sleep(100)
-            self.request_count = 0
     
     def fetch_data(self, 
                   spreadsheet_id: str, 
@@ -141,89 +228,323 @@ class GoogleSheetsConnector(BaseAPIConnector):
             query_params: Optional parameters for the query
                 sheet_name: Name of the sheet (default: first sheet)
                 range: A1 notation range (e.g., 'A1:Z1000')
+                ranges: List of A1 notation ranges, read with a single
+                    batchGet call; takes precedence over range. Ranges
+                    without a sheet prefix are read from sheet_name.
                 include_headers: Whether first row contains headers (default: True)
             
         Returns:
-            List of dictionaries containing the fetched data
+            List of dictionaries containing the fetched data. Records read
+            through `ranges` also carry the range they came from in `_range`.
         """
         if not self.validate_connection():
             self.logger.error("Connection validation failed, cannot fetch data")
             return []
+        
+        query_params = query_params or {}
+        include_headers = query_params.get('include_headers', True)
+        
+        try:
+            extracted_at = datetime.now().isoformat()
+            records = []
+            for sheet_name, value_range, values in self._read_values(spreadsheet_id, query_params):
+                range_records = self._values_to_records(values, include_headers, sheet_name, spreadsheet_id, extracted_at)
+                if value_range is not None:
+                    for record in range_records:
+                        record['_range'] = value_range
+                records.extend(range_records)
+            
+            self.logger.info(f"Successfully fetched {len(records)} records from {spreadsheet_id}")
+            return records
             
+        except HttpError as e:
+            self.logger.error(f"Google Sheets API error: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            return []
+    
+    def fetch_dataframe(self,
+                        spreadsheet_id: str,
+                        query_params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Fetch sheet data as a pandas DataFrame.
+        
+        Same arguments as fetch_data. The frame is built from the row lists
+        in one step and the metadata columns are broadcast, instead of going
+        through one dict per row. Cell values keep their Sheets types
+        (object dtype); missing trailing cells are None.
+        
+        Returns:
+            DataFrame with one column per header plus the _row_number,
+            _sheet_name, _spreadsheet_id and _extracted_at metadata columns
+            (and _range when `ranges` is given)
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return pd.DataFrame()
+        
         query_params = query_params or {}
-        sheet_name = query_params.get('sheet_name', '')
-        range_notation = query_params.get('range', '')
         include_headers = query_params.get('include_headers', True)
         
         try:
-            # Get spreadsheet metadata first
-            self.handle_rate_limits()
-            spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            extracted_at = datetime.now().isoformat()
+            frames = []
+            for sheet_name, value_range, values in self._read_values(spreadsheet_id, query_params):
+                df = self._values_to_frame(values, include_headers).assign(
+                    _sheet_name=sheet_name,
+                    _spreadsheet_id=spreadsheet_id,
+                    _extracted_at=extracted_at
+                )
+                if value_range is not None:
+                    df['_range'] = value_range
+                frames.append(df)
+            
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else (frames[0] if frames else pd.DataFrame())
+            self.logger.info(f"Successfully fetched {len(df)} records from {spreadsheet_id}")
+            return df
             
-            # If no sheet name specified, use the first sheet
-            if not sheet_name:
-                sheet_name = spreadsheet['sheets'][0]['properties']['title']
+        except HttpError as e:
+            self.logger.error(f"Google Sheets API error: {e}")
+            return pd.DataFrame()
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            return pd.DataFrame()
+    
+    def fetch_data_bulk(self,
+                        spreadsheet_id: str,
+                        sheet_gid: Optional[int] = None,
+                        include_headers: bool = True) -> pd.DataFrame:
+        """Fetch a whole sheet through the CSV export endpoint.
+        
+        For bulk extracts this is much lighter than the values API: the CSV
+        is streamed straight into pandas instead of being parsed into nested
+        JSON lists first. The tradeoff is that every cell comes back as its
+        formatted string (numbers, dates and booleans lose their types) and
+        empty cells are empty strings. Use fetch_dataframe for ranged reads
+        or when cell types matter.
+        
+        Args:
+            spreadsheet_id: The ID of the Google Spreadsheet
+            sheet_gid: Numeric sheet ID (the `gid` in the sheet URL); uses
+                the first sheet if not specified
+            include_headers: Whether first row contains headers (default: True)
             
-            # Build the range
-            if range_notation:
-                full_range = f"{sheet_name}!{range_notation}"
+        Returns:
+            DataFrame with the same columns as fetch_dataframe
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return pd.DataFrame()
+        
+        try:
+            sheets = self._get_sheet_properties(spreadsheet_id)
+            if sheet_gid is None:
+                sheet = sheets[0]
             else:
-                full_range = sheet_name
+                sheet = next((props for props in sheets if props['sheetId'] == sheet_gid), None)
+                if sheet is None:
+                    self.logger.error(f"Sheet with gid {sheet_gid} not found in {spreadsheet_id}")
+                    return pd.DataFrame()
             
-            self.logger.debug(f"Fetching data from range: {full_range}")
+            if not self._creds.valid:
+                self._creds.refresh(Request())
+                self.access_token = self._creds.token
+            headers = {}
+            self._creds.apply(headers)
             
-            # Fetch the data
             self.handle_rate_limits()
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=full_range,
-                valueRenderOption='UNFORMATTED_VALUE',
-                dateTimeRenderOption='FORMATTED_STRING'
-            ).execute()
-            
-            values = result.get('values', [])
-            
-            if not values:
-                self.logger.warning("No data found in the specified range")
-                return []
+            extracted_at = datetime.now().isoformat()
+            response = self.session.get(
+                _EXPORT_URL.format(spreadsheet_id),
+                params={'format': 'csv', 'gid': sheet['sheetId']},
+                headers=headers, stream=True, timeout=_HTTP_TIMEOUT
+            )
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            try:
+                df = pd.read_csv(
+                    response.raw, dtype=str, keep_default_na=False, skip_blank_lines=False,
+                    header=0 if include_headers else None
+                )
+            except pd.errors.EmptyDataError:
+                return pd.DataFrame()
+            finally:
+                response.close()
+            
+            if not include_headers:
+                df.columns = [f"Column_{i+1}" for i in range(df.shape[1])]
+            first_row_number = 2 if include_headers else 1
+            df['_row_number'] = np.arange(first_row_number, len(df) + first_row_number)
+            df = df.assign(
+                _sheet_name=sheet['title'],
+                _spreadsheet_id=spreadsheet_id,
+                _extracted_at=extracted_at
+            )
             
-            # Convert to list of dictionaries
-            records = []
-            headers = None
+            self.logger.info(f"Successfully fetched {len(df)} records from {spreadsheet_id}")
+            return df
             
-            if include_headers and len(values) > 0:
-                headers = values[0]
-                data_rows = values[1:]
-            else:
-                # Generate generic headers
-                max_cols = max(len(row) for row in values) if values else 0
-                headers = [f"Column_{i+1}" for i in range(max_cols)]
-                data_rows = values
-            
-            for row_index, row in enumerate(data_rows):
-                record = {}
-                for col_index, header in enumerate(headers):
-                    # Handle rows with different lengths
-                    value = row[col_index] if col_index < len(row) else None
-                    record[header] = value
-                
-                # Add metadata
-                record['_row_number'] = row_index + (2 if include_headers else 1)
-                record['_sheet_name'] = sheet_name
-                record['_spreadsheet_id'] = spreadsheet_id
-                record['_extracted_at'] = datetime.now().isoformat()
-                
-                records.append(record)
-            
-            self.logger.info(f"Successfully fetched {len(records)} records from {sheet_name}")
-            return records
-            
-        except HttpError as e:
-            self.logger.error(f"Google Sheets API error: {e}")
-            return []
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Google Sheets export error: {str(e)}")
+            return pd.DataFrame()
         except Exception as e:
             self.logger.error(f"Error fetching data: {str(e)}")
+            return pd.DataFrame()
+    
+    def _read_values(self,
+                     spreadsheet_id: str,
+                     query_params: Dict[str, Any]) -> List[Tuple[str, Optional[str], List[List[Any]]]]:
+        """Read the cell values selected by query_params.
+        
+        Returns:
+            (sheet_name, range, values) per non-empty range read; range is
+            None unless the read went through `ranges`
+        """
+        sheet_name = query_params.get('sheet_name', '')
+        range_notation = query_params.get('range', '')
+        ranges = query_params.get('ranges')
+        
+        # Reject malformed ranges before spending a round trip on them
+        for notation in ranges or ([range_notation] if range_notation else []):
+            if not _A1_RANGE.fullmatch(notation.rpartition('!')[2]):
+                raise ValueError(f"Invalid A1 range: {notation!r}")
+        
+        # If no sheet name specified, use the first sheet
+        if not sheet_name:
+            sheet_name = self._get_sheet_properties(spreadsheet_id)[0]['title']
+        
+        if ranges:
+            return self._read_ranges(spreadsheet_id, sheet_name, ranges)
+        
+        # Build the range
+        if range_notation:
+            full_range = f"{sheet_name}!{range_notation}"
+        else:
+            full_range = sheet_name
+        
+        self.logger.debug("Fetching data from range: %s", full_range)
+        
+        # Fetch the data
+        self.handle_rate_limits()
+        result = self.service.spreadsheets().values().get(
+            spreadsheetId=spreadsheet_id,
+            range=full_range,
+            valueRenderOption='UNFORMATTED_VALUE',
+            dateTimeRenderOption='FORMATTED_STRING'
+        ).execute()
+        
+        values = result.get('values', [])
+        if not values:
+            self.logger.warning("No data found in the specified range")
             return []
+        return [(sheet_name, None, values)]
+    
+    def _read_ranges(self,
+                     spreadsheet_id: str,
+                     sheet_name: str,
+                     ranges: List[str]) -> List[Tuple[str, Optional[str], List[List[Any]]]]:
+        """Read several ranges with one values().batchGet call."""
+        full_ranges = [r if '!' in r else f"{sheet_name}!{r}" for r in ranges]
+        self.logger.debug("Fetching data from ranges: %s", full_ranges)
+        
+        self.handle_rate_limits()
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=full_ranges,
+            valueRenderOption='UNFORMATTED_VALUE',
+            dateTimeRenderOption='FORMATTED_STRING'
+        ).execute()
+        
+        range_values = []
+        for full_range, value_range in zip(full_ranges, result.get('valueRanges', [])):
+            values = value_range.get('values', [])
+            if not values:
+                self.logger.warning(f"No data found in range {full_range}")
+                continue
+            range_sheet = full_range.split('!', 1)[0].strip("'")
+            range_values.append((range_sheet, value_range.get('range', full_range), values))
+        return range_values
+    
+    @staticmethod
+    def _split_headers(values: List[List[Any]], include_headers: bool) -> Tuple[List[Any], List[List[Any]]]:
+        """Return (headers, data_rows), generating Column_N headers when there is no header row."""
+        if include_headers:
+            return values[0], values[1:]
+        # Generate generic headers; map(len) keeps the width scan out of Python bytecode
+        max_cols = max(map(len, values), default=0)
+        return [f"Column_{i+1}" for i in range(max_cols)], values
+    
+    def _values_to_records(self,
+                           values: List[List[Any]],
+                           include_headers: bool,
+                           sheet_name: str,
+                           spreadsheet_id: str,
+                           extracted_at: str) -> List[Dict[str, Any]]:
+        """Convert a values response into one dictionary per data row."""
+        headers, data_rows = self._split_headers(values, include_headers)
+        width = len(headers)
+        padding = [None] * width
+        first_row_number = 2 if include_headers else 1
+        
+        records = []
+        for row_number, row in enumerate(data_rows, first_row_number):
+            # Rows with fewer cells than headers are padded with None
+            if len(row) < width:
+                row = row + padding[len(row):]
+            record = dict(zip(headers, row))
+            
+            # Add metadata
+            record['_row_number'] = row_number
+            record['_sheet_name'] = sheet_name
+            record['_spreadsheet_id'] = spreadsheet_id
+            record['_extracted_at'] = extracted_at
+            
+            records.append(record)
+        
+        return records
+    
+    def _values_to_frame(self, values: List[List[Any]], include_headers: bool) -> pd.DataFrame:
+        """Convert a values response into a DataFrame with a _row_number column."""
+        if include_headers:
+            headers, data_rows = values[0], values[1:]
+            width = len(headers)
+            
+            # pandas pads short rows with None; extra cells beyond the headers are dropped
+            df = pd.DataFrame(data_rows, dtype=object)
+            if df.shape[1] < width:
+                df = df.reindex(columns=range(width))
+            df = df.iloc[:, :width]
+            df.columns = headers
+        else:
+            # pandas finds the widest row while building the frame, so there
+            # is no separate pass over the rows for the width
+            df = pd.DataFrame(values, dtype=object)
+            df.columns = [f"Column_{i+1}" for i in range(df.shape[1])]
+        df['_row_number'] = np.arange(2 if include_headers else 1, len(df) + (2 if include_headers else 1))
+        return df
+    
+    def _get_metadata(self, spreadsheet_id: str) -> Dict[str, Any]:
+        """Return spreadsheet and sheet properties for a spreadsheet.
+        
+        Only the fields in _METADATA_FIELDS are requested, and the result is
+        cached for five minutes so fetching the schema and then the data
+        costs one metadata call instead of two.
+        """
+        metadata = self._metadata_cache.get(spreadsheet_id)
+        if metadata is None:
+            self.handle_rate_limits()
+            metadata = self.service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id,
+                includeGridData=False,
+                fields=_METADATA_FIELDS
+            ).execute()
+            self._metadata_cache[spreadsheet_id] = metadata
+        return metadata
+    
+    def _get_sheet_properties(self, spreadsheet_id: str) -> List[Dict[str, Any]]:
+        """Return the properties of each sheet in a spreadsheet."""
+        return [sheet['properties'] for sheet in self._get_metadata(spreadsheet_id).get('sheets', [])]
     
     def fetch_schema(self, spreadsheet_id: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
         """Fetch the schema of a Google Sheet.
@@ -241,8 +562,7 @@ class GoogleSheetsConnector(BaseAPIConnector):
             
         try:
             # Get spreadsheet metadata
-            self.handle_rate_limits()
-            spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            spreadsheet = self._get_metadata(spreadsheet_id)
             
             # Find the target sheet
             target_sheet = None
@@ -274,22 +594,17 @@ class GoogleSheetsConnector(BaseAPIConnector):
                 'spreadsheet_title': spreadsheet.get('properties', {}).get('title', ''),
                 'sheet_name': sheet_name,
                 'sheet_id': target_sheet['properties']['sheetId'],
-                'row_count': target_sheet['properties']['gridProperties'].get('rowCount', 0),
-                'column_count': target_sheet['properties']['gridProperties'].get('columnCount', 0),
+                'row_count': target_sheet['properties'].get('gridProperties', {}).get('rowCount', 0),
+                'column_count': target_sheet['properties'].get('gridProperties', {}).get('columnCount', 0),
                 'headers': headers,
-                'fields': {},
+                # Google Sheets doesn't have strict typing
+                'fields': {
+                    header: {'column_index': i, 'column_letter': _COL_LETTERS[i], 'type': 'string', 'nullable': True}
+                    for i, header in enumerate(headers)
+                },
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Add field information
-            for i, header in enumerate(headers):
-                schema['fields'][header] = {
-                    'column_index': i,
-                    'column_letter': self._number_to_column_letter(i + 1),
-                    'type': 'string',  # Google Sheets doesn't have strict typing
-                    'nullable': True
-                }
-            
             return schema
             
         except Exception as e:
@@ -320,8 +635,7 @@ class GoogleSheetsConnector(BaseAPIConnector):
             return {}
         
         try:
-            self.handle_rate_limits()
-            spreadsheet = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            spreadsheet = self._get_metadata(spreadsheet_id)
             
             sheets_info = []
             for sheet in spreadsheet.get('sheets', []):
@@ -349,9 +663,6 @@ class GoogleSheetsConnector(BaseAPIConnector):
     
     def _number_to_column_letter(self, n: int) -> str:
         """Convert column number to letter (1 -> A, 26 -> Z, 27 -> AA, etc.)."""
-        result = ""
-        while n > 0:
-            n -= 1
-            result = chr(n % 26 + ord('A')) + result
-            n //= 26
-        return result 
\ No newline at end of file
+        if 0 < n <= len(_COL_LETTERS):
+            return _COL_LETTERS[n - 1]
+        return _column_letter(n) 
\ No newline at end of file
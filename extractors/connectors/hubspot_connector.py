@@ -4,14 +4,54 @@ This module provides a connector for HubSpot APIs.
 """
 import os
 
+import hashlib
 import logging
+import threading
 import time
-import json
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+import ijson
+import orjson
 import requests
+from cachetools import TTLCache
 from datetime import datetime
-
-from extractors.base.api_connector import BaseAPIConnector
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote, urlencode
+from urllib3.util.retry import Retry
+
+from extractors.base.api_connector import BaseAPIConnector, PooledSession
+from extractors.base.rate_limiter import TokenBucket
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_DEFAULT_PROPERTIES = ["createdate", "lastmodifieddate", "hs_object_id"]
+
+# Built-in CRM objects; /crm/v3/schemas only lists custom objects
+_STANDARD_OBJECTS = ['contacts', 'companies', 'deals', 'tickets']
+
+# Property definitions shared by all connector instances, so the connectors
+# built per REST request reuse them: (token digest, object type) -> results.
+# Properties differ between portals, so the key includes the credentials.
+_PROPERTIES_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
+_PROPERTIES_LOCK = threading.Lock()
+
+# Connection pool for HubSpot calls, shared by all connector instances. It is
+# sized for fetch_many's worker threads and retries throttled (429, honouring
+# Retry-After) and transient server errors. Search is a read-only POST, so
+# POST is retried too. The last response is returned rather than raised so
+# callers see the usual HTTPError from raise_for_status.
+_HUBSPOT_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
 
 
 class HubspotConnector(BaseAPIConnector):
@@ -37,15 +77,29 @@ class HubspotConnector(BaseAPIConnector):
         super().__init__(credentials, rate_limit_config)
 
         self.api_base_url = "https://api.hubapi.com"
+        # Per-object URL templates; object types are percent-encoded into them
+        self._objects_url = self.api_base_url + "/crm/v3/objects/{}"
+        self._search_url = self.api_base_url + "/crm/v3/objects/{}/search"
+        self._schema_url = self.api_base_url + "/crm/v3/schemas/{}"
+        self._properties_url = self.api_base_url + "/crm/v3/properties/{}"
         self.access_token = credentials.get('access_token')
         self.refresh_token = credentials.get('refresh_token')
         self.client_id = os.environ.get('HUBSPOT_CLIENT_ID')
         self.client_secret = os.environ.get('HUBSPOT_CLIENT_SECRET')
         self.last_request_time = None
-        self.session = requests.Session()
+        self.session = PooledSession(_HUBSPOT_ADAPTER)
+        self._refresh_lock = threading.Lock()
         self.request_count = 0
         self.max_retries = 3
 
+        # HubSpot allows 100 requests per 10 seconds per app
+        self.rate_limit_config.setdefault('requests_per_second', 10)
+        self.rate_limit_config.setdefault('burst', 10)
+        self._bucket = TokenBucket(
+            self.rate_limit_config['burst'],
+            self.rate_limit_config['requests_per_second']
+        )
+
         if self.access_token:
             self.session.headers.update({
                 'Authorization': f'Bearer {self.access_token}',
@@ -151,77 +205,241 @@ class HubspotConnector(BaseAPIConnector):
             return False
 
     def handle_rate_limits(self):
-        """Handle HubSpot API rate limits (basic implementation).
+        """Handle HubSpot API rate limits.
+
+        HubSpot has a limit of 100 requests per 10 seconds, enforced here with
+        a token bucket shared by all threads using this connector (see
+        fetch_many). Only sleeps when the bucket is empty.
+        """
+        sleep_time = self._bucket.consume()
+        if sleep_time > 0:
+            self.logger.debug("Rate limiting: slept for %.3f seconds", sleep_time)
+
+    def _backoff_from_headers(self, response: requests.Response):
+        """Slow down when HubSpot reports the rate limit window is nearly used up.
 
-        HubSpot has a limit of 100 requests per 10 seconds.
+        Requests that were actually throttled (429) are retried by
+        _HUBSPOT_ADAPTER according to their Retry-After header.
+
+        Args:
+            response: The response to inspect.
         """
-        # A simple delay to stay under the limit.
-        time.sleep(0.11) # Sleep for 110ms between requests
+        remaining = response.headers.get('X-HubSpot-RateLimit-Remaining')
+        if remaining is not None and int(remaining) < 2:
+            # Wait for enough of the rolling window to free up a slot or two
+            interval = int(response.headers.get('X-HubSpot-RateLimit-Interval-Milliseconds', 10000)) / 1000
+            max_requests = int(response.headers.get('X-HubSpot-RateLimit-Max', 100))
+            sleep_time = interval * (2 - int(remaining)) / max_requests
+            self.logger.debug("HubSpot rate limit nearly exhausted, sleeping for %.3f seconds", sleep_time)
+            time.sleep(sleep_time)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a rate-limited request, refreshing the access token on 401.
+
+        This replaces an up-front validate_connection() call: a fresh token
+        costs no extra round trip, and an expired one is refreshed once and
+        the request retried.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Passed through to the session.
+
+        Returns:
+            requests.Response: The response received.
+        """
+        self.handle_rate_limits()
+        sent_token = self.access_token
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 401 and self.refresh_token:
+            self.logger.info("HubSpot access token may be expired, attempting to refresh.")
+            response.close()
+            self._refresh_after_401(sent_token)
+            self.handle_rate_limits()
+            response = self.session.request(method, url, **kwargs)
+        self._backoff_from_headers(response)
+        return response
+
+    def _refresh_after_401(self, rejected_token: Optional[str]):
+        """Refresh the access token after a 401, once per expired token.
+
+        fetch_many threads that get a 401 at the same time all land here.
+        Only the first one refreshes; the others find the token already
+        replaced and retry with it, instead of each spending the refresh
+        token.
+
+        Args:
+            rejected_token: The access token the failed request was sent with.
+        """
+        with self._refresh_lock:
+            if self.access_token == rejected_token:
+                self.refresh_access_token()
 
     def fetch_data(self,
                    object_type: str,
                    query_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Fetch data from HubSpot using the CRM Search API.
+        """Fetch data from HubSpot CRM.
 
         Args:
             object_type: The type of HubSpot object to fetch (e.g., 'contacts', 'companies').
-            query_params: Optional parameters for the search query.
-                properties: List of properties to retrieve.
-                limit: The maximum number of results to return in a single page.
+            query_params: Optional parameters for the query (see iter_data).
 
         Returns:
             List of dictionaries containing the fetched data.
         """
-        if not self.validate_connection():
-            self.logger.error("Connection validation failed, cannot fetch data.")
+        try:
+            all_results = list(self.iter_data(object_type, query_params))
+            self.logger.info(f"Successfully fetched {len(all_results)} records for '{object_type}'.")
+            return all_results
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error fetching data for '{object_type}': {e.response.text if e.response else str(e)}")
             return []
+        except Exception as e:
+            self.logger.error(f"An unexpected error occurred while fetching data: {str(e)}")
+            return []
+
+    def iter_data(self,
+                  object_type: str,
+                  query_params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield records from HubSpot CRM one page at a time.
+
+        Without filters the plain list endpoint is paged with GET requests;
+        with `filters` or `query` the CRM Search API is used. Unlike
+        fetch_data, request errors are raised to the caller.
 
+        Args:
+            object_type: The type of HubSpot object to fetch (e.g., 'contacts', 'companies').
+            query_params: Optional parameters for the query.
+                properties: List of properties to retrieve, or 'all' for every
+                    property in the object's schema (see get_property_names).
+                limit: The maximum number of results to return in a single page
+                    (default: 100 for listing, 200 for search).
+                filters: Optional list of CRM Search filters, e.g.
+                    [{'propertyName': 'lifecyclestage', 'operator': 'EQ', 'value': 'lead'}].
+                query: Optional CRM Search text query.
+
+        Yields:
+            Dictionaries of record properties plus the record `id`.
+        """
         query_params = query_params or {}
-        url = f"{self.api_base_url}/crm/v3/objects/{object_type}/search"
-        all_results = []
+        use_search = 'filters' in query_params or 'query' in query_params
         after = None
 
         # Default properties if not provided
-        properties = query_params.get('properties', ["createdate", "lastmodifieddate", "hs_object_id"])
+        properties = query_params.get('properties', _DEFAULT_PROPERTIES)
+        if properties == 'all':
+            properties = self.get_property_names(object_type) or _DEFAULT_PROPERTIES
 
-        try:
-            while True:
-                self.handle_rate_limits()
-                payload = {
-                    "properties": properties,
-                    "limit": query_params.get('limit', 100)
-                }
-                if after:
-                    payload['after'] = after
-
-                self.logger.debug(f"Fetching HubSpot data for '{object_type}' with payload: {json.dumps(payload)}")
-                response = self.session.post(url, json=payload)
-                response.raise_for_status()
-                data = response.json()
-
-                results = data.get('results', [])
-                # Flatten properties for easier access
-                for item in results:
-                    flat_item = item.get('properties', {})
-                    flat_item['id'] = item.get('id')
-                    all_results.append(flat_item)
-
-                # Handle pagination
-                if 'paging' in data and 'next' in data['paging']:
-                    after = data['paging']['next']['after']
-                else:
-                    break
+        if use_search:
+            url = self._search_url.format(quote(object_type, safe=''))
+            payload = {
+                "properties": properties,
+                "limit": query_params.get('limit', 200)
+            }
+            if 'filters' in query_params:
+                payload['filterGroups'] = [{'filters': query_params['filters']}]
+            if 'query' in query_params:
+                payload['query'] = query_params['query']
+            # Serialized once; only pages after the first need a new body
+            base_body = orjson.dumps(payload)
+        else:
+            # Encoded once; later pages only append the cursor
+            base_url = self._objects_url.format(quote(object_type, safe='')) + '?' + urlencode({
+                'properties': ','.join(properties),
+                'limit': query_params.get('limit', 100),
+                'archived': 'false'
+            })
 
-            self.logger.info(f"Successfully fetched {len(all_results)} records for '{object_type}'.")
-            return all_results
+        while True:
+            if use_search:
+                body = orjson.dumps({**payload, 'after': after}) if after else base_body
+                self.logger.debug("Searching HubSpot '%s' with payload: %s", object_type, body)
+                response = self._request('POST', url, data=body, headers=_JSON_HEADERS)
+            else:
+                page_url = f"{base_url}&after={quote(after, safe='')}" if after else base_url
+                self.logger.debug("Listing HubSpot '%s': %s", object_type, page_url)
+                response = self._request('GET', page_url)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            # Flatten properties for easier access
+            yield from ({**item['properties'], 'id': item['id']} for item in data.get('results', ()))
+
+            # Handle pagination
+            after = data.get('paging', {}).get('next', {}).get('after')
+            if not after:
+                break
 
+    def fetch_many(self,
+                   object_types: List[str],
+                   query_params_by_type: Optional[Dict[str, Dict[str, Any]]] = None,
+                   max_workers: int = 4) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch several object types concurrently.
+
+        Pagination within one object type is sequential, but different object
+        types are independent, so each is fetched by fetch_data on its own
+        worker thread. Requests from all workers still go through
+        handle_rate_limits.
+
+        Args:
+            object_types: HubSpot object types to fetch (e.g., ['contacts', 'deals']).
+            query_params_by_type: Optional query parameters per object type.
+            max_workers: Maximum number of object types fetched at once.
+
+        Returns:
+            Dictionary mapping each object type to its records.
+        """
+        query_params_by_type = query_params_by_type or {}
+        if not object_types:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(object_types))) as executor:
+            results = executor.map(
+                lambda object_type: self.fetch_data(object_type, query_params_by_type.get(object_type)),
+                object_types
+            )
+            return dict(zip(object_types, results))
+
+    def get_property_names(self, object_type: str) -> List[str]:
+        """Return the names of all properties of a HubSpot object.
+
+        Args:
+            object_type: The name of the HubSpot object (e.g., 'contacts').
+
+        Returns:
+            List of property names, empty if the properties could not be fetched.
+        """
+        try:
+            return [prop['name'] for prop in self._get_properties(object_type)]
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error fetching data for '{object_type}': {e.response.text if e.response else str(e)}")
-            return []
-        except Exception as e:
-            self.logger.error(f"An unexpected error occurred while fetching data: {str(e)}")
+            self.logger.error(f"Error fetching properties for '{object_type}': {e.response.text if e.response else str(e)}")
             return []
 
+    def _get_properties(self, object_type: str) -> List[Dict[str, Any]]:
+        """Return the property definitions of a HubSpot object.
+
+        Properties change rarely, so they are cached for an hour across
+        instances with the same credentials; repeated crawls and list_objects
+        calls cost one /crm/v3/properties call per object type. Request
+        errors are raised to the caller.
+        """
+        key = (self._properties_cache_key(), object_type)
+        with _PROPERTIES_LOCK:
+            properties = _PROPERTIES_CACHE.get(key)
+        if properties is None:
+            response = self._request('GET', self._properties_url.format(quote(object_type, safe='')))
+            response.raise_for_status()
+            properties = orjson.loads(response.content).get('results', [])
+            with _PROPERTIES_LOCK:
+                _PROPERTIES_CACHE[key] = properties
+        return properties
+
+    def _properties_cache_key(self) -> bytes:
+        """Identify the portal by its refresh token, which outlives access tokens."""
+        token = self.refresh_token or self.access_token or ''
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
     def fetch_schema(self, object_type: str) -> Dict[str, Any]:
         """Fetch the schema of a HubSpot object.
 
@@ -231,16 +449,11 @@ class HubspotConnector(BaseAPIConnector):
         Returns:
             Dictionary containing the schema information.
         """
-        if not self.validate_connection():
-            self.logger.error("Connection validation failed, cannot fetch schema.")
-            return {}
-
         try:
-            self.handle_rate_limits()
-            url = f"{self.api_base_url}/crm/v3/schemas/{object_type}"
-            response = self.session.get(url)
+            url = self._schema_url.format(quote(object_type, safe=''))
+            response = self._request('GET', url)
             response.raise_for_status()
-            schema = response.json()
+            schema = orjson.loads(response.content)
 
             field_info = {}
             for prop in schema.get('properties', []):
@@ -271,28 +484,43 @@ class HubspotConnector(BaseAPIConnector):
         Returns:
             A dictionary structured for the frontend, containing schema and table info.
         """
-        if not self.validate_connection():
-            self.logger.error("Connection validation failed, cannot list objects.")
-            return {}
-
         try:
-            self.handle_rate_limits()
             url = f"{self.api_base_url}/crm/v3/schemas"
-            response = self.session.get(url)
+            # The schema listing can run to megabytes on large portals, so it
+            # is parsed one schema at a time from the socket instead of being
+            # buffered and decoded whole
+            response = self._request('GET', url, stream=True)
             response.raise_for_status()
-            all_schemas = response.json().get('results', [])
+            response.raw.decode_content = True
 
+            # Standard objects are not in the schema listing; their properties
+            # are fetched concurrently while the listing is parsed
             full_schema = {}
-            for schema in all_schemas:
-                object_type = schema['name']
-                self.logger.debug(f"Processing schema for {object_type}")
-                fields_list = []
-                for prop in schema.get('properties', []):
-                    fields_list.append({
-                        'columnName': prop['name'],
-                        'dataType': prop.get('type', 'string')
-                    })
-                full_schema[object_type] = fields_list
+            with ThreadPoolExecutor(max_workers=len(_STANDARD_OBJECTS)) as executor:
+                standard = [executor.submit(self._get_properties, name) for name in _STANDARD_OBJECTS]
+                try:
+                    for schema in ijson.items(response.raw, 'results.item'):
+                        object_type = schema['name']
+                        self.logger.debug("Processing schema for %s", object_type)
+                        full_schema[object_type] = [
+                            {'columnName': prop['name'], 'dataType': prop.get('type', 'string')}
+                            for prop in schema.get('properties', [])
+                        ]
+                finally:
+                    response.close()
+
+                for object_type, future in zip(_STANDARD_OBJECTS, standard):
+                    # One inaccessible object (e.g. tickets without the scope)
+                    # must not drop the whole listing
+                    try:
+                        properties = future.result()
+                    except requests.exceptions.RequestException as e:
+                        self.logger.warning(f"Skipping '{object_type}', properties could not be fetched: {str(e)}")
+                        continue
+                    full_schema[object_type] = [
+                        {'columnName': prop['name'], 'dataType': prop.get('type', 'string')}
+                        for prop in properties
+                    ]
 
             return {'hubspot': full_schema}
 
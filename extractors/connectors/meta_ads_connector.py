@@ -116,10 +116,10 @@ class MetaAdsConnector(BaseAPIConnector):
         - Burst allowance for short periods
         - Different limits for different endpoints
         """
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         if self.last_request_time:
-            elapsed = (current_time - self.last_request_time).total_seconds()
+            elapsed = current_time - self.last_request_time
             min_interval = self.rate_limit_config.get('min_request_interval', 0.1)
             
             if elapsed < min_interval:
@@ -195,12 +195,13 @@ class MetaAdsConnector(BaseAPIConnector):
         self.handle_rate_limits()
         campaigns = ad_account.get_campaigns(fields=fields)
         
+        extracted_at = datetime.now().isoformat()
         records = []
         for campaign in campaigns:
             record = dict(campaign)
             record['_object_type'] = 'campaign'
             record['_ad_account_id'] = self.ad_account_id
-            record['_extracted_at'] = datetime.now().isoformat()
+            record['_extracted_at'] = extracted_at
             records.append(record)
         
         return records
@@ -216,12 +217,13 @@ class MetaAdsConnector(BaseAPIConnector):
         self.handle_rate_limits()
         adsets = ad_account.get_ad_sets(fields=fields)
         
+        extracted_at = datetime.now().isoformat()
         records = []
         for adset in adsets:
             record = dict(adset)
             record['_object_type'] = 'adset'
             record['_ad_account_id'] = self.ad_account_id
-            record['_extracted_at'] = datetime.now().isoformat()
+            record['_extracted_at'] = extracted_at
             records.append(record)
         
         return records
@@ -236,12 +238,13 @@ class MetaAdsConnector(BaseAPIConnector):
         self.handle_rate_limits()
         ads = ad_account.get_ads(fields=fields)
         
+        extracted_at = datetime.now().isoformat()
         records = []
         for ad in ads:
             record = dict(ad)
             record['_object_type'] = 'ad'
             record['_ad_account_id'] = self.ad_account_id
-            record['_extracted_at'] = datetime.now().isoformat()
+            record['_extracted_at'] = extracted_at
             records.append(record)
         
         return records
@@ -272,13 +275,14 @@ class MetaAdsConnector(BaseAPIConnector):
         self.handle_rate_limits()
         insights = ad_account.get_insights(params=params)
         
+        extracted_at = datetime.now().isoformat()
         records = []
         for insight in insights:
             record = dict(insight)
             record['_object_type'] = 'insights'
             record['_level'] = level
             record['_ad_account_id'] = self.ad_account_id
-            record['_extracted_at'] = datetime.now().isoformat()
+            record['_extracted_at'] = extracted_at
             records.append(record)
         
         return records
@@ -4,14 +4,86 @@ This module provides a connector for Salesforce APIs.
 """
 import os
 
+import copy
+import csv
+import functools
+import hashlib
+import io
 import logging
+import re
+import threading
 import time
-import json
-from typing import Dict, List, Any, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple, Union
+import ijson
+import orjson
 import requests
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from extractors.base.api_connector import BaseAPIConnector
+from extractors.base.api_connector import BaseAPIConnector, PooledSession
+from extractors.base.rate_limiter import TokenBucket
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# A full SOQL query, as opposed to an object name, passed to fetch_data
+_SOQL_RE = re.compile(r'\s*select\b.*\bfrom\b', re.IGNORECASE | re.DOTALL)
+
+# Fields fetched when fetch_data is given an object name without `fields`
+_DEFAULT_FIELDS = ('Id', 'Name', 'CreatedDate', 'LastModifiedDate')
+
+# Platform events and custom objects, left out of list_objects
+_EXCLUDED_SUFFIXES = ('__e', '__c')
+
+# Connection pool for Salesforce calls, shared by all connector instances so
+# short-lived connectors keep reusing warm TLS connections. It holds enough
+# connections per host for several concurrent connectors' describe and bulk
+# result workers, and retries throttled (429,
+# honouring Retry-After) and transient server errors with exponential
+# backoff, so one bad response does not abort a pagination or describe walk.
+# POSTs are retried because password logins and Composite describes are safe
+# to repeat. Requests that are not go through _SALESFORCE_NO_RETRY_ADAPTER
+# instead: authorization code exchanges (a code is single-use, so a retry
+# after the server consumed it fails with invalid_grant and hides the real
+# error), refresh token grants (the token may be rotated) and Bulk API job
+# creation (a retry can start a second job). The last response is returned
+# rather than raised so callers still see its status code.
+_SALESFORCE_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.25,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+
+# Connection pool for requests that must not be repeated once Salesforce has
+# seen them. Only failed connection attempts, where the request never reached
+# Salesforce, are retried.
+_SALESFORCE_NO_RETRY_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.25)
+)
+
+# Calls in progress by (instance URL, credential digest, call signature), shared
+# by all connector instances; see SalesforceConnector._single_flight
+_INFLIGHT: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Describe results by (instance URL, API version, object name), stored with
+# the ETag and Last-Modified validators they were served with. Entries are
+# always revalidated with a conditional request, so a 304 confirms the cached
+# schema is what this user would be sent; the TTL bounds how long an entry is
+# kept at all. Shared because connectors are created per request.
+_DESCRIBE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=600)
+_DESCRIBE_CACHE_LOCK = threading.Lock()
 
 
 class SalesforceConnector(BaseAPIConnector):
@@ -25,7 +97,35 @@ class SalesforceConnector(BaseAPIConnector):
         logger (logging.Logger): Logger for this connector
     """
     
-    def __init__(self, credentials: Optional[Dict[str, Any]] = None, rate_limit_config: Optional[Dict[str, Any]] = None):
+    # Concurrent describe calls in list_objects
+    DESCRIBE_WORKERS = 12
+    # Subrequest limit of a single Composite API call
+    COMPOSITE_BATCH_SIZE = 25
+    # Salesforce omits expires_in from most token responses; sessions last
+    # two hours unless the org's session timeout says otherwise
+    DEFAULT_TOKEN_LIFETIME = 7200
+    # Treat tokens as expired this many seconds early
+    TOKEN_EXPIRY_MARGIN = 60
+    # Seconds between Bulk API job status checks
+    BULK_POLL_INTERVAL = 2.0
+    # Seconds to wait for a Bulk API job before aborting it
+    BULK_MAX_WAIT = 900
+    # Bulk API job states after which no more results will appear
+    BULK_FAILED_STATES = ('Aborted', 'Failed')
+    # Below this share of the org's daily API allowance left, the request
+    # rate is scaled down in proportion to what remains
+    LOW_QUOTA_FRACTION = 0.1
+    # Slowest rate as a share of the configured one
+    MIN_RATE_FRACTION = 0.05
+    # How long token store entries outlive their access token. Salesforce
+    # refresh tokens stay valid until revoked, and when they are rotated the
+    # stored one is the only copy of the current token.
+    REFRESH_TOKEN_TTL = 30 * 86400
+    
+    def __init__(self,
+                 credentials: Optional[Dict[str, Any]] = None,
+                 rate_limit_config: Optional[Dict[str, Any]] = None,
+                 token_store: Optional[Any] = None):
         """Initialize the Salesforce connector.
         
         Args:
@@ -34,6 +134,11 @@ class SalesforceConnector(BaseAPIConnector):
                 - For OAuth flow: `client_id`, `client_secret`, `access_token`, `refresh_token`, `instance_url`
                 Optional keys: `security_token`, `api_version`, `sandbox`
             rate_limit_config: Optional configuration for API rate limiting
+            token_store: Optional store shared between connector instances and
+                processes, such as a diskcache.Cache, that provides
+                `get(key)` and `set(key, value, expire=seconds)`. Tokens
+                obtained by one connector are reused by the others instead
+                of each logging in or refreshing again.
         """
         credentials = credentials or {}
         super().__init__(credentials, rate_limit_config)
@@ -45,9 +150,22 @@ class SalesforceConnector(BaseAPIConnector):
         self.last_request_time = None
         self.client_id = os.environ.get('SALESFORCE_CLIENT_ID')
         self.client_secret = os.environ.get('SALESFORCE_CLIENT_SECRET')
-        self.session = requests.Session()
+        self.session = PooledSession(_SALESFORCE_ADAPTER)
+        # Shares the main session's headers, so token updates apply to both
+        self._no_retry_session = PooledSession(_SALESFORCE_NO_RETRY_ADAPTER)
+        self._no_retry_session.headers = self.session.headers
         self.request_count = 0
         self.max_retries = 3
+        
+        self.rate_limit_config.setdefault('requests_per_second', 10)
+        self.rate_limit_config.setdefault('burst', 10)
+        self._bucket = TokenBucket(
+            self.rate_limit_config['burst'],
+            self.rate_limit_config['requests_per_second']
+        )
+        # time.monotonic() deadline of the current access token; 0 when unknown
+        self._token_expiry = 0.0
+        self._reauth_lock = threading.Lock()
 
         # Determine auth type based on provided credentials
         # if 'access_token' in self.credentials and 'refresh_token' in self.credentials:
@@ -62,6 +180,76 @@ class SalesforceConnector(BaseAPIConnector):
         else:
             # Allows instantiation for code exchange before full credentials are known
             self.auth_type = 'unauthenticated'
+        
+        self.token_store = token_store
+        self._token_store_key = self._get_token_store_key()
+        self._load_stored_token()
+    
+    def _get_token_store_key(self) -> Optional[str]:
+        """Token store key for these credentials (None if there is no store).
+        
+        The login or refresh token is hashed so no secret ends up in the key.
+        For password logins the password and security token are part of it,
+        so a request with wrong credentials never adopts a stored token.
+        """
+        if self.token_store is None:
+            return None
+        identity = self._login_identity()
+        if identity is None:
+            return None
+        digest = hashlib.blake2b(f"{self.client_id}:{identity}".encode(), digest_size=16).hexdigest()
+        return f"salesforce:{digest}"
+    
+    def _login_identity(self) -> Optional[str]:
+        """The secrets a new access token is obtained with, None if there are none."""
+        if self.auth_type == 'password':
+            return (f"password:{self.credentials['username']}:{self.credentials['password']}"
+                    f":{self.credentials.get('security_token', '')}")
+        if self.refresh_token:
+            return f"token:{self.refresh_token}"
+        return None
+    
+    def _load_stored_token(self):
+        """Adopt a still-valid token another connector put in the token store."""
+        if self._token_store_key is None:
+            return
+        try:
+            entry = self.token_store.get(self._token_store_key)
+        except Exception as e:
+            self.logger.warning(f"Could not read the token store: {str(e)}")
+            return
+        if not entry:
+            return
+        
+        # A rotated refresh token is kept even if the access token has expired
+        self.refresh_token = entry.get('refresh_token') or self.refresh_token
+        remaining = entry['expires_at'] - time.time()
+        if remaining <= 0:
+            return
+        self.access_token = entry['access_token']
+        self.instance_url = entry.get('instance_url') or self.instance_url
+        self._token_expiry = time.monotonic() + remaining
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/json'
+        })
+        self.logger.debug("Using access token from the token store")
+    
+    def _save_token(self):
+        """Share the current token through the token store, if there is one."""
+        if self._token_store_key is None:
+            return
+        remaining = max(self._token_expiry - time.monotonic(), 0)
+        entry = {
+            'access_token': self.access_token,
+            'refresh_token': self.refresh_token,
+            'instance_url': self.instance_url,
+            'expires_at': time.time() + remaining,
+        }
+        try:
+            self.token_store.set(self._token_store_key, entry, expire=max(self.REFRESH_TOKEN_TTL, remaining))
+        except Exception as e:
+            self.logger.warning(f"Could not write the token store: {str(e)}")
 
     def _get_auth_url(self) -> str:
         """Gets the correct Salesforce auth URL (production or sandbox)."""
@@ -88,13 +276,14 @@ class SalesforceConnector(BaseAPIConnector):
             'client_secret': self.client_secret,
             'redirect_uri': redirect_uri,
         }
-        self.logger.info(f"Exchanging code for tokens with payload: {json.dumps({k: v for k, v in payload.items() if k != 'client_secret'}, indent=2)}")
-        response = self.session.post(auth_url, data=payload)
+        self.logger.info(f"Exchanging code for tokens with payload: {orjson.dumps({k: v for k, v in payload.items() if k != 'client_secret'}, option=orjson.OPT_INDENT_2).decode()}")
+        response = self._no_retry_session.post(auth_url, data=payload)
         if response.status_code != 200:
             self.logger.error(f"Token exchange failed with status {response.status_code}: {response.text}")
         response.raise_for_status()
-        self.logger.info(f"Successfully exchanged code for tokens {response.json()}")
-        return response.json()
+        token_data = orjson.loads(response.content)
+        self.logger.info(f"Successfully exchanged code for tokens {token_data}")
+        return token_data
 
     def authenticate(self) -> bool:
         """Authenticate with Salesforce using the provided credentials.
@@ -125,9 +314,11 @@ class SalesforceConnector(BaseAPIConnector):
             response = self.session.post(auth_url, data=payload)
             
             if response.status_code == 200:
-                auth_data = response.json()
+                auth_data = orjson.loads(response.content)
                 self.access_token = auth_data['access_token']
                 self.instance_url = auth_data.get('instance_url', self.instance_url)
+                self._set_token_expiry(auth_data)
+                self._save_token()
                 self.session.headers.update({
                     'Authorization': f'Bearer {self.access_token}',
                     'Content-Type': 'application/json'
@@ -156,22 +347,32 @@ class SalesforceConnector(BaseAPIConnector):
                 'client_secret': self.client_secret,
                 'refresh_token': self.refresh_token,
             }
-            response = self.session.post(auth_url, data=payload)
+            response = self._no_retry_session.post(auth_url, data=payload)
             response.raise_for_status()
-            auth_data = response.json()
+            auth_data = orjson.loads(response.content)
             self.access_token = auth_data['access_token']
             # Salesforce may issue a new refresh token, but often doesn't. Handle if it does.
             self.refresh_token = auth_data.get('refresh_token', self.refresh_token)
+            self._set_token_expiry(auth_data)
             self.session.headers.update({'Authorization': f'Bearer {self.access_token}'})
+            self._save_token()
             self.logger.info("Successfully refreshed Salesforce access token.")
             return auth_data
         except Exception as e:
             self.logger.error(f"Error refreshing access token: {str(e)}")
             raise e
     
+    def _set_token_expiry(self, auth_data: Dict[str, Any]):
+        """Record when the access token in a token response expires."""
+        lifetime = int(auth_data.get('expires_in', self.DEFAULT_TOKEN_LIFETIME))
+        self._token_expiry = time.monotonic() + lifetime - self.TOKEN_EXPIRY_MARGIN
+    
     def validate_connection(self) -> bool:
         """Validate the connection to Salesforce.
         
+        A token this connector obtained itself and that has not expired is
+        trusted without a round trip; requests still refresh it on a 401.
+        
         Returns:
             bool: True if connection is valid, False otherwise
         """
@@ -181,6 +382,9 @@ class SalesforceConnector(BaseAPIConnector):
             self.logger.warning("No access token present for connection validation.")
             return False
         
+        if time.monotonic() < self._token_expiry:
+            return True
+        
         try:
             # Try to make a simple request to verify the connection
             url = f"{self.instance_url}/services/data/v{self.api_version}/sobjects"
@@ -208,23 +412,92 @@ class SalesforceConnector(BaseAPIConnector):
     def handle_rate_limits(self):
         """Handle Salesforce API rate limits.
         
-        Salesforce enforces various API limits, this method implements
-        a simple delay mechanism to avoid hitting those limits.
+        Requests draw from a token bucket shared by all threads using this
+        connector. Its rate follows the org's daily API allowance reported
+        in Sforce-Limit-Info (see _update_rate_from_headers), so requests
+        only slow down when the allowance is running out.
         """
-        # Simple rate limiting based on request count
-        if self.request_count >= 100:  # Reset after 100 requests
-            time.sleep(5)  # Wait 5 seconds
-            self.request_count = 0
+        sleep_time = self._bucket.consume()
+        if sleep_time > 0:
+            self.logger.debug("Rate limiting: slept for %.3f seconds", sleep_time)
+        self.request_count += 1
+    
+    def _update_rate_from_headers(self, response: requests.Response):
+        """Adjust the request rate to the API usage Salesforce reports.
+        
+        Args:
+            response: The response to inspect; its Sforce-Limit-Info header
+                looks like `api-usage=45123/500000`.
+        """
+        limit_info = response.headers.get('Sforce-Limit-Info')
+        if not limit_info:
             return
+        for part in limit_info.split(','):
+            name, _, usage = part.strip().partition('=')
+            if name != 'api-usage':
+                continue
+            try:
+                used, total = map(int, usage.split('/'))
+            except ValueError:
+                return
+            remaining_fraction = max(total - used, 0) / total if total else 1.0
+            scale = min(1.0, max(remaining_fraction / self.LOW_QUOTA_FRACTION, self.MIN_RATE_FRACTION))
+            rate = self.rate_limit_config['requests_per_second'] * scale
+            if rate != self._bucket.refill_rate:
+                if scale < 1.0:
+                    self.logger.debug("Salesforce API usage at %d/%d, limiting to %.2f requests per second", used, total, rate)
+                self._bucket.set_rate(rate)
+            return
+    
+    def _reauthenticate(self, rejected_token: Optional[str]) -> bool:
+        """Obtain a new access token after a 401.
+        
+        Worker threads that get a 401 at the same time all land here. Only
+        the first one refreshes; the others find the token already replaced
+        and retry with it, instead of each spending (and possibly
+        invalidating) the refresh token.
+        
+        Args:
+            rejected_token: The access token the failed request was sent with
             
-        # Ensure at least 100ms between requests
-        if self.last_request_time:
-            elapsed = datetime.now() - self.last_request_time
-            if elapsed.total_seconds() < 0.1:
-                time.sleep(0.1 - elapsed.total_seconds())
-                
-        self.last_request_time = datetime.now()
-        self.request_count += 1
+        Returns:
+            bool: True if a new token is available
+        """
+        with self._reauth_lock:
+            if self.access_token != rejected_token:
+                return True
+            if self.auth_type == 'password':
+                return self.authenticate()
+            if self.refresh_token:
+                self.refresh_access_token()
+                return True
+            return False
+    
+    def _request(self, method: str, url: str, session: Optional[requests.Session] = None,
+                 **kwargs) -> requests.Response:
+        """Send a rate-limited request, re-authenticating once on 401.
+        
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            session: Session to send through, self.session by default.
+            **kwargs: Passed through to the session.
+            
+        Returns:
+            requests.Response: The response received.
+        """
+        session = session or self.session
+        self.handle_rate_limits()
+        access_token = self.access_token
+        response = session.request(method, url, **kwargs)
+        if response.status_code == 401:
+            self.logger.info("Access token may be expired, attempting to refresh/re-authenticate.")
+            response.close()
+            if self._reauthenticate(access_token):
+                self.handle_rate_limits()
+                response = session.request(method, url, **kwargs)
+        self._update_rate_from_headers(response)
+        return response
     
     def fetch_data(self, 
                   query_or_object_name: str, 
@@ -238,6 +511,8 @@ class SalesforceConnector(BaseAPIConnector):
                 where: SOQL WHERE clause
                 limit: Maximum number of records
                 order_by: SOQL ORDER BY clause
+                use_bulk: Run the query as a Bulk API 2.0 job (see
+                    fetch_data_bulk); worthwhile for large result sets
 
         Returns:
             List of dictionaries containing the fetched data
@@ -245,77 +520,257 @@ class SalesforceConnector(BaseAPIConnector):
         if not self.validate_connection():
             self.logger.error("Connection validation failed, cannot fetch data")
             return []
-
-        query: str
-        # Check if a full query is provided or if we need to build one.
-        # A simple heuristic is to check for "SELECT" and "FROM" keywords.
-        if 'select' in query_or_object_name.lower() and 'from' in query_or_object_name.lower():
-            query = query_or_object_name
+        
+        query = self._build_query(query_or_object_name, query_params)
+        if query_params and query_params.get('use_bulk'):
+            return self._single_flight(('bulk', query), self.fetch_data_bulk, query)
+        return self._single_flight(('data', query), self._fetch_records, query)
+    
+    def _fetch_records(self, query: str) -> List[Dict[str, Any]]:
+        """Run a query through iter_data, logging errors instead of raising them."""
+        try:
+            records = list(self.iter_data(query))
+            self.logger.info(f"Successfully fetched {len(records)} records.")
+            return records
+                
+        except Exception as e:
+            self.logger.error(f"Error fetching data: {str(e)}")
+            return []
+    
+    def _single_flight(self, key: tuple, func: Callable[..., Any], *args) -> Any:
+        """Run func(*args) unless an identical call is already in progress.
+        
+        Connectors for the same org and credentials that ask for the same
+        schema or query at the same time (e.g. concurrent REST requests)
+        wait for the first caller's result instead of each sending their own
+        requests. Waiting callers receive a copy of it.
+        
+        Args:
+            key: Signature of the call
+            func: Function to run
+            *args: Arguments for func
+            
+        Returns:
+            The result of func
+        """
+        identity = self._login_identity() or f"access:{self.access_token}"
+        digest = hashlib.blake2b(f"{self.client_id}:{identity}".encode(), digest_size=16).digest()
+        key = (self.instance_url, digest) + key
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            leader = future is None
+            if leader:
+                future = _INFLIGHT[key] = Future()
+        if not leader:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
         else:
-            # Build the query from object_name and query_params
-            object_name = query_or_object_name
-            query_params = query_params or {}
-            fields = query_params.get('fields', ['Id', 'Name', 'CreatedDate', 'LastModifiedDate'])
-            where_clause = query_params.get('where', '')
-            limit_clause = f"LIMIT {query_params.get('limit', 2000)}" if 'limit' in query_params else ""
-            order_by = query_params.get('order_by', '')
+            future.set_result(result)
+            return result
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+    
+    def iter_data(self,
+                  query_or_object_name: str,
+                  query_params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield query results as they arrive, one page at a time.
+        
+        Each page is parsed straight from the response stream and its records
+        are yielded before the next page is requested, so memory stays at one
+        page however large the result set is. Unlike fetch_data, the
+        connection is not validated first and request errors are raised to
+        the caller.
+        
+        Args:
+            query_or_object_name: A full SOQL query string or the name of a Salesforce object.
+            query_params: Optional parameters for the SOQL query (see fetch_data)
             
-            # Build SOQL query
-            fields_str = ', '.join(fields)
-            query = f"SELECT {fields_str} FROM {object_name}"
+        Yields:
+            Dictionaries of record fields, without Salesforce's `attributes`
+        """
+        query = self._build_query(query_or_object_name, query_params)
+        self.logger.debug(f"SOQL Query: {query}")
+        
+        url = f"{self.instance_url}/services/data/v{self.api_version}/query"
+        params = {'q': query}
+        while url:
+            response = self._request('GET', url, params=params, stream=True)
+            response.raise_for_status()
+            response.raw.decode_content = True
             
-            if where_clause:
-                query += f" WHERE {where_clause}"
-                
-            if order_by:
-                query += f" ORDER BY {order_by}"
-                
-            if limit_clause:
-                query += f" {limit_clause}"
+            url = None
+            try:
+                for key, value in ijson.kvitems(response.raw, '', use_float=True):
+                    if key == 'records':
+                        for record in value:
+                            # Remove Salesforce metadata attributes
+                            record.pop('attributes', None)
+                            yield record
+                    elif key == 'nextRecordsUrl' and value:
+                        # Handle pagination for large result sets
+                        self.logger.debug(f"Fetching next batch from: {value}")
+                        url = f"{self.instance_url}{value}"
+                        params = None
+            finally:
+                response.close()
+    
+    def _build_query(self, query_or_object_name: str, query_params: Optional[Dict[str, Any]] = None) -> str:
+        """Return the SOQL query for fetch_data's arguments."""
+        # Check if a full query is provided or if we need to build one.
+        if _SOQL_RE.match(query_or_object_name):
+            return query_or_object_name
+        
+        # Build the query from object_name and query_params
+        query_params = query_params or {}
+        return self._build_soql(
+            query_or_object_name,
+            tuple(query_params.get('fields', _DEFAULT_FIELDS)),
+            query_params.get('where', ''),
+            query_params.get('order_by', ''),
+            query_params.get('limit') if 'limit' in query_params else None
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_soql(object_name: str,
+                    fields: Tuple[str, ...],
+                    where_clause: str,
+                    order_by: str,
+                    limit: Optional[int]) -> str:
+        """Build a SOQL query; cached since extractions repeat the same queries."""
+        parts = ['SELECT', ', '.join(fields), 'FROM', object_name]
+        if where_clause:
+            parts += ('WHERE', where_clause)
+        if order_by:
+            parts += ('ORDER BY', order_by)
+        if limit is not None:
+            parts += ('LIMIT', str(limit))
+        return ' '.join(parts)
+    
+    def fetch_data_bulk(self, query: str, max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Run a SOQL query as a Bulk API 2.0 query job.
+        
+        The REST query endpoint hands out one 2000-record batch at a time,
+        each waiting on the previous one's nextRecordsUrl. A bulk job is
+        processed server-side, and where the org supports parallel result
+        pages (API v62.0+) they are downloaded concurrently; otherwise they
+        are followed one locator at a time. Values come back from the CSV
+        results as strings, with empty strings for nulls.
+        
+        Args:
+            query: SOQL query to run
+            max_workers: Maximum number of result pages downloaded at once
             
-        self.logger.debug(f"SOQL Query: {query}")
+        Returns:
+            List of dictionaries containing the fetched data
+        """
+        if not self.validate_connection():
+            self.logger.error("Connection validation failed, cannot fetch data")
+            return []
         
+        jobs_url = f"{self.instance_url}/services/data/v{self.api_version}/jobs/query"
         try:
-            # Execute query
-            self.handle_rate_limits()
-            url = f"{self.instance_url}/services/data/v{self.api_version}/query"
-            response = self.session.get(url, params={'q': query})
+            body = orjson.dumps({'operation': 'query', 'query': query})
+            response = self._request('POST', jobs_url, session=self._no_retry_session, data=body, headers=_JSON_HEADERS)
+            response.raise_for_status()
+            job_id = orjson.loads(response.content)['id']
+            self.logger.debug("Created Bulk API query job %s", job_id)
             
-            if response.status_code == 200:
-                data = response.json()
-                records = data.get('records', [])
-                
-                # Handle pagination for large result sets
-                next_url = data.get('nextRecordsUrl')
-                while next_url:
-                    self.handle_rate_limits()
-                    self.logger.debug(f"Fetching next batch from: {next_url}")
-                    next_url_full = f"{self.instance_url}{next_url}"
-                    response = self.session.get(next_url_full)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        records.extend(data.get('records', []))
-                        next_url = data.get('nextRecordsUrl')
-                    else:
-                        self.logger.error(f"Error fetching next batch: {response.status_code} - {response.text}")
-                        break
-                
-                # Remove Salesforce metadata attributes
-                for record in records:
-                    if 'attributes' in record:
-                        del record['attributes']
-                
-                self.logger.info(f"Successfully fetched {len(records)} records.")
-                return records
+            # Wait for the job to finish
+            job_url = f"{jobs_url}/{job_id}"
+            deadline = time.monotonic() + self.BULK_MAX_WAIT
+            while True:
+                response = self._request('GET', job_url)
+                response.raise_for_status()
+                job = orjson.loads(response.content)
+                state = job.get('state')
+                if state == 'JobComplete':
+                    break
+                if state in self.BULK_FAILED_STATES:
+                    self.logger.error(f"Bulk query job {job_id} ended in state {state}: {job.get('errorMessage')}")
+                    return []
+                if time.monotonic() >= deadline:
+                    self.logger.error(f"Bulk query job {job_id} did not finish within {self.BULK_MAX_WAIT} seconds, aborting it")
+                    self._abort_bulk_job(job_url)
+                    return []
+                time.sleep(self.BULK_POLL_INTERVAL)
+            
+            result_links = self._bulk_result_links(job_url)
+            if result_links is None:
+                records = self._bulk_results_sequential(job_url)
             else:
-                self.logger.error(f"Error fetching data: {response.status_code} - {response.text}")
-                return []
-                
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(result_links)))) as executor:
+                    records = []
+                    for page_records in executor.map(self._bulk_result_page, result_links):
+                        records.extend(page_records)
+            
+            self.logger.info(f"Successfully fetched {len(records)} records.")
+            return records
+            
         except Exception as e:
-            self.logger.error(f"Error fetching data: {str(e)}")
+            self.logger.error(f"Error fetching bulk data: {str(e)}")
             return []
     
+    def _abort_bulk_job(self, job_url: str):
+        """Abort a query job so it stops using the org's bulk processing time."""
+        try:
+            body = orjson.dumps({'state': 'Aborted'})
+            response = self._request('PATCH', job_url, data=body, headers=_JSON_HEADERS)
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.error(f"Error aborting bulk query job: {str(e)}")
+    
+    def _bulk_result_links(self, job_url: str) -> Optional[List[str]]:
+        """List the result page URLs of a completed query job.
+        
+        Returns:
+            Absolute result page URLs, or None if this API version does not
+            offer parallel result pages
+        """
+        links = []
+        next_url = f"{job_url}/resultPages"
+        while next_url:
+            response = self._request('GET', next_url)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            links.extend(f"{self.instance_url}{page['resultLink']}" for page in data.get('resultPages', []))
+            next_url = data.get('nextRecordsUrl')
+            if next_url:
+                next_url = f"{self.instance_url}{next_url}"
+        return links
+    
+    def _bulk_result_page(self, url: str) -> List[Dict[str, Any]]:
+        """Download one CSV result page of a query job."""
+        response = self._request('GET', url, headers={'Accept': 'text/csv'})
+        response.raise_for_status()
+        return self._parse_bulk_csv(response)
+    
+    def _bulk_results_sequential(self, job_url: str) -> List[Dict[str, Any]]:
+        """Download all results of a query job by following Sforce-Locator."""
+        records = []
+        params = {}
+        while True:
+            response = self._request('GET', f"{job_url}/results", params=params, headers={'Accept': 'text/csv'})
+            response.raise_for_status()
+            records.extend(self._parse_bulk_csv(response))
+            locator = response.headers.get('Sforce-Locator')
+            if not locator or locator == 'null':
+                return records
+            params = {'locator': locator}
+    
+    @staticmethod
+    def _parse_bulk_csv(response: requests.Response) -> List[Dict[str, Any]]:
+        """Parse a Bulk API CSV result page into records."""
+        return list(csv.DictReader(io.StringIO(response.content.decode('utf-8'))))
+    
     def fetch_schema(self, object_name: str) -> Dict[str, Any]:
         """Fetch the schema of a Salesforce object.
         
@@ -328,36 +783,27 @@ class SalesforceConnector(BaseAPIConnector):
         if not self.validate_connection():
             self.logger.error("Connection validation failed, cannot fetch schema")
             return {}
-            
+        return self._single_flight(('schema', object_name), self._describe, object_name)
+    
+    def _describe(self, object_name: str) -> Dict[str, Any]:
+        """Describe one object without validating the connection first.
+        
+        Returns:
+            Dictionary in the fetch_schema format, empty on failure
+        """
         try:
             # Get object description
-            self.handle_rate_limits()
+            self.logger.debug("Fetching schema for %s", object_name)
             url = f"{self.instance_url}/services/data/v{self.api_version}/sobjects/{object_name}/describe"
-            response = self.session.get(url)
+            cache_key, cached, headers = self._describe_validators(object_name)
+            response = self._request('GET', url, headers=headers)
             
-            if response.status_code == 200:
-                schema = response.json()
-                
-                # Extract relevant schema information
-                fields = schema.get('fields', [])
-                field_info = {}
-                
-                for field in fields:
-                    field_info[field['name']] = {
-                        'type': field['type'],
-                        'label': field['label'],
-                        'length': field.get('length'),
-                        'nillable': field.get('nillable', True),
-                        'createable': field.get('createable', False),
-                        'updateable': field.get('updateable', False),
-                    }
-                
-                return {
-                    'name': schema.get('name'),
-                    'label': schema.get('label'),
-                    'fields': field_info,
-                    'timestamp': datetime.now().isoformat()
-                }
+            if response.status_code == 304 and cached:
+                return {**cached, 'timestamp': datetime.now().isoformat()}
+            elif response.status_code == 200:
+                schema = self._schema_from_describe(orjson.loads(response.content))
+                self._cache_describe(cache_key, response.headers, schema)
+                return schema
             else:
                 self.logger.error(f"Error fetching schema: {response.status_code} - {response.text}")
                 return {}
@@ -366,6 +812,103 @@ class SalesforceConnector(BaseAPIConnector):
             self.logger.error(f"Error fetching schema: {str(e)}")
             return {}
 
+    def _describe_validators(self, object_name: str) -> Tuple[tuple, Optional[Dict[str, Any]], Dict[str, str]]:
+        """Look up a cached describe and build the conditional request headers for it.
+        
+        Returns:
+            (cache key, cached schema or None, conditional headers)
+        """
+        cache_key = (self.instance_url, self.api_version, object_name)
+        with _DESCRIBE_CACHE_LOCK:
+            entry = _DESCRIBE_CACHE.get(cache_key)
+        if entry is None:
+            return cache_key, None, {}
+        etag, last_modified, schema = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return cache_key, schema, headers
+    
+    @staticmethod
+    def _cache_describe(cache_key: tuple, headers: Dict[str, str], schema: Dict[str, Any]):
+        """Store a describe result if the response carried a validator."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            with _DESCRIBE_CACHE_LOCK:
+                _DESCRIBE_CACHE[cache_key] = (etag, last_modified, schema)
+    
+    @staticmethod
+    def _schema_from_describe(schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a describe response body into the fetch_schema format."""
+        # Extract relevant schema information
+        field_info = {}
+        for field in schema.get('fields', []):
+            field_info[field['name']] = {
+                'type': field['type'],
+                'label': field['label'],
+                'length': field.get('length'),
+                'nillable': field.get('nillable', True),
+                'createable': field.get('createable', False),
+                'updateable': field.get('updateable', False),
+            }
+        
+        return {
+            'name': schema.get('name'),
+            'label': schema.get('label'),
+            'fields': field_info,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def _composite_describe(self, object_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Describe up to COMPOSITE_BATCH_SIZE objects with one Composite API call.
+        
+        Args:
+            object_names: Names of the objects to describe
+            
+        Returns:
+            Dictionary mapping each successfully described object to its
+            schema in the fetch_schema format
+        """
+        describe_path = f"/services/data/v{self.api_version}/sobjects/{{}}/describe"
+        subrequests = []
+        cached_entries = {}
+        for name in object_names:
+            cache_key, cached, headers = self._describe_validators(name)
+            cached_entries[name] = (cache_key, cached)
+            subrequest = {'method': 'GET', 'url': describe_path.format(name), 'referenceId': name}
+            if headers:
+                subrequest['httpHeaders'] = headers
+            subrequests.append(subrequest)
+        payload = {'allOrNone': False, 'compositeRequest': subrequests}
+        
+        url = f"{self.instance_url}/services/data/v{self.api_version}/composite"
+        try:
+            response = self._request('POST', url, data=orjson.dumps(payload), headers=_JSON_HEADERS)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error describing objects: {str(e)}")
+            return {}
+        if response.status_code != 200:
+            self.logger.error(f"Error describing objects: {response.status_code} - {response.text}")
+            return {}
+        
+        schemas = {}
+        timestamp = datetime.now().isoformat()
+        for sub_response in orjson.loads(response.content).get('compositeResponse', []):
+            name = sub_response['referenceId']
+            cache_key, cached = cached_entries[name]
+            status = sub_response.get('httpStatusCode')
+            if status == 304 and cached:
+                schemas[name] = {**cached, 'timestamp': timestamp}
+            elif status == 200:
+                schemas[name] = self._schema_from_describe(sub_response['body'])
+                self._cache_describe(cache_key, sub_response.get('httpHeaders') or {}, schemas[name])
+            else:
+                self.logger.warning(f"Error describing {sub_response.get('referenceId')}: {sub_response.get('body')}")
+        return schemas
+    
     def list_objects(self) -> Dict[str, Any]:
         """Fetch a list of all available SObjects and their schemas from Salesforce.
 
@@ -379,26 +922,42 @@ class SalesforceConnector(BaseAPIConnector):
 
         try:
             # 1. Get the list of all SObjects
-            self.handle_rate_limits()
             list_url = f"{self.instance_url}/services/data/v{self.api_version}/sobjects"
-            response = self.session.get(list_url)
+            response = self._request('GET', list_url)
             response.raise_for_status()
-            all_objects_data = response.json()
+            all_objects_data = orjson.loads(response.content)
 
             sobjects = all_objects_data.get('sobjects', [])
             # We only want queryable objects that are not custom settings or events.
-            object_names = [
-                obj['name'] for obj in sobjects 
-                if obj.get('queryable') and not obj.get('customSetting') and not obj['name'].endswith(('__e', '__c'))
-            ]
+            # The global describe can't be narrowed to these fields server-side,
+            # so the filter reads each name once and checks it first, as it
+            # rules out the most objects in orgs with many custom objects.
+            object_names = []
+            for obj in sobjects:
+                name = obj['name']
+                if not name.endswith(_EXCLUDED_SUFFIXES) and obj.get('queryable') and not obj.get('customSetting'):
+                    object_names.append(name)
 
             self.logger.info(f"Found {len(object_names)} queryable SObjects to describe.")
 
-            full_schema = {}
             # Limit to a reasonable number for performance, e.g., the first 100.
-            for object_name in object_names[:100]:
-                self.logger.debug(f"Fetching schema for {object_name}")
-                object_schema = self.fetch_schema(object_name)
+            object_names = object_names[:100]
+            
+            # Describes are sent through the Composite API in batches, and the
+            # batches run concurrently on the session's pooled connections.
+            batches = [
+                object_names[i:i + self.COMPOSITE_BATCH_SIZE]
+                for i in range(0, len(object_names), self.COMPOSITE_BATCH_SIZE)
+            ]
+            object_schemas = {}
+            if batches:
+                with ThreadPoolExecutor(max_workers=min(self.DESCRIBE_WORKERS, len(batches))) as executor:
+                    for batch_schemas in executor.map(self._composite_describe, batches):
+                        object_schemas.update(batch_schemas)
+            
+            full_schema = {}
+            for object_name in object_names:
+                object_schema = object_schemas.get(object_name)
                 if object_schema and 'fields' in object_schema:
                     fields_list = []
                     for field_name, field_details in object_schema['fields'].items():
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""
+Tests for building Arrow tables from Google Ads stream batches.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import pyarrow as pa
+
+from extractors.connectors.google_ads_connector import GoogleAdsConnector
+
+
+class TestFetchDataArrow(unittest.TestCase):
+    """Test cases for GoogleAdsConnector.fetch_data_arrow."""
+
+    def setUp(self):
+        """Set up a connector whose stream yields two pre-built batches."""
+        self.connector = GoogleAdsConnector(credentials={'customer_id': '1234567890'})
+        self.batches = [
+            pa.RecordBatch.from_pydict({'campaign.id': pa.array([1], pa.int64()),
+                                        'campaign.labels': pa.array([[]])}),
+            pa.RecordBatch.from_pydict({'campaign.id': pa.array([2], pa.int64()),
+                                        'campaign.labels': pa.array([['brand']])}),
+        ]
+        for name, value in (('validate_connection', True),
+                            ('_build_query', 'SELECT campaign.id, campaign.labels FROM campaign'),
+                            ('_iter_batches', [['row'], ['row']])):
+            patcher = patch.object(self.connector, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_batches_with_differently_inferred_types_are_promoted(self):
+        """Test that a list<null> batch followed by a list<string> batch builds one table."""
+        batches = iter(self.batches)
+        with patch('extractors.connectors.google_ads_connector._batch_to_arrow',
+                   side_effect=lambda pa, rows, field_paths: next(batches)):
+            table = self.connector.fetch_data_arrow('campaigns')
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field('campaign.labels').type, pa.list_(pa.string()))
+        self.assertEqual(table['campaign.labels'].to_pylist(), [[], ['brand']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+"""
+Tests for GAQL query building and date range sharding in the Google Ads connector.
+"""
+
+import unittest
+
+from extractors.connectors.google_ads_connector import GAQLBuilder, _split_date_range
+
+
+class TestGAQLBuilder(unittest.TestCase):
+    """Test cases for GAQLBuilder."""
+
+    def test_builds_query(self):
+        """Test that validated parts are joined into a GAQL query."""
+        query = (GAQLBuilder().select(['campaign.id', 'metrics.clicks']).from_('campaign')
+                 .where("campaign.status != 'REMOVED'")
+                 .between('segments.date', '2024-01-01', '2024-01-31').build())
+        self.assertEqual(
+            query,
+            "SELECT campaign.id, metrics.clicks FROM campaign "
+            "WHERE campaign.status != 'REMOVED' AND segments.date BETWEEN '2024-01-01' AND '2024-01-31'"
+        )
+
+    def test_accepts_keywords_and_constants(self):
+        """Test that conditions may use GAQL keywords, enum values and date constants."""
+        builder = GAQLBuilder().select(['campaign.id']).from_('campaign')
+        builder.where("campaign.status IN (ENABLED, PAUSED)")
+        builder.where("segments.date DURING LAST_30_DAYS")
+        builder.where("metrics.impressions > 100")
+        self.assertIn("segments.date DURING LAST_30_DAYS", builder.build())
+
+    def test_accepts_attributed_resource_fields(self):
+        """Test that any field shaped like resource.field can be selected."""
+        query = GAQLBuilder().select(['campaign.id', 'bidding_strategy.name']).from_('campaign').build()
+        self.assertEqual(query, "SELECT campaign.id, bidding_strategy.name FROM campaign")
+
+    def test_rejects_malformed_fields(self):
+        """Test that SELECT fields must look like resource.field."""
+        for field in ('campaign', 'Campaign.Id', 'campaign.id FROM x', 'campaign.id,metrics.clicks'):
+            with self.subTest(field=field):
+                with self.assertRaises(ValueError):
+                    GAQLBuilder().select([field])
+
+    def test_rejects_unknown_resource(self):
+        """Test that FROM only accepts allowed resources."""
+        with self.assertRaises(ValueError):
+            GAQLBuilder().from_('change_event')
+
+    def test_rejects_injected_conditions(self):
+        """Test that conditions with free-form words or stray characters are rejected."""
+        for condition in ("campaign.id = 1 or 1 = 1",
+                          "campaign.id = 1 OR campaign.id = 2",
+                          "campaign.status = 'ENABLED' OR campaign.id = 2",
+                          "campaign.id = 1 ORDER BY metrics.clicks DESC LIMIT 1",
+                          "campaign.id = 1 LIMIT 1",
+                          "campaign.id = 1 PARAMETERS include_drafts=true",
+                          "campaign.status = ENABLED ORDER BY campaign.id",
+                          "campaign.status IN (ENABLED, PAUSED) LIMIT 5",
+                          "campaign.status IN (ENABLED",
+                          "(campaign.id = 1)",
+                          "campaign.id = 1; DROP",
+                          "campaign.id = 1 -- comment"):
+            with self.subTest(condition=condition):
+                with self.assertRaises(ValueError):
+                    GAQLBuilder().where(condition)
+
+    def test_rejects_invalid_dates(self):
+        """Test that BETWEEN only accepts YYYY-MM-DD dates."""
+        with self.assertRaises(ValueError):
+            GAQLBuilder().between('segments.date', "2024-01-01' OR '1", '2024-01-31')
+        with self.assertRaises(ValueError):
+            GAQLBuilder().between('segments.date', '2024-01-01', None)
+
+    def test_build_requires_select_and_from(self):
+        """Test that a query without fields or a resource cannot be built."""
+        with self.assertRaises(ValueError):
+            GAQLBuilder().from_('campaign').build()
+        with self.assertRaises(ValueError):
+            GAQLBuilder().select(['campaign.id']).build()
+
+
+class TestSplitDateRange(unittest.TestCase):
+    """Test cases for _split_date_range."""
+
+    def test_short_range_is_not_split(self):
+        """Test that a range within one shard comes back unchanged."""
+        self.assertEqual(_split_date_range('2024-01-01', '2024-01-30', shard_days=30),
+                         [('2024-01-01', '2024-01-30')])
+
+    def test_long_range_is_split_into_consecutive_shards(self):
+        """Test that shards cover the range without gaps or overlaps."""
+        self.assertEqual(_split_date_range('2024-01-01', '2024-03-15', shard_days=30), [
+            ('2024-01-01', '2024-01-30'),
+            ('2024-01-31', '2024-02-29'),
+            ('2024-03-01', '2024-03-15'),
+        ])
+
+    def test_remainder_becomes_last_shard(self):
+        """Test a range one day longer than a whole number of shards."""
+        self.assertEqual(_split_date_range('2024-01-01', '2024-01-05', shard_days=2), [
+            ('2024-01-01', '2024-01-02'),
+            ('2024-01-03', '2024-01-04'),
+            ('2024-01-05', '2024-01-05'),
+        ])
+
+    def test_single_day(self):
+        """Test that a one-day range yields one shard."""
+        self.assertEqual(_split_date_range('2024-01-01', '2024-01-01'), [('2024-01-01', '2024-01-01')])
+
+    def test_unparseable_range_is_returned_unsplit(self):
+        """Test that invalid dates are passed through as a single shard."""
+        self.assertEqual(_split_date_range('LAST_30_DAYS', None), [('LAST_30_DAYS', None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+
+"""
+Tests for A1 range validation in the Google Sheets connector.
+"""
+
+import unittest
+
+from extractors.connectors.google_sheets_connector import _A1_RANGE
+
+
+class TestA1Range(unittest.TestCase):
+    """Test cases for _A1_RANGE."""
+
+    def _is_valid(self, notation):
+        # Validated like fetch_data does, without the sheet prefix
+        return _A1_RANGE.fullmatch(notation.rpartition('!')[2]) is not None
+
+    def test_accepts_relative_ranges(self):
+        """Test that plain cells, rows and columns are accepted."""
+        for notation in ('A1', 'A1:C10', 'A:C', '2:5', 'A2:C', 'Sheet1!AB12:ZZZ40'):
+            with self.subTest(notation=notation):
+                self.assertTrue(self._is_valid(notation))
+
+    def test_accepts_absolute_references(self):
+        """Test that $-anchored columns and rows are accepted as the Sheets API does."""
+        for notation in ('$A$1:$C$10', 'Sheet1!$A:$C', '$A1:C$10', 'A$2', '$2:$5', "'My Sheet'!$B$3"):
+            with self.subTest(notation=notation):
+                self.assertTrue(self._is_valid(notation))
+
+    def test_rejects_malformed_ranges(self):
+        """Test that anything that is not A1 notation is rejected."""
+        for notation in ('', 'A1:', 'A$', '$$A1', 'A1:B2:C3', 'ABCD1', 'A1 B2', 'A-1'):
+            with self.subTest(notation=notation):
+                self.assertFalse(self._is_valid(notation))
+
+
+if __name__ == '__main__':
+    unittest.main()
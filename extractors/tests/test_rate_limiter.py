@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""
+Tests for the token bucket rate limiter.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from extractors.base.rate_limiter import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def setUp(self):
+        """Set up a bucket on a controllable clock."""
+        self.now = 1000.0
+        patcher = patch('extractors.base.rate_limiter.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bucket = TokenBucket(capacity=3, refill_rate=2.0)
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket serves a burst without waiting."""
+        for _ in range(3):
+            self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertAlmostEqual(self.bucket.reserve(), 0.5)
+
+    def test_waiting_callers_are_spaced_out(self):
+        """Test that callers on an empty bucket queue up behind each other."""
+        for _ in range(3):
+            self.bucket.reserve()
+        self.assertAlmostEqual(self.bucket.reserve(), 0.5)
+        self.assertAlmostEqual(self.bucket.reserve(), 1.0)
+
+    def test_refill_is_capped(self):
+        """Test that an idle bucket refills at the configured rate up to capacity."""
+        for _ in range(3):
+            self.bucket.reserve()
+        self.now += 1.0
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertGreater(self.bucket.reserve(), 0.0)
+
+        self.now += 3600.0
+        for _ in range(3):
+            self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertGreater(self.bucket.reserve(), 0.0)
+
+    def test_set_rate_applies_to_later_refills(self):
+        """Test that a rate change credits elapsed time at the old rate."""
+        for _ in range(3):
+            self.bucket.reserve()
+        self.now += 0.5
+        self.bucket.set_rate(0.5)
+        self.assertEqual(self.bucket.reserve(), 0.0)
+        self.assertAlmostEqual(self.bucket.reserve(), 2.0)
+
+        with self.assertRaises(ValueError):
+            self.bucket.set_rate(0)
+
+    def test_consume_sleeps_for_reserved_wait(self):
+        """Test that consume blocks only when the bucket is empty."""
+        with patch('extractors.base.rate_limiter.time.sleep') as mock_sleep:
+            for _ in range(3):
+                self.bucket.consume()
+            mock_sleep.assert_not_called()
+            self.bucket.consume()
+            mock_sleep.assert_called_once()
+            self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
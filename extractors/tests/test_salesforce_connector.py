@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+"""
+Tests for SalesforceConnector query building, rate adjustment and pagination.
+"""
+
+import io
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from extractors.connectors.salesforce_connector import SalesforceConnector, _SOQL_RE
+
+
+INSTANCE_URL = "https://example.my.salesforce.com"
+
+
+def _mock_response(body, headers=None):
+    """Build a streamed response whose raw body is the given JSON document."""
+    response = MagicMock()
+    response.raw = io.BytesIO(json.dumps(body).encode())
+    response.headers = headers or {}
+    return response
+
+
+class TestSalesforceConnector(unittest.TestCase):
+    """Test cases for SalesforceConnector."""
+
+    def setUp(self):
+        """Set up a connector with token credentials."""
+        self.connector = SalesforceConnector(
+            credentials={"access_token": "test_access_token", "instance_url": INSTANCE_URL},
+            rate_limit_config={"requests_per_second": 10, "burst": 10}
+        )
+
+    def test_soql_re_detects_queries(self):
+        """Test that full SOQL queries are told apart from object names."""
+        self.assertTrue(_SOQL_RE.match("SELECT Id FROM Account"))
+        self.assertTrue(_SOQL_RE.match("  select Id,\n Name\nfrom Contact"))
+        self.assertFalse(_SOQL_RE.match("Account"))
+        self.assertFalse(_SOQL_RE.match("Selection__c"))
+
+    def test_build_query_passes_soql_through(self):
+        """Test that a full query is used as given."""
+        query = "SELECT Id FROM Account WHERE Name = 'Acme'"
+        self.assertEqual(self.connector._build_query(query, {"limit": 5}), query)
+
+    def test_build_query_from_object_name(self):
+        """Test that an object name is expanded with default fields and the query params."""
+        self.assertEqual(
+            self.connector._build_query("Account"),
+            "SELECT Id, Name, CreatedDate, LastModifiedDate FROM Account"
+        )
+        self.assertEqual(
+            self.connector._build_query("Contact", {
+                "fields": ["Id", "Email"],
+                "where": "LastModifiedDate >= 2023-01-01T00:00:00Z",
+                "order_by": "LastModifiedDate",
+                "limit": 0
+            }),
+            "SELECT Id, Email FROM Contact WHERE LastModifiedDate >= 2023-01-01T00:00:00Z "
+            "ORDER BY LastModifiedDate LIMIT 0"
+        )
+
+    def test_build_soql_is_cached(self):
+        """Test that repeated queries are served from the lru_cache."""
+        SalesforceConnector._build_soql.cache_clear()
+        for _ in range(3):
+            self.connector._build_query("Account", {"fields": ["Id"]})
+        info = SalesforceConnector._build_soql.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_rate_unchanged_with_ample_quota(self):
+        """Test that the configured rate is kept while most of the quota is left."""
+        response = _mock_response({}, {"Sforce-Limit-Info": "api-usage=45123/500000"})
+        self.connector._update_rate_from_headers(response)
+        self.assertEqual(self.connector._bucket.refill_rate, 10)
+
+    def test_rate_scales_down_with_low_quota(self):
+        """Test that the rate shrinks in proportion to the quota left."""
+        response = _mock_response({}, {"Sforce-Limit-Info": "per-app-api-usage=10/100, api-usage=475000/500000"})
+        self.connector._update_rate_from_headers(response)
+        self.assertAlmostEqual(self.connector._bucket.refill_rate, 5.0)
+
+    def test_rate_has_a_floor(self):
+        """Test that an exhausted quota slows requests down without stopping them."""
+        response = _mock_response({}, {"Sforce-Limit-Info": "api-usage=500000/500000"})
+        self.connector._update_rate_from_headers(response)
+        self.assertAlmostEqual(self.connector._bucket.refill_rate, 0.5)
+
+    def test_rate_ignores_missing_or_malformed_header(self):
+        """Test that responses without usable limit info leave the rate alone."""
+        for headers in ({}, {"Sforce-Limit-Info": "api-usage=unknown"}):
+            with self.subTest(headers=headers):
+                self.connector._update_rate_from_headers(_mock_response({}, headers))
+                self.assertEqual(self.connector._bucket.refill_rate, 10)
+
+    def test_iter_data_follows_pages_and_strips_attributes(self):
+        """Test that iter_data walks nextRecordsUrl and yields clean records."""
+        next_url = "/services/data/v57.0/query/01gD0000002HU6KIAW-2000"
+        pages = [
+            _mock_response({
+                "totalSize": 3,
+                "done": False,
+                "nextRecordsUrl": next_url,
+                "records": [
+                    {"attributes": {"type": "Account", "url": "/a/001A"}, "Id": "001A", "AnnualRevenue": 1.5},
+                    {"attributes": {"type": "Account", "url": "/a/001B"}, "Id": "001B", "AnnualRevenue": None},
+                ]
+            }),
+            _mock_response({
+                "totalSize": 3,
+                "done": True,
+                "records": [
+                    {"attributes": {"type": "Account", "url": "/a/001C"}, "Id": "001C", "AnnualRevenue": 2},
+                ]
+            }),
+        ]
+        self.connector._request = MagicMock(side_effect=pages)
+
+        records = list(self.connector.iter_data("SELECT Id, AnnualRevenue FROM Account"))
+
+        self.assertEqual(records, [
+            {"Id": "001A", "AnnualRevenue": 1.5},
+            {"Id": "001B", "AnnualRevenue": None},
+            {"Id": "001C", "AnnualRevenue": 2},
+        ])
+        self.assertIsInstance(records[0]["AnnualRevenue"], float)
+        first, second = self.connector._request.call_args_list
+        self.assertEqual(first.args, ("GET", f"{INSTANCE_URL}/services/data/v57.0/query"))
+        self.assertEqual(first.kwargs["params"], {"q": "SELECT Id, AnnualRevenue FROM Account"})
+        self.assertEqual(second.args, ("GET", f"{INSTANCE_URL}{next_url}"))
+        self.assertIsNone(second.kwargs["params"])
+        for page in pages:
+            page.close.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+"""
+Tests for the unified server's schema endpoint and edge function WebSocket.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import unittest
+import zlib
+from unittest.mock import patch
+
+import orjson
+
+# httpx backs FastAPI's TestClient and is only in requirements-dev.txt
+try:
+    import httpx
+    from fastapi.testclient import TestClient
+except ImportError:
+    httpx = None
+
+# Read by app at import time, and by the execution workers it starts
+os.environ.setdefault('EXEC_TIMEOUT_SECONDS', '1')
+
+import app  # noqa: E402
+
+
+class FakeConnector:
+    """Connector stand-in that counts list_objects calls."""
+
+    calls = 0
+    closed = 0
+    delay = 0.0
+    lock = threading.Lock()
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+
+    def list_objects(self):
+        with FakeConnector.lock:
+            FakeConnector.calls += 1
+        time.sleep(FakeConnector.delay)
+        return {'fake': {'Account': [{'columnName': 'Id', 'dataType': 'id'}]}}
+
+    def close(self):
+        with FakeConnector.lock:
+            FakeConnector.closed += 1
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestGetSchema(unittest.IsolatedAsyncioTestCase):
+    """Test cases for /api/connectors/get-schema."""
+
+    def setUp(self):
+        """Start each test with an empty schema cache and a fresh fake connector."""
+        app.SCHEMA_CACHE.clear()
+        FakeConnector.calls = 0
+        FakeConnector.closed = 0
+        FakeConnector.delay = 0.0
+        patcher = patch('app.get_connector', return_value=FakeConnector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.body = {'dbtype': 'fake', 'dbConfig': {'access_token': 'token'}}
+
+    def test_second_request_is_a_cache_hit(self):
+        """Test that a cached schema is served without building a connector."""
+        client = TestClient(app.app)
+        first = client.post('/api/connectors/get-schema', json=self.body)
+        second = client.post('/api/connectors/get-schema', json=self.body)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(FakeConnector.calls, 1)
+        self.assertEqual(FakeConnector.closed, 1)
+
+    def test_different_configs_are_cached_separately(self):
+        """Test that the cache key includes the connection config."""
+        client = TestClient(app.app)
+        client.post('/api/connectors/get-schema', json=self.body)
+        client.post('/api/connectors/get-schema', json={**self.body, 'dbConfig': {'access_token': 'other'}})
+        self.assertEqual(FakeConnector.calls, 2)
+
+    async def test_concurrent_misses_share_one_call(self):
+        """Test that simultaneous requests for the same schema make one upstream call."""
+        FakeConnector.delay = 0.2
+        transport = httpx.ASGITransport(app=app.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            responses = await asyncio.gather(
+                *(client.post('/api/connectors/get-schema', json=self.body) for _ in range(3))
+            )
+
+        self.assertEqual([response.status_code for response in responses], [200, 200, 200])
+        self.assertEqual(FakeConnector.calls, 1)
+        self.assertFalse(app._SCHEMA_INFLIGHT)
+
+
+class TestRunPythonCode(unittest.IsolatedAsyncioTestCase):
+    """Test cases for run_python_code outside the server lifespan."""
+
+    async def test_starts_pool_when_missing(self):
+        """Test that code never runs on the default thread executor."""
+        with patch('app.EXEC_POOL', None):
+            outputs = await app.run_python_code("print('pooled')", 'block-1')
+            pool = app.EXEC_POOL
+            self.addCleanup(pool.shutdown)
+        self.assertIsNotNone(pool)
+        self.assertEqual(outputs[0]['content'], {'text': 'pooled\n'})
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestEdgeFunctionWebSocket(unittest.TestCase):
+    """Test cases for the /ws execution protocol."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the server, and with it the execution pool, once for all tests."""
+        cls.client = TestClient(app.app)
+        cls.client.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+
+    def _execute(self, code, block_id='block-1'):
+        ws_context = self.client.websocket_connect('/ws/report-1')
+        ws = ws_context.__enter__()
+        self.addCleanup(ws_context.__exit__, None, None, None)
+        ws.send_text(orjson.dumps({'type': 'execute_request', 'code': code, 'blockId': block_id}).decode())
+        return ws
+
+    def test_small_output_is_sent_as_text(self):
+        """Test that a small output frame is plain JSON text."""
+        ws = self._execute("print('hello')")
+        frame = orjson.loads(ws.receive_text())
+        self.assertEqual(frame['type'], 'execute_response')
+        self.assertEqual(frame['output_type'], 'stream')
+        self.assertEqual(frame['content'], {'text': 'hello\n'})
+        self.assertEqual(frame['blockId'], 'block-1')
+
+    def test_large_output_is_deflated(self):
+        """Test that a frame above WS_COMPRESS_THRESHOLD arrives as marker byte plus raw DEFLATE."""
+        ws = self._execute("print('x' * 10000)")
+        message = ws.receive_bytes()
+        self.assertEqual(message[:1], app._DEFLATE_FRAME_MARKER)
+        frame = orjson.loads(zlib.decompress(message[1:], -15))
+        self.assertEqual(frame['content'], {'text': 'x' * 10000 + '\n'})
+        self.assertGreater(len(orjson.dumps(frame)), app.WS_COMPRESS_THRESHOLD)
+
+    def test_outputs_of_one_execution_are_batched(self):
+        """Test that outputs queued together are sent as one batch frame."""
+        ws = self._execute("import sys\nprint('out')\nprint('err', file=sys.stderr)")
+        frame = orjson.loads(ws.receive_text())
+        self.assertEqual(frame['type'], 'batch')
+        self.assertEqual([result['output_type'] for result in frame['results']], ['stream', 'error'])
+        self.assertEqual(frame['results'][0]['content'], {'text': 'out\n'})
+        self.assertEqual(frame['results'][1]['content']['evalue'], 'err\n')
+
+    def test_runaway_code_times_out(self):
+        """Test that code running past EXEC_TIMEOUT_SECONDS is stopped and reported."""
+        started = time.monotonic()
+        ws = self._execute("while True:\n    pass")
+        frame = orjson.loads(ws.receive_text())
+        self.assertEqual(frame['output_type'], 'error')
+        self.assertEqual(frame['content']['ename'], 'ExecutionTimeout')
+        self.assertLess(time.monotonic() - started, app.EXEC_TIMEOUT_SECONDS + 10)
+
+        # The worker is still usable afterwards
+        ws.send_text(orjson.dumps({'type': 'execute_request', 'code': "print(1)", 'blockId': 'block-2'}).decode())
+        self.assertEqual(orjson.loads(ws.receive_text())['content'], {'text': '1\n'})
+
+
+if __name__ == '__main__':
+    unittest.main()